@@ -8,31 +8,15 @@ import os
 import sys
 import asyncio
 from datetime import datetime
-from crewai import Crew, Process
-from agents.analyst_agent import agent_analyst
-from agents.trader_agent import agent_trader
-from agents.scanner_agent import agent_scanner
-from agents.discovery_agent import agent_discovery
-from tasks.analyse_task import stock_analysis
-from tasks.trade_task import trade_execution
-from tasks.scan_task import market_scan
-from tasks.discovery_task import stock_discovery
 from config import DEFAULT_WATCHLIST
+from registry import agents, tasks, new_crew
+from tools.run_snapshot import run_snapshot
 
 class AgentZero:
     def __init__(self):
-        self.agents = {
-            'analyst': agent_analyst,
-            'trader': agent_trader,
-            'scanner': agent_scanner,
-            'discovery': agent_discovery
-        }
-        self.tasks = {
-            'analyse': stock_analysis,
-            'trade': trade_execution,
-            'scan': market_scan,
-            'discovery': stock_discovery
-        }
+        # Agents and tasks are built the first time a message needs them, not at startup
+        self.agents = agents
+        self.tasks = tasks
         self.watchlist = DEFAULT_WATCHLIST
         self.session_start = datetime.now()
         
@@ -95,31 +79,30 @@ class AgentZero:
 
     async def handle_agent_command(self, agent_name, message):
         """Handle commands for specific agents"""
-        agent = self.agents[agent_name]
-        task = self.tasks.get(agent_name, stock_analysis)
+        from crewai import Process
+
+        task = self.tasks[agent_name] if agent_name in self.tasks else self.tasks['analyse']
         
         # Create crew with single agent
-        crew = Crew(
-            agents=[agent],
-            tasks=[task],
-            process=Process.sequential,
-            verbose=True
-        )
+        crew = new_crew([agent_name], [task], process=Process.sequential)
         
-        result = await crew.kickoff()
+        with run_snapshot():  # One fetch per symbol for the whole request
+            result = await crew.kickoff()
         return f"🤖 {agent_name.upper()} AGENT RESPONSE:\n{result}"
 
     async def handle_team_command(self, message):
         """Handle team collaboration commands"""
         # Create crew with all agents
-        crew = Crew(
-            agents=list(self.agents.values()),
-            tasks=[stock_analysis, trade_execution, market_scan],
-            process=Process.sequential,
-            verbose=True
+        from crewai import Process
+
+        crew = new_crew(
+            list(self.agents),
+            [self.tasks['analyse'], self.tasks['trade'], self.tasks['scan']],
+            process=Process.sequential
         )
         
-        result = await crew.kickoff()
+        with run_snapshot():  # The whole team shares one fetch per symbol
+            result = await crew.kickoff()
         return f"🌟 TEAM COLLABORATION RESPONSE:\n{result}"
 
     async def run(self):
@@ -0,0 +1,168 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from contextlib import closing
+from typing import Any, Dict, List, Optional
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    response TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_used REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_responses_last_used ON responses (last_used);
+CREATE INDEX IF NOT EXISTS idx_responses_created_at ON responses (created_at);
+"""
+
+# Parameters that change where a request goes but not what the model answers
+UNKEYED_PARAMS = frozenset({"api_key", "timeout"})
+
+
+class LLMResponseCache:
+    """
+    On-disk cache of LLM completions, shared by every process using the same path.
+
+    The key is a hash of the model, its sampling parameters, the stop words,
+    the tool schemas and the full message list, which carries every tool
+    result the agent has seen, so a response is only reused for a request
+    that is identical down to the market data in it. Entries expire max_age
+    seconds after they were stored; past max_entries or max_bytes the least
+    recently used are dropped. Hits and misses are counted per agent.
+    """
+
+    def __init__(self, path: str, max_age: float = 900.0, max_entries: int = 5000,
+                 max_bytes: int = 100 * 1024 * 1024):
+        self.path = path
+        self.max_age = max_age
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = defaultdict(lambda: {"hits": 0, "misses": 0})
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    @staticmethod
+    def key(model: str, params: Dict[str, Any], stop: Optional[List[str]], messages: Any,
+            tools: Optional[List[dict]] = None) -> str:
+        request = {
+            "model": model,
+            "params": {name: value for name, value in params.items() if name not in UNKEYED_PARAMS},
+            "stop": sorted(stop or []),
+            "messages": messages,
+            "tools": tools,
+        }
+        encoded = json.dumps(request, sort_keys=True, default=str, separators=(",", ":"))
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def get(self, key: str, agent: str = "") -> Optional[str]:
+        now = time.time()
+        with closing(self._connect()) as conn:
+            with conn:
+                row = conn.execute("SELECT response FROM responses WHERE key = ? AND created_at >= ?",
+                                   (key, now - self.max_age)).fetchone()
+                if row is not None:
+                    conn.execute("UPDATE responses SET last_used = ?, hits = hits + 1 WHERE key = ?", (now, key))
+
+        with self._lock:
+            self._stats[agent]["hits" if row is not None else "misses"] += 1
+        return row[0] if row is not None else None
+
+    def put(self, key: str, model: str, response: str) -> None:
+        now = time.time()
+        with self._lock, closing(self._connect()) as conn:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, model, response, size, created_at, last_used) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, model, response, len(response.encode("utf-8")), now, now),
+                )
+                self._evict(conn, now)
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        conn.execute("DELETE FROM responses WHERE created_at < ?", (now - self.max_age,))
+        # Keep the most recently used max_entries, then trim those to max_bytes
+        conn.execute(
+            "DELETE FROM responses WHERE key IN "
+            "(SELECT key FROM responses ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+        conn.execute(
+            "DELETE FROM responses WHERE key IN (SELECT key FROM "
+            "(SELECT key, SUM(size) OVER (ORDER BY last_used DESC, key) AS running FROM responses) "
+            "WHERE running > ?)",
+            (self.max_bytes,),
+        )
+
+    def clear(self) -> None:
+        with self._lock, closing(self._connect()) as conn:
+            with conn:
+                conn.execute("DELETE FROM responses")
+
+    def stats(self) -> Dict[str, Any]:
+        with closing(self._connect()) as conn:
+            entries, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        with self._lock:
+            agents = {agent: dict(counts) for agent, counts in self._stats.items()}
+        hits = sum(counts["hits"] for counts in agents.values())
+        misses = sum(counts["misses"] for counts in agents.values())
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+            "entries": entries,
+            "bytes": size,
+            "agents": agents,
+        }
+
+    def summary(self) -> str:
+        stats = self.stats()
+        line = (f"LLM cache: {stats['hits']} hits / {stats['misses']} misses "
+                f"({stats['hit_rate']:.0%} hit rate, {stats['entries']} responses, {stats['bytes'] / 1e6:.1f} MB)")
+        per_agent = [f"{agent or 'unnamed'} {counts['hits']}/{counts['hits'] + counts['misses']}"
+                     for agent, counts in sorted(stats["agents"].items())]
+        return line + (" - " + ", ".join(per_agent) if per_agent else "")
+
+
+def cached_agents() -> frozenset:
+    """Agents whose LLM calls go through the cache: LLM_CACHE_AGENTS, comma separated, or 'all'."""
+    return frozenset(name.strip().lower() for name in os.getenv('LLM_CACHE_AGENTS', '').split(",") if name.strip())
+
+
+def cache_enabled_for(agent: Optional[str]) -> bool:
+    agents = cached_agents()
+    return "all" in agents or (agent is not None and agent.lower() in agents)
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> LLMResponseCache:
+    """Process-wide response cache at LLM_CACHE_DB."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = LLMResponseCache(
+                os.getenv('LLM_CACHE_DB', os.path.join('data', 'llm_cache.sqlite')),
+                max_age=float(os.getenv('LLM_CACHE_MAX_AGE', '900')),
+                max_entries=int(os.getenv('LLM_CACHE_MAX_ENTRIES', '5000')),
+                max_bytes=int(float(os.getenv('LLM_CACHE_MAX_MB', '100')) * 1024 * 1024),
+            )
+        return _cache
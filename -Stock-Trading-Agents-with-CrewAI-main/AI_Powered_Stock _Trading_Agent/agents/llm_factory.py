@@ -0,0 +1,158 @@
+import os
+import threading
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from crewai import LLM
+from crewai.llms.base_llm import BaseLLM
+
+from agents.llm_cache import cache_enabled_for, get_llm_cache
+
+
+class LazyLLM(BaseLLM):
+    """
+    Handle to a shared LLM client, handed to agents in place of a live LLM.
+
+    Nothing is built when an agent module is imported: the real crewai LLM is
+    created on the first call and cached per (model, params, stop words), so
+    every agent configured alike shares one client. The stop words the agent
+    executor sets on the handle are part of the key, which keeps concurrent
+    agents from overwriting each other's stop list on a shared client.
+
+    With cache=True, text completions are served from and stored in the
+    response cache (agents/llm_cache.py), counted under the agent's name.
+    """
+
+    def __init__(self, model: str, agent: Optional[str] = None, cache: bool = False, **params: Any):
+        super().__init__(model=model, temperature=params.get("temperature"))
+        self.agent = agent
+        self.cache = cache
+        self.params = params
+
+    def client(self) -> LLM:
+        return _client_for(self.model, self.params, self.stop)
+
+    def call(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        tools: Optional[List[dict]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+        from_task: Optional[Any] = None,
+        from_agent: Optional[Any] = None,
+    ) -> Union[str, Any]:
+        # A call that may execute tools itself has side effects a cached answer would skip
+        cache = get_llm_cache() if self.cache and not available_functions else None
+        if cache is not None:
+            key = cache.key(self.model, self.params, self.stop, messages, tools)
+            cached = cache.get(key, agent=self.agent or "")
+            if cached is not None:
+                return cached
+
+        response = self.client().call(
+            messages,
+            tools=tools,
+            callbacks=callbacks,
+            available_functions=available_functions,
+            from_task=from_task,
+            from_agent=from_agent,
+        )
+        if cache is not None and isinstance(response, str) and response:
+            cache.put(key, self.model, response)
+        return response
+
+    def supports_function_calling(self) -> bool:
+        return self.client().supports_function_calling()
+
+    def supports_stop_words(self) -> bool:
+        return self.client().supports_stop_words()
+
+    def get_context_window_size(self) -> int:
+        return self.client().get_context_window_size()
+
+
+_clients: Dict[Tuple, LLM] = {}
+_clients_lock = threading.Lock()
+_http_client = None
+
+
+def _client_for(model: str, params: Dict[str, Any], stop: Optional[List[str]]) -> LLM:
+    stop_words = tuple(sorted(stop or []))
+    key = (model, tuple(sorted(params.items())), stop_words)
+
+    client = _clients.get(key)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(key)
+            if client is None:
+                _share_http_client()
+                client = LLM(model=model, stop=list(stop_words) or None, **params)
+                _clients[key] = client
+    return client
+
+
+def _share_http_client() -> None:
+    """
+    Points litellm's OpenAI-compatible handlers (NVIDIA NIM, Groq, OpenAI) at
+    one keep-alive connection pool, so every client reuses the same TLS
+    connections to the inference endpoint. Called with _clients_lock held.
+    """
+    global _http_client
+    if _http_client is not None:
+        return
+
+    import httpx
+    import litellm
+
+    _http_client = httpx.Client(
+        limits=httpx.Limits(
+            max_connections=int(os.getenv('LLM_HTTP_MAX_CONNECTIONS', '20')),
+            max_keepalive_connections=int(os.getenv('LLM_HTTP_MAX_CONNECTIONS', '20')),
+            keepalive_expiry=float(os.getenv('LLM_HTTP_KEEPALIVE', '120')),
+        ),
+        timeout=httpx.Timeout(float(os.getenv('LLM_HTTP_TIMEOUT', '600')), connect=10),
+    )
+    if litellm.client_session is None:
+        litellm.client_session = _http_client
+
+
+def llm_settings() -> Tuple[str, Dict[str, Any]]:
+    """
+    Model and parameters the agents run on: the local mock server
+    (mock_llm_server.py) when USE_MOCK_LLM is 'true', NVIDIA's API when
+    USE_NVIDIA_API is 'true' (NVIDIA_API_KEY must be set), Groq otherwise.
+    """
+    if os.getenv('USE_MOCK_LLM', 'false').lower() == 'true':
+        # Same sampling params as the NVIDIA model, so requests are shaped like the real ones
+        return "openai/" + os.getenv('NVIDIA_MODEL', 'meta/llama-3.1-405b-instruct'), {
+            "temperature": float(os.getenv('NVIDIA_TEMPERATURE', '0.3')),
+            "top_p": float(os.getenv('NVIDIA_TOP_P', '0.7')),
+            "max_tokens": int(os.getenv('NVIDIA_MAX_TOKENS', '8192')),
+            "api_base": os.getenv('MOCK_LLM_URL', 'http://127.0.0.1:8808/v1'),
+            "api_key": "mock",
+        }
+    if os.getenv('USE_NVIDIA_API', 'false').lower() == 'true':
+        api_key = os.getenv('NVIDIA_API_KEY', '')
+        if not api_key:
+            raise RuntimeError("USE_NVIDIA_API is 'true' but NVIDIA_API_KEY is not set. Export it or add it to .env "
+                               "(keys from https://build.nvidia.com), or set USE_NVIDIA_API to 'false' to use Groq.")
+        return os.getenv('NVIDIA_MODEL', 'meta/llama-3.1-405b-instruct'), {
+            "temperature": float(os.getenv('NVIDIA_TEMPERATURE', '0.3')),
+            "top_p": float(os.getenv('NVIDIA_TOP_P', '0.7')),
+            "max_tokens": int(os.getenv('NVIDIA_MAX_TOKENS', '8192')),
+            "api_base": os.getenv('NVIDIA_API_BASE_URL', 'https://integrate.api.nvidia.com/v1'),
+            "api_key": api_key,
+        }
+    return "groq/llama-3.3-70b-versatile", {"temperature": 0}
+
+
+def get_llm(model: Optional[str] = None, agent: Optional[str] = None, **params: Any) -> LazyLLM:
+    """
+    LLM handle for an agent. Without a model it uses llm_settings(); params
+    override the configured ones. Building the handle is free, the client
+    behind it is created on the first call and shared. The agent's responses
+    are cached when its name is listed in LLM_CACHE_AGENTS.
+    """
+    if model is None:
+        model, configured = llm_settings()
+        params = {**configured, **params}
+    return LazyLLM(model, agent=agent, cache=cache_enabled_for(agent), **params)
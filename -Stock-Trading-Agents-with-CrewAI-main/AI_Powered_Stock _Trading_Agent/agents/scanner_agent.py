@@ -1,25 +1,9 @@
-import os
-from crewai import Agent, LLM
+from crewai import Agent
 
+from agents.llm_factory import get_llm
 from tools.news_sentiment_tool import discover_penny_stocks_from_news, discover_stocks_from_social_media, scan_earnings_calendar, scan_market_momentum
 
-# NVIDIA API Configuration
-USE_NVIDIA_API = os.getenv('USE_NVIDIA_API', 'false').lower() == 'true'
-
-if USE_NVIDIA_API:
-    llm = LLM(
-        model=os.getenv('NVIDIA_MODEL', 'meta/llama-3.1-405b-instruct'),
-        temperature=float(os.getenv('NVIDIA_TEMPERATURE', '0.3')),
-        top_p=float(os.getenv('NVIDIA_TOP_P', '0.7')),
-        max_tokens=int(os.getenv('NVIDIA_MAX_TOKENS', '8192')),
-        api_base=os.getenv('NVIDIA_API_BASE_URL', 'https://integrate.api.nvidia.com/v1'),
-        api_key=os.getenv('NVIDIA_API_KEY', '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')
-    )
-else:
-    llm = LLM(
-        model="groq/llama-3.3-70b-versatile",
-        temperature=0
-    )
+llm = get_llm(agent='scanner')
 
 agent_scanner = Agent(
     role="Market Scanner Specialist",
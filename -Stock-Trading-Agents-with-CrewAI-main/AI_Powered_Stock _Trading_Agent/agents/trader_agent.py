@@ -1,23 +1,8 @@
-import os
-from crewai import Agent, LLM
+from crewai import Agent
 
-# NVIDIA API Configuration
-USE_NVIDIA_API = os.getenv('USE_NVIDIA_API', 'false').lower() == 'true'
+from agents.llm_factory import get_llm
 
-if USE_NVIDIA_API:
-    llm = LLM(
-        model=os.getenv('NVIDIA_MODEL', 'meta/llama-3.1-405b-instruct'),
-        temperature=float(os.getenv('NVIDIA_TEMPERATURE', '0.3')),
-        top_p=float(os.getenv('NVIDIA_TOP_P', '0.7')),
-        max_tokens=int(os.getenv('NVIDIA_MAX_TOKENS', '8192')),
-        api_base=os.getenv('NVIDIA_API_BASE_URL', 'https://integrate.api.nvidia.com/v1'),
-        api_key=os.getenv('NVIDIA_API_KEY', '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')
-    )
-else:
-    llm = LLM(
-        model="groq/llama-3.3-70b-versatile",
-        temperature=0
-    )
+llm = get_llm(agent='trader')
 
 agent_trader = Agent(
     role = "Strategic Stock Trader",
@@ -1,10 +1,13 @@
 import os
 
+# Local state (caches, stores, checkpoints) lives next to the app, wherever it is started from
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(APP_DIR, 'data')
+
 # NVIDIA API Configuration
-# Set these environment variables before running the application
+# NVIDIA_API_KEY is never stored here: export it or put it in .env before running the application
 os.environ['USE_NVIDIA_API'] = 'true'
 os.environ['NVIDIA_API_BASE_URL'] = 'https://integrate.api.nvidia.com/v1'
-os.environ['NVIDIA_API_KEY'] = ''
 os.environ['NVIDIA_MODEL'] = 'meta/llama-3.1-405b-instruct'
 os.environ['NVIDIA_TEMPERATURE'] = '0.3'
 os.environ['NVIDIA_TOP_P'] = '0.7'
@@ -14,6 +17,29 @@ os.environ['NVIDIA_MAX_TOKENS'] = '8192'
 # os.environ['NVIDIA_MODEL'] = 'meta/llama-3.3-70b-instruct'
 # os.environ['NVIDIA_MODEL'] = 'qwen/qwen3-235b-a22b'
 
+# Offline runs: with USE_MOCK_LLM 'true' every agent talks to the local mock server instead
+# (python mock_llm_server.py). Profiles: 'instant', 'groq', 'nvidia-405b'; MOCK_LLM_SCRIPT is an optional JSON
+# file of scripted steps, MOCK_LLM_TTFT / MOCK_LLM_TOKENS_PER_SECOND override the profile's latency
+os.environ['USE_MOCK_LLM'] = 'false'
+os.environ['MOCK_LLM_URL'] = 'http://127.0.0.1:8808/v1'
+os.environ['MOCK_LLM_PROFILE'] = 'nvidia-405b'
+os.environ['MOCK_LLM_SCRIPT'] = ''
+
+# LLM clients are built on first use and share one keep-alive connection pool (agents/llm_factory.py)
+os.environ['LLM_HTTP_MAX_CONNECTIONS'] = '20'
+os.environ['LLM_HTTP_KEEPALIVE'] = '120'
+os.environ['LLM_HTTP_TIMEOUT'] = '600'
+
+# On-disk LLM response cache, keyed by model, sampling params and the full prompt including tool results.
+# Off by default: a cached trader answer can be a decision up to LLM_CACHE_MAX_AGE seconds old. To opt in, list
+# the agents that may reuse responses (analyst, trader, scanner, discovery, or 'all') in the environment,
+# e.g. LLM_CACHE_AGENTS=scanner,discovery python market_scanner_main.py; the environment wins over this default
+os.environ.setdefault('LLM_CACHE_AGENTS', '')
+os.environ['LLM_CACHE_DB'] = os.path.join(DATA_DIR, 'llm_cache.sqlite')
+os.environ['LLM_CACHE_MAX_AGE'] = '900'
+os.environ['LLM_CACHE_MAX_ENTRIES'] = '5000'
+os.environ['LLM_CACHE_MAX_MB'] = '100'
+
 # Twitter API Configuration
 # Twitter API - Apply for access at https://developer.twitter.com
 os.environ['TWITTER_BEARER_TOKEN'] = ''
@@ -21,6 +47,88 @@ os.environ['TWITTER_API_KEY'] = ''
 os.environ['TWITTER_API_SECRET'] = ''
 os.environ['TWITTER_ACCESS_TOKEN'] = ''
 os.environ['TWITTER_ACCESS_TOKEN_SECRET'] = ''
+# Social discovery polls recent search with the bearer token only. The since_id checkpoint and the
+# last day's tweets live in TWITTER_STATE_PATH; point TWITTER_API_BASE_URL at a local fake to run offline
+os.environ['TWITTER_API_BASE_URL'] = 'https://api.twitter.com'
+os.environ['TWITTER_STATE_PATH'] = os.path.join(DATA_DIR, 'twitter_state.json')
+os.environ['TWITTER_MAX_PAGES'] = '5'
+os.environ['TWITTER_TWEET_WINDOW'] = '86400'
+
+# Quote cache used by MarketPulse
+# Price fields expire after a few seconds, sector/recommendation/growth after hours
+os.environ['QUOTE_CACHE_PRICE_TTL'] = '15'
+os.environ['QUOTE_CACHE_PROFILE_TTL'] = '21600'
+os.environ['QUOTE_CACHE_MAX_SYMBOLS'] = '512'
+# Shared on disk so quotes fetched by the prefetch daemon (or another crew) are reused
+os.environ['QUOTE_CACHE_DB'] = os.path.join(DATA_DIR, 'quotes.sqlite')
+
+# Market data provider
+# 'yfinance' = live data, 'record' = live data saved to MARKET_DATA_REPLAY_DIR,
+# 'replay' = serve the saved responses offline (deterministic benchmarks and regression runs)
+os.environ['MARKET_DATA_PROVIDER'] = 'yfinance'
+os.environ['MARKET_DATA_REPLAY_DIR'] = os.path.join(APP_DIR, 'market_data_replay')
+os.environ['MARKET_DATA_REPLAY_LATENCY'] = '0'
+
+# Local daily OHLCV history, one memory-mapped file per symbol, updated incrementally
+os.environ['BAR_STORE_DIR'] = os.path.join(DATA_DIR, 'bars')
+# Symbols updated within this many seconds are not refetched by the scanners
+os.environ['BAR_STORE_MAX_AGE'] = '900'
+
+# Symbol universe index (listed tickers with sector and last-known price), refreshed by the prefetch daemon.
+# SYMBOL_UNIVERSE_BACKGROUND 'true' makes every process that reads it refresh it in a thread of its own instead
+os.environ['SYMBOL_UNIVERSE_DB'] = os.path.join(DATA_DIR, 'universe.sqlite')
+os.environ['SYMBOL_UNIVERSE_BACKGROUND'] = 'false'
+os.environ['SYMBOL_UNIVERSE_REFRESH_INTERVAL'] = '3600'
+os.environ['SYMBOL_UNIVERSE_ENRICH_BATCH'] = '200'
+
+# Earnings calendar (Nasdaq, one request per day), stored locally and refreshed by the prefetch daemon.
+# EARNINGS_CALENDAR_BACKGROUND 'true' makes every process that reads it refresh it in a thread of its own instead
+os.environ['EARNINGS_CALENDAR_DB'] = os.path.join(DATA_DIR, 'earnings.sqlite')
+os.environ['EARNINGS_CALENDAR_BACKGROUND'] = 'false'
+os.environ['EARNINGS_CALENDAR_REFRESH_INTERVAL'] = '21600'
+
+# Shared rate limiting: per-host token buckets as host=requests_per_second:burst
+# (a host also covers its subdomains), and the size of the shared fetch thread pool.
+# Background cache warming runs on its own smaller pool and only takes a token when no tool call is waiting
+os.environ['RATE_LIMITS'] = 'yahoo.com=2:5,api.twitter.com=0.5:5,nasdaqtrader.com=1:2,api.nasdaq.com=2:4'
+os.environ['RATE_LIMIT_DEFAULT'] = '5:10'
+os.environ['FETCH_POOL_WORKERS'] = '8'
+os.environ['BACKGROUND_POOL_WORKERS'] = '2'
+
+# News feeds: ETag / Last-Modified and last entries per feed, for conditional GETs
+os.environ['FEED_STATE_PATH'] = os.path.join(DATA_DIR, 'feed_state.json')
+# Feeds fetched within this many seconds are served from the state file without a request
+os.environ['FEED_MAX_AGE'] = '180'
+
+# Prefetch daemon (python prefetch_daemon.py): how often, in seconds, it refreshes each shared cache
+os.environ['PREFETCH_FEED_INTERVAL'] = '120'
+os.environ['PREFETCH_QUOTE_INTERVAL'] = '10'
+os.environ['PREFETCH_BAR_INTERVAL'] = '600'
+os.environ['PREFETCH_EARNINGS_INTERVAL'] = '21600'
+
+# Headline deduplication: stories seen within the window (seconds) are counted and analyzed once
+os.environ['HEADLINE_DEDUP_PATH'] = os.path.join(DATA_DIR, 'headline_seen.json')
+os.environ['HEADLINE_DEDUP_WINDOW'] = '86400'
+
+# Mention store behind BuzzVelocity: every news/social mention, plus per-symbol counts
+# pre-aggregated in buckets of MENTION_BUCKET_SECONDS, kept for MENTION_RETENTION seconds
+os.environ['MENTION_STORE_DB'] = os.path.join(DATA_DIR, 'mentions.sqlite')
+os.environ['MENTION_BUCKET_SECONDS'] = '300'
+os.environ['MENTION_RETENTION'] = '604800'
+
+# Tool output handed to the LLM: 'tsv' (compact), 'json' or 'text', an optional token budget
+# per tool call (0 = unlimited) and a log of output token counts per call
+os.environ['TOOL_OUTPUT_FORMAT'] = 'tsv'
+os.environ['TOOL_OUTPUT_TOKEN_BUDGET'] = '1500'
+os.environ['TOOL_OUTPUT_TOKEN_LOG'] = os.path.join(DATA_DIR, 'tool_tokens.jsonl')
 
 # Default watchlist for trading
-DEFAULT_WATCHLIST = "NIO,SNDL,IGC,TLRY,UGRO,CGC,EGO,OGI" 
+DEFAULT_WATCHLIST = "NIO,SNDL,IGC,TLRY,UGRO,CGC,EGO,OGI"
+
+# Batch mode (python watchlist_main.py): symbols analysed at the same time and seconds before one is given up on
+os.environ['WATCHLIST_BATCH_WORKERS'] = '8'
+os.environ['WATCHLIST_BATCH_TIMEOUT'] = '300'
+
+# Symbols the market scanners screen when no list is passed to them
+os.environ['SCAN_UNIVERSE'] = DEFAULT_WATCHLIST
+
@@ -1,49 +1,43 @@
-from crewai import Crew
+from registry import crews, new_crew
+from tools.run_snapshot import run_snapshot
 
-from tasks.discovery_task import comprehensive_market_discovery, penny_stock_news_analysis, social_media_trend_analysis, catalyst_discovery
-from agents.discovery_agent import agent_discovery
+# crewai, the discovery agent and its tools load with the first crew that runs (see registry.py)
 
-discovery_crew = Crew(
-    agents=[agent_discovery],
-    tasks=[comprehensive_market_discovery()],
-    verbose=True
-)
+def __getattr__(name):
+    if name == "discovery_crew":
+        return crews['discovery']
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def run_comprehensive_discovery():
     """Run comprehensive market discovery from news, social media, and market data"""
-    result = discovery_crew.kickoff()
+    with run_snapshot():
+        result = crews['discovery'].kickoff()
     print(result)
     return result
 
 def run_news_discovery():
     """Run focused penny stock news analysis"""
-    news_crew = Crew(
-        agents=[agent_discovery],
-        tasks=[penny_stock_news_analysis()],
-        verbose=True
-    )
-    result = news_crew.kickoff()
+    from tasks.discovery_task import penny_stock_news_analysis
+    news_crew = new_crew(['discovery'], [penny_stock_news_analysis()])
+    with run_snapshot():
+        result = news_crew.kickoff()
     print(result)
     return result
 
 def run_social_media_discovery():
     """Run social media trend analysis"""
-    social_crew = Crew(
-        agents=[agent_discovery],
-        tasks=[social_media_trend_analysis()],
-        verbose=True
-    )
-    result = social_crew.kickoff()
+    from tasks.discovery_task import social_media_trend_analysis
+    social_crew = new_crew(['discovery'], [social_media_trend_analysis()])
+    with run_snapshot():
+        result = social_crew.kickoff()
     print(result)
     return result
 
 def run_catalyst_discovery():
     """Run catalyst discovery analysis"""
-    catalyst_crew = Crew(
-        agents=[agent_discovery],
-        tasks=[catalyst_discovery()],
-        verbose=True
-    )
-    result = catalyst_crew.kickoff()
+    from tasks.discovery_task import catalyst_discovery
+    catalyst_crew = new_crew(['discovery'], [catalyst_discovery()])
+    with run_snapshot():
+        result = catalyst_crew.kickoff()
     print(result)
-    return result 
\ No newline at end of file
+    return result
@@ -0,0 +1,85 @@
+"""
+Import-time report for the entry points: how long each takes to load before
+its menu or first prompt can appear, and which packages that time goes to.
+
+    python import_benchmark.py                           # every entry point
+    python import_benchmark.py agent_zero_chat --top 20  # one, with more packages
+
+Every module is imported in a fresh interpreter. Wall time is the best of
+--repeat runs minus the cost of starting an empty interpreter; the package
+breakdown comes from one run under -X importtime, summing each module's own
+(self) time into its top-level package.
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+ENTRY_POINTS = ["main", "discovery_main", "market_scanner_main", "agent_zero_chat"]
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def run_python(code: str, *flags: str) -> Tuple[float, str]:
+    started = time.perf_counter()
+    result = subprocess.run([sys.executable, *flags, "-c", code], cwd=APP_DIR,
+                            capture_output=True, text=True)
+    elapsed = time.perf_counter() - started
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "import failed")
+    return elapsed, result.stderr
+
+
+def wall_time(module: str, repeat: int) -> float:
+    baseline = min(run_python("pass")[0] for _ in range(repeat))
+    return max(0.0, min(run_python(f"import {module}")[0] for _ in range(repeat)) - baseline)
+
+
+def import_profile(module: str) -> Tuple[float, Dict[str, float]]:
+    """(cumulative seconds for the module, self seconds per top-level package) from -X importtime."""
+    _, stderr = run_python(f"import {module}", "-X", "importtime")
+
+    total = 0.0
+    packages: Dict[str, float] = defaultdict(float)
+    for line in stderr.splitlines():
+        # import time:       self [us] |  cumulative | imported package
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        if name.strip() == module:
+            total = int(cumulative_us) / 1e6
+        packages[name.strip().split(".")[0]] += int(self_us) / 1e6
+    return total, packages
+
+
+def report(modules: List[str], top: int, repeat: int) -> None:
+    for module in modules:
+        try:
+            wall = wall_time(module, repeat)
+            total, packages = import_profile(module)
+        except RuntimeError as e:
+            print(f"{module}: {e}\n")
+            continue
+
+        print(f"{module}: {wall * 1000:.0f} ms wall, {total * 1000:.0f} ms in imports")
+        heaviest = sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]
+        for package, seconds in heaviest:
+            print(f"    {seconds * 1000:8.1f} ms  {package}")
+        print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report the import time of the entry points")
+    parser.add_argument("modules", nargs="*", default=ENTRY_POINTS, help="modules to import (default: every entry point)")
+    parser.add_argument("--top", type=int, default=10, help="packages listed per module")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per wall time measurement")
+    args = parser.parse_args()
+
+    report(args.modules, args.top, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
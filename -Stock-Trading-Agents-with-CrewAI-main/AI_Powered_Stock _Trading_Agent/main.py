@@ -1,14 +1,23 @@
 from dotenv import load_dotenv    # For loading API key
 import config  # Import config to set NVIDIA API environment variables
 
-from crew import agent_crew
+from agents.llm_cache import get_llm_cache
+from registry import crews
+from tools.quote_cache import quote_cache
+from tools.run_snapshot import run_snapshot
+from tools.tool_output import token_summary
 
 load_dotenv()
 
 def run(stock: str):
-    result = agent_crew.kickoff(inputs={"stock": stock}) # It passes the stock name into the AI pipeline (inputs={"stock": stock}), triggering tasks like analysis and trading decision.
+    with run_snapshot() as snapshot:  # Every tool in this run shares one fetch per symbol
+        result = crews['stock'].kickoff(inputs={"stock": stock}) # It passes the stock name into the AI pipeline (inputs={"stock": stock}), triggering tasks like analysis and trading decision.
     # whatever variable we are creating in (tasks directory) we have to mention that variable in input={}                                                      # .kickoff(...): This is a method that starts or "kicks off" the AI pipeline (task execution).
     print(result)
+    print(snapshot.summary())
+    print(quote_cache.summary())
+    print(token_summary())
+    print(get_llm_cache().summary())
 
 if __name__ =="__main__":
     run("NIO")
@@ -1,38 +1,34 @@
-from crewai import Crew
+from registry import crews, new_crew
+from tools.run_snapshot import run_snapshot
 
-from tasks.scan_task import market_scan_analysis, sector_focus_scan, penny_stock_analysis
-from agents.scanner_agent import agent_scanner
+# crewai, the scanner agent and its tools load with the first crew that runs (see registry.py)
 
-market_scan_crew = Crew(
-    agents=[agent_scanner],
-    tasks=[market_scan_analysis()],
-    verbose=True
-)
+def __getattr__(name):
+    if name == "market_scan_crew":
+        return crews['market_scan']
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def run_market_scan():
     """Run a comprehensive market scan for low-priced growth stocks"""
-    result = market_scan_crew.kickoff()
+    with run_snapshot():
+        result = crews['market_scan'].kickoff()
     print(result)
     return result
 
 def run_sector_scan(sector: str):
     """Run a focused scan on a specific sector"""
-    sector_crew = Crew(
-        agents=[agent_scanner],
-        tasks=[sector_focus_scan(sector)],
-        verbose=True
-    )
-    result = sector_crew.kickoff()
+    from tasks.scan_task import sector_focus_scan
+    sector_crew = new_crew(['scanner'], [sector_focus_scan(sector)])
+    with run_snapshot():
+        result = sector_crew.kickoff()
     print(result)
     return result
 
 def run_penny_stock_scan():
     """Run a specialized penny stock analysis"""
-    penny_crew = Crew(
-        agents=[agent_scanner],
-        tasks=[penny_stock_analysis()],
-        verbose=True
-    )
-    result = penny_crew.kickoff()
+    from tasks.scan_task import penny_stock_analysis
+    penny_crew = new_crew(['scanner'], [penny_stock_analysis()])
+    with run_snapshot():
+        result = penny_crew.kickoff()
     print(result)
-    return result 
\ No newline at end of file
+    return result
@@ -0,0 +1,290 @@
+"""
+Offline stand-in for the inference endpoint: a local server speaking the
+OpenAI-compatible chat completions API that crewai's LLM(api_base=...) calls,
+so the crews can be run and profiled without NVIDIA or Groq.
+
+    python mock_llm_server.py                          # profile from MOCK_LLM_PROFILE
+    python mock_llm_server.py --profile instant        # no simulated inference time
+    python mock_llm_server.py --script mock_script.json
+
+Set USE_MOCK_LLM to 'true' in config.py and every agent talks to MOCK_LLM_URL.
+
+Agents follow crewai's text protocol (Thought / Action / Action Input, then
+Final Answer). Without a script the server calls each tool listed in the
+prompt once, in order, filling every argument whose name mentions a stock,
+symbol or ticker (stock_name, symbols, ...) with the symbol from the task,
+and then gives a final answer; a request with OpenAI 'tools' gets the same
+steps as tool_calls. A script is a JSON list of rules, the first whose
+'match' regex is found in the prompt wins, and its steps are played one per
+model turn:
+
+    [{"match": "MarketPulse",
+      "steps": [{"action": "MarketPulse", "input": {"symbol": "NIO"}},
+                {"final": "Decision: Hold"}]}]
+
+Each response is delayed like a real model: time to first token plus the
+completion tokens at the profile's token rate (MOCK_LLM_TTFT and
+MOCK_LLM_TOKENS_PER_SECOND override the profile).
+"""
+import argparse
+import ast
+import json
+import os
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from dotenv import load_dotenv
+import config  # Import config for the MOCK_LLM_* defaults
+
+load_dotenv()
+
+# Time to first token (seconds), decode speed (tokens/s) and final answer length (tokens)
+PROFILES = {
+    "instant": {"ttft": 0.0, "tokens_per_second": 0.0, "answer_tokens": 200},
+    "groq": {"ttft": 0.25, "tokens_per_second": 275.0, "answer_tokens": 400},
+    "nvidia-405b": {"ttft": 0.8, "tokens_per_second": 30.0, "answer_tokens": 400},
+}
+
+TOOL_PATTERN = re.compile(r"Tool Name: (.+)\nTool Arguments: (\{.*?\})\n", re.M)
+TOOL_NAMES_PATTERN = re.compile(r"only one name of \[(.*?)\]")
+CRITERIA_PATTERN = re.compile(r"This is the expected criteria for your final answer: (.*?)\nyou MUST return", re.S)
+SYMBOL_PATTERN = re.compile(r"\b(?i:stock|symbol|ticker)s?:?\s+\$?([A-Z]{1,5})\b")
+# Tool arguments that take a symbol: stock_name, symbol, symbols, ticker, ...
+SYMBOL_ARGUMENT_PATTERN = re.compile(r"stock|symbol|ticker", re.I)
+
+
+def estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+def message_text(message: Dict[str, Any]) -> str:
+    content = message.get("content") or ""
+    if isinstance(content, list):  # Content parts
+        return "".join(part.get("text", "") for part in content if isinstance(part, dict))
+    return content
+
+
+class Script:
+    """Picks the step for a conversation: a scripted rule, or one call per listed tool then a final answer."""
+
+    def __init__(self, rules: Optional[List[Dict[str, Any]]] = None, answer_tokens: int = 200):
+        self.rules = [(re.compile(rule["match"]), rule["steps"]) for rule in rules or []]
+        self.answer_tokens = answer_tokens
+
+    @classmethod
+    def load(cls, path: Optional[str], answer_tokens: int = 200) -> "Script":
+        if not path:
+            return cls(answer_tokens=answer_tokens)
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f), answer_tokens=answer_tokens)
+
+    def step(self, prompt: str, turn: int, tools: List[Tuple[str, Dict[str, Any]]]) -> Dict[str, Any]:
+        for pattern, steps in self.rules:
+            if pattern.search(prompt):
+                return steps[min(turn, len(steps) - 1)]
+
+        if turn < len(tools):
+            name, arguments = tools[turn]
+            return {"action": name, "input": self._fill_arguments(arguments, prompt)}
+        return {"final": self._final_answer(prompt)}
+
+    @staticmethod
+    def _fill_arguments(arguments: Dict[str, Any], prompt: str) -> Dict[str, Any]:
+        match = SYMBOL_PATTERN.search(prompt)
+        symbol = match.group(1).upper() if match else "NIO"
+        return {name: symbol for name in arguments if SYMBOL_ARGUMENT_PATTERN.search(name)}
+
+    def _final_answer(self, prompt: str) -> str:
+        criteria = CRITERIA_PATTERN.search(prompt)
+        answer = criteria.group(1).strip() if criteria else "Mock analysis complete."
+        # Pad to the profile's answer length so decode time matches a real answer
+        filler = " Mock observation based on the data gathered above."
+        while estimate_tokens(answer) < self.answer_tokens:
+            answer += filler
+        return answer
+
+
+def conversation(messages: List[Dict[str, Any]]) -> Tuple[str, int]:
+    """The prompt text to match against, and how many tool results the conversation already holds."""
+    prompt = "\n".join(message_text(message) for message in messages if message.get("role") in ("system", "user"))
+    turn = sum(1 for message in messages if message.get("role") == "tool")
+    turn += sum(message_text(message).count("\nObservation:") for message in messages
+                if message.get("role") == "assistant")
+    return prompt, turn
+
+
+def listed_tools(prompt: str, request_tools: Optional[List[Dict[str, Any]]]) -> List[Tuple[str, Dict[str, Any]]]:
+    """(name, arguments) of every tool on offer, from the OpenAI 'tools' field or crewai's tool descriptions."""
+    if request_tools:
+        return [(tool["function"]["name"], tool["function"].get("parameters", {}).get("properties", {}))
+                for tool in request_tools if tool.get("type") == "function"]
+
+    tools = []
+    for name, arguments in TOOL_PATTERN.findall(prompt):
+        try:
+            tools.append((name.strip(), ast.literal_eval(arguments)))
+        except (ValueError, SyntaxError):
+            tools.append((name.strip(), {}))
+    if not tools:
+        names = TOOL_NAMES_PATTERN.search(prompt)
+        if names:
+            tools = [(name.strip(), {}) for name in names.group(1).split(",") if name.strip()]
+    return tools
+
+
+def render_step(step: Dict[str, Any], native_tools: bool) -> Dict[str, Any]:
+    """The assistant message for a step, as text in crewai's format or as an OpenAI tool call."""
+    if "action" in step and native_tools:
+        return {"role": "assistant", "content": None, "tool_calls": [{
+            "id": "call_" + uuid.uuid4().hex[:24],
+            "type": "function",
+            "function": {"name": step["action"], "arguments": json.dumps(step.get("input", {}))},
+        }]}
+    if "action" in step:
+        content = (f"Thought: I should use {step['action']} to gather the data\n"
+                   f"Action: {step['action']}\nAction Input: {json.dumps(step.get('input', {}))}")
+    else:
+        content = f"Thought: I now can give a great answer\nFinal Answer: {step['final']}"
+    return {"role": "assistant", "content": content}
+
+
+class MockLLMServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, script: Script, ttft: float, tokens_per_second: float, quiet: bool = False):
+        super().__init__(address, MockLLMHandler)
+        self.script = script
+        self.ttft = ttft
+        self.tokens_per_second = tokens_per_second
+        self.quiet = quiet
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def decode_time(self, tokens: int) -> float:
+        return tokens / self.tokens_per_second if self.tokens_per_second > 0 else 0.0
+
+
+class MockLLMHandler(BaseHTTPRequestHandler):
+    server: MockLLMServer
+
+    def do_GET(self):
+        if urlparse(self.path).path.rstrip("/").endswith("/models"):
+            self._send_json({"object": "list", "data": [{"id": "mock", "object": "model", "owned_by": "mock"}]})
+        else:
+            self._send_json({"error": {"message": "not found"}}, status=404)
+
+    def do_POST(self):
+        if not urlparse(self.path).path.rstrip("/").endswith("/chat/completions"):
+            self._send_json({"error": {"message": "not found"}}, status=404)
+            return
+
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        messages = body.get("messages", [])
+        prompt, turn = conversation(messages)
+        step = self.server.script.step(prompt, turn, listed_tools(prompt, body.get("tools")))
+        message = render_step(step, native_tools=bool(body.get("tools")))
+
+        completion_tokens = estimate_tokens(message["content"] or json.dumps(message.get("tool_calls")))
+        usage = {
+            "prompt_tokens": sum(estimate_tokens(message_text(m)) for m in messages),
+            "completion_tokens": completion_tokens,
+        }
+        usage["total_tokens"] = usage["prompt_tokens"] + usage["completion_tokens"]
+
+        with self.server._lock:
+            self.server.requests += 1
+            number = self.server.requests
+        if not self.server.quiet:
+            kind = "final" if "final" in step else step["action"]
+            print(f"[{time.strftime('%H:%M:%S')}] #{number} turn {turn}: {kind}, {completion_tokens} tokens")
+
+        time.sleep(self.server.ttft)
+        response_id = "chatcmpl-" + uuid.uuid4().hex[:24]
+        model = body.get("model", "mock")
+        if body.get("stream"):
+            self._stream(response_id, model, message, usage)
+        else:
+            time.sleep(self.server.decode_time(completion_tokens))
+            self._send_json({
+                "id": response_id,
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{"index": 0, "message": message,
+                             "finish_reason": "tool_calls" if message.get("tool_calls") else "stop"}],
+                "usage": usage,
+            })
+
+    def _stream(self, response_id: str, model: str, message: Dict[str, Any], usage: Dict[str, int]) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+
+        def chunk(delta: Dict[str, Any], finish_reason: Optional[str] = None, **extra: Any) -> None:
+            payload = {"id": response_id, "object": "chat.completion.chunk", "created": int(time.time()),
+                       "model": model, "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}]}
+            payload.update(extra)
+            self.wfile.write(f"data: {json.dumps(payload)}\n\n".encode("utf-8"))
+            self.wfile.flush()
+
+        chunk({"role": "assistant", "content": ""})
+        if message.get("tool_calls"):
+            time.sleep(self.server.decode_time(usage["completion_tokens"]))
+            calls = [dict(call, index=i) for i, call in enumerate(message["tool_calls"])]
+            chunk({"tool_calls": calls})
+            chunk({}, "tool_calls", usage=usage)
+        else:
+            # Words go out at the profile's token rate
+            words = re.findall(r"\S+\s*", message["content"])
+            for word in words:
+                time.sleep(self.server.decode_time(estimate_tokens(word)))
+                chunk({"content": word})
+            chunk({}, "stop", usage=usage)
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+
+    def _send_json(self, payload: Dict[str, Any], status: int = 200) -> None:
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass  # One line per completion is printed by do_POST
+
+
+def main():
+    url = urlparse(os.getenv('MOCK_LLM_URL', 'http://127.0.0.1:8808/v1'))
+
+    parser = argparse.ArgumentParser(description="OpenAI-compatible mock LLM for offline crew runs")
+    parser.add_argument("--host", default=url.hostname or "127.0.0.1")
+    parser.add_argument("--port", type=int, default=url.port or 8808)
+    parser.add_argument("--profile", choices=sorted(PROFILES), default=os.getenv('MOCK_LLM_PROFILE', 'instant'))
+    parser.add_argument("--script", default=os.getenv('MOCK_LLM_SCRIPT') or None, help="JSON file of scripted steps")
+    parser.add_argument("--quiet", action="store_true", help="do not print a line per completion")
+    args = parser.parse_args()
+
+    profile = PROFILES[args.profile]
+    ttft = float(os.getenv('MOCK_LLM_TTFT') or profile["ttft"])
+    tokens_per_second = float(os.getenv('MOCK_LLM_TOKENS_PER_SECOND') or profile["tokens_per_second"])
+    script = Script.load(args.script, answer_tokens=profile["answer_tokens"])
+
+    server = MockLLMServer((args.host, args.port), script, ttft, tokens_per_second, quiet=args.quiet)
+    rate = f"{tokens_per_second:g} tokens/s" if tokens_per_second > 0 else "unlimited tokens/s"
+    print(f"🧪 Mock LLM on http://{args.host}:{args.port}/v1 ({args.profile}: {ttft:g}s to first token, {rate})")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n👋 Mock LLM stopped")
@@ -0,0 +1,130 @@
+"""
+Prefetch daemon: keeps the shared on-disk caches warm so crew tool calls read
+local data instead of waiting on the network.
+
+    python prefetch_daemon.py          # run until interrupted
+    python prefetch_daemon.py --once   # refresh everything once and exit
+
+It polls the news feeds, the watchlist quotes, the daily bars of the scan and
+momentum universe and the earnings calendar, each on its own PREFETCH_*_INTERVAL,
+writing to the same feed state, quote cache database, bar store and calendar
+that discovery_crew, market_scan_crew and agent_zero_chat read from. The
+symbol universe is refreshed on a background thread at low rate limit
+priority, so its long enrichment batches never hold up the other jobs.
+"""
+import argparse
+import os
+import time
+
+from dotenv import load_dotenv
+import config  # Import config to set the cache locations and intervals
+
+from tools.bar_store import get_bar_store
+from tools.data_providers import QUOTE_FIELDS
+from tools.earnings_calendar import get_earnings_calendar
+from tools.feed_fetcher import NEWS_SOURCES, get_feed_fetcher
+from tools.market_data import fetch_quote, get_quote
+from tools.quote_cache import quote_cache, PROFILE_FIELDS
+from tools.rate_limiter import fetch_all
+from tools.screener import default_universe, parse_symbols, resolve_universe
+from tools.symbol_universe import get_symbol_universe
+
+load_dotenv()
+
+
+def prefetch_feeds() -> str:
+    # Bypass FEED_MAX_AGE: the daemon is what keeps the feeds fresh for everyone else
+    fetcher = get_feed_fetcher()
+    max_age, fetcher.max_age = fetcher.max_age, 0
+    try:
+        results = fetcher.fetch(list(NEWS_SOURCES.values()))
+    finally:
+        fetcher.max_age = max_age
+    changed = sum(1 for result in results.values() if result.status == 200)
+    return f"{len(results)} feeds, {changed} changed"
+
+
+def watchlist() -> list:
+    return list(dict.fromkeys(parse_symbols(config.DEFAULT_WATCHLIST) + default_universe()))
+
+
+def prefetch_quotes() -> str:
+    symbols = watchlist()
+
+    def refresh(symbol):
+        # Always refetch prices, so they never expire between polls; profiles only when stale
+        quote_cache.put(symbol, fetch_quote(symbol, QUOTE_FIELDS))
+        get_quote(symbol, PROFILE_FIELDS)
+
+    failed = sum(1 for result in fetch_all(refresh, symbols).values() if isinstance(result, Exception))
+    return f"{len(symbols)} quotes, {failed} failed"
+
+
+def prefetch_bars() -> str:
+    # The volume scanners' universe plus every listed stock under $5 for the momentum scanner
+    symbols = list(dict.fromkeys(watchlist() + resolve_universe(max_price=5.0)))
+    written = get_bar_store().update(symbols, max_age=0)
+    return f"{len(symbols)} symbols, {written} bars written"
+
+
+def prefetch_earnings() -> str:
+    days = get_earnings_calendar().refresh(days_ahead=30, max_age=0)
+    return f"{days} calendar days"
+
+
+def prefetch_universe() -> str:
+    enriched = get_symbol_universe().refresh(batch_size=int(os.getenv('SYMBOL_UNIVERSE_ENRICH_BATCH', '200')))
+    return f"{get_symbol_universe().count()} listed symbols, {enriched} enriched"
+
+
+def jobs() -> list:
+    return [
+        ("feeds", prefetch_feeds, float(os.getenv('PREFETCH_FEED_INTERVAL', '120'))),
+        ("quotes", prefetch_quotes, float(os.getenv('PREFETCH_QUOTE_INTERVAL', '10'))),
+        ("bars", prefetch_bars, float(os.getenv('PREFETCH_BAR_INTERVAL', '600'))),
+        ("earnings", prefetch_earnings, float(os.getenv('PREFETCH_EARNINGS_INTERVAL', '21600'))),
+    ]
+
+
+def run_job(name, job) -> None:
+    started = time.time()
+    try:
+        summary = job()
+        print(f"[{time.strftime('%H:%M:%S')}] {name}: {summary} ({time.time() - started:.1f}s)")
+    except Exception as e:
+        print(f"[{time.strftime('%H:%M:%S')}] {name} failed: {e}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Keep the shared market data caches warm")
+    parser.add_argument("--once", action="store_true", help="refresh every cache once and exit")
+    args = parser.parse_args()
+
+    scheduled = jobs()
+    if args.once:
+        run_job("universe", prefetch_universe)
+        for name, job, _ in scheduled:
+            run_job(name, job)
+        return
+
+    universe_interval = float(os.getenv('SYMBOL_UNIVERSE_REFRESH_INTERVAL', '3600'))
+    get_symbol_universe().refresh_in_background(
+        interval=universe_interval,
+        batch_size=int(os.getenv('SYMBOL_UNIVERSE_ENRICH_BATCH', '200')),
+    )
+    print("🔄 Prefetch daemon running: " + ", ".join(f"{name} every {interval:g}s" for name, _, interval in scheduled)
+          + f", universe every {universe_interval:g}s in the background")
+    next_run = {name: 0.0 for name, _, _ in scheduled}
+    while True:
+        for name, job, interval in scheduled:
+            if time.time() >= next_run[name]:
+                run_job(name, job)
+                next_run[name] = time.time() + interval
+        time.sleep(max(0.5, min(next_run.values()) - time.time()))
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n👋 Prefetch daemon stopped")
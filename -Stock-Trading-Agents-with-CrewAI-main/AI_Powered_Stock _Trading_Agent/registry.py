@@ -0,0 +1,111 @@
+"""
+Lazy registry of the agents, tasks and crews the entry points run.
+
+Entries are 'module:attribute' paths or factories. Nothing is imported until
+an entry is first looked up, so the menus of discovery_main, market_scanner_main
+and agent_zero_chat come up without loading crewai, litellm or the tool
+modules behind the agents (yfinance, pandas, numpy, feedparser, httpx); those
+load with the first crew that actually runs. Resolved entries are cached, so
+every later lookup returns the same object.
+
+    from registry import agents, crews
+    'analyst' in agents        # no import
+    crews['stock'].kickoff(inputs={"stock": "NIO"})
+"""
+import importlib
+import threading
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterator, List, Union
+
+Entry = Union[str, Callable[[], Any]]
+
+
+def resolve(entry: Entry) -> Any:
+    """'package.module:attribute' -> the attribute, 'package.module' -> the module, a factory -> its result."""
+    if callable(entry):
+        return entry()
+    module_name, _, attribute = entry.partition(":")
+    module = importlib.import_module(module_name)
+    return getattr(module, attribute) if attribute else module
+
+
+class LazyRegistry(Mapping):
+    """
+    Read-only mapping whose values are resolved on first lookup. Membership,
+    iteration and len() only look at the names, so checking for an entry
+    never imports it; values() and items() resolve everything.
+    """
+
+    def __init__(self, entries: Dict[str, Entry]):
+        self._entries = dict(entries)
+        self._resolved: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+
+    def register(self, name: str, entry: Entry) -> None:
+        with self._lock:
+            self._entries[name] = entry
+            self._resolved.pop(name, None)
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._resolved
+
+    def __getitem__(self, name: str) -> Any:
+        try:
+            return self._resolved[name]
+        except KeyError:
+            pass
+
+        entry = self._entries[name]
+        with self._lock:
+            if name not in self._resolved:
+                self._resolved[name] = resolve(entry)
+            return self._resolved[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+agents = LazyRegistry({
+    'analyst': 'agents.analyst_agent:agent_analyst',
+    'trader': 'agents.trader_agent:agent_trader',
+    'scanner': 'agents.scanner_agent:agent_scanner',
+    'discovery': 'agents.discovery_agent:agent_discovery',
+})
+
+tasks = LazyRegistry({
+    'analyse': 'tasks.analyse_task:stock_analysis',
+    'trade': 'tasks.trade_task:trade_execution',
+    'scan': 'tasks.scan_task:market_scan',
+    'discovery': 'tasks.discovery_task:stock_discovery',
+})
+
+
+def new_crew(agent_names: List[str], crew_tasks: List[Any], **kwargs: Any) -> Any:
+    """A Crew over registered agents; crewai is only imported here."""
+    from crewai import Crew
+
+    kwargs.setdefault("verbose", True)
+    return Crew(agents=[agents[name] for name in agent_names], tasks=crew_tasks, **kwargs)
+
+
+def _discovery_crew():
+    from tasks.discovery_task import comprehensive_market_discovery
+    return new_crew(['discovery'], [comprehensive_market_discovery()])
+
+
+def _market_scan_crew():
+    from tasks.scan_task import market_scan_analysis
+    return new_crew(['scanner'], [market_scan_analysis()])
+
+
+crews = LazyRegistry({
+    'stock': 'crew:agent_crew',
+    'discovery': _discovery_crew,
+    'market_scan': _market_scan_crew,
+})
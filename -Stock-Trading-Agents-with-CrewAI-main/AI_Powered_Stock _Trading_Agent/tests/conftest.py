@@ -0,0 +1,14 @@
+import os
+import sys
+
+import pytest
+
+# Tests import the app's modules the way the entry points do (tools.x, agents.x), from the app directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(autouse=True)
+def isolated_data(tmp_path, monkeypatch):
+    """Keeps the token log and the quote cache out of data/, even after something has imported config."""
+    monkeypatch.setenv('TOOL_OUTPUT_TOKEN_LOG', str(tmp_path / 'tool_tokens.jsonl'))
+    monkeypatch.setenv('QUOTE_CACHE_DB', str(tmp_path / 'quotes.sqlite'))
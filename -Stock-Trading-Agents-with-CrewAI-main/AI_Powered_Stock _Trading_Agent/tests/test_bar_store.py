@@ -0,0 +1,109 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tools.bar_store import BAR_DTYPE, BarStore, frame_to_bars
+from tools.data_providers import MarketDataProvider, set_provider
+
+
+def make_bars(start: str, days: int, close: float = 1.0) -> np.ndarray:
+    bars = np.zeros(days, dtype=BAR_DTYPE)
+    bars["date"] = np.arange(np.datetime64(start, "D"), np.datetime64(start, "D") + days)
+    bars["close"] = close + np.arange(days)
+    bars["volume"] = 1000.0
+    return bars
+
+
+@pytest.fixture
+def store(tmp_path):
+    return BarStore(str(tmp_path / "bars"))
+
+
+@pytest.mark.parametrize("version", [(1, 0), (2, 0), (3, 0)])
+def test_tail_reads_every_npy_header_version(store, version):
+    bars = make_bars("2026-01-01", 50)
+    with open(store.path("TLRY"), "wb") as f:
+        np.lib.format.write_array(f, bars, version=version)
+
+    assert np.array_equal(store.tail("TLRY", 7), bars[-7:])
+    assert np.array_equal(store.tail("TLRY", 500), bars)
+    assert np.array_equal(store.tail("TLRY", 7), store.window("TLRY", 7))
+
+
+def test_tail_of_unknown_symbol_is_empty(store):
+    assert len(store.tail("NOPE", 5)) == 0
+    assert store.last_date("NOPE") is None
+
+
+def test_append_replaces_overlapping_days(store):
+    store.append("TLRY", make_bars("2026-01-01", 10))
+    store.append("TLRY", make_bars("2026-01-10", 3, close=100.0))
+
+    stored = store.read("TLRY")
+    assert len(stored) == 12
+    assert stored["close"][-3:].tolist() == [100.0, 101.0, 102.0]
+    assert store.last_date("TLRY") == np.datetime64("2026-01-12")
+    assert os.listdir(store.directory) == ["TLRY.npy"]  # No temp files left behind
+
+
+def test_matrix_aligns_symbols_on_dates(store):
+    store.append("AAA", make_bars("2026-01-01", 5))
+    store.append("BBB", make_bars("2026-01-03", 3, close=10.0))
+
+    dates, names, arrays = store.matrix(["aaa", "bbb", "ccc"], days=4)
+
+    assert names == ["AAA", "BBB"]
+    assert dates.tolist() == list(np.arange(np.datetime64("2026-01-02"), np.datetime64("2026-01-06")))
+    assert arrays["close"][:, 0].tolist() == [2.0, 3.0, 4.0, 5.0]
+    assert np.isnan(arrays["close"][0, 1])
+    assert arrays["close"][1:, 1].tolist() == [10.0, 11.0, 12.0]
+
+
+class HistoryProvider(MarketDataProvider):
+    def __init__(self, frame):
+        self.frame = frame
+        self.calls = []
+
+    def quote(self, symbol):
+        return {}
+
+    def history(self, symbols, period="5d", interval="1d", start=None):
+        self.calls.append((list(symbols), period, start))
+        return self.frame.loc[:, self.frame.columns.get_level_values(1).isin(symbols)]
+
+    def fundamentals(self, symbol):
+        return {}
+
+
+def provider_frame(start: str, days: int, symbols):
+    index = pd.date_range(start, periods=days, freq="D")
+    columns = pd.MultiIndex.from_product([["Open", "High", "Low", "Close", "Volume"], symbols])
+    return pd.DataFrame(1.0, index=index, columns=columns)
+
+
+def test_update_fetches_from_the_last_stored_day(store):
+    store.append("TLRY", make_bars("2026-01-01", 5))
+    provider = HistoryProvider(provider_frame("2026-01-05", 3, ["TLRY"]))
+    set_provider(provider)
+    try:
+        written = store.update(["TLRY", "SNDL"])
+    finally:
+        set_provider(None)
+
+    assert sorted(provider.calls, key=str) == sorted([(["TLRY"], "5d", "2026-01-05"), (["SNDL"], "1y", None)],
+                                                     key=str)
+    assert written == 3  # No history for SNDL
+    assert len(store.read("TLRY")) == 7
+    assert store.read("TLRY")["date"][-1] == np.datetime64("2026-01-07")
+
+
+def test_frame_to_bars_skips_symbols_without_closes():
+    frame = provider_frame("2026-01-01", 3, ["AAA", "BBB"])
+    frame[("Close", "BBB")] = np.nan
+
+    bars = frame_to_bars(frame)
+
+    assert list(bars) == ["AAA"]
+    assert len(bars["AAA"]) == 3
@@ -0,0 +1,55 @@
+import pandas as pd
+import pytest
+
+from tools.data_providers import MarketDataProvider, RecordReplayProvider
+
+
+class FakeProvider(MarketDataProvider):
+    name = "fake"
+
+    def quote(self, symbol):
+        return {"regularMarketPrice": 2.5, "symbol": symbol}
+
+    def history(self, symbols, period="5d", interval="1d", start=None):
+        columns = pd.MultiIndex.from_product([["Close"], list(symbols)])
+        return pd.DataFrame([[1.0] * len(symbols)], index=pd.to_datetime(["2026-10-16"]), columns=columns)
+
+    def fundamentals(self, symbol):
+        return {"sector": "Healthcare"}
+
+
+def test_provider_interface_is_abstract():
+    with pytest.raises(TypeError):
+        MarketDataProvider()
+
+    class QuoteOnly(MarketDataProvider):
+        def quote(self, symbol):
+            return {}
+
+    with pytest.raises(TypeError):
+        QuoteOnly()
+
+
+def test_replay_serves_what_was_recorded(tmp_path):
+    recorder = RecordReplayProvider(str(tmp_path), mode="record", source=FakeProvider())
+    recorded = recorder.history(["TLRY", "SNDL"])
+    recorder.quote("tlry")
+
+    replay = RecordReplayProvider(str(tmp_path))
+
+    pd.testing.assert_frame_equal(replay.history(["TLRY", "SNDL"]), recorded)
+    assert replay.quote("TLRY") == {"regularMarketPrice": 2.5, "symbol": "tlry"}
+
+
+def test_replay_raises_lookup_error_for_unrecorded_calls(tmp_path):
+    replay = RecordReplayProvider(str(tmp_path))
+
+    with pytest.raises(LookupError):
+        replay.history(["NIO"])
+    with pytest.raises(LookupError):
+        replay.fundamentals("NIO")
+
+
+def test_record_mode_needs_a_source(tmp_path):
+    with pytest.raises(ValueError):
+        RecordReplayProvider(str(tmp_path), mode="record")
@@ -0,0 +1,22 @@
+from datetime import date
+
+from tools import earnings_calendar
+from tools.earnings_calendar import EarningsCalendar
+
+
+def test_index_reloads_after_another_process_refreshes(tmp_path, monkeypatch):
+    today = date.today().isoformat()
+    reports = {"TLRY": 1e9}
+    monkeypatch.setattr(earnings_calendar, "fetch_calendar_day",
+                        lambda day: [(symbol, day, None, None, None, cap) for symbol, cap in reports.items()
+                                     if day == today])
+    path = str(tmp_path / "earnings.sqlite")
+    reader = EarningsCalendar(path)
+    daemon = EarningsCalendar(path)  # Stands in for the prefetch daemon writing the same database
+
+    daemon.refresh(days_ahead=0)
+    assert [report["symbol"] for report in reader.upcoming(days=0)] == ["TLRY"]
+
+    reports["SNDL"] = 2e9
+    daemon.refresh(days_ahead=0, max_age=0)
+    assert [report["symbol"] for report in reader.upcoming(days=0)] == ["SNDL", "TLRY"]
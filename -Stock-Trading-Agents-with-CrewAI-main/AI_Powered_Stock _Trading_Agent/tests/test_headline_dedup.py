@@ -0,0 +1,94 @@
+import json
+import threading
+
+import pytest
+
+from tools.headline_dedup import HeadlineDeduplicator, entity_key, normalize
+
+ORIGINAL = "Tilray shares jump 12% after earnings beat"
+
+
+@pytest.fixture
+def dedup(tmp_path):
+    return HeadlineDeduplicator(str(tmp_path / "seen.json"))
+
+
+def test_normalize_drops_publisher_tag():
+    assert normalize("Tilray shares jump 12% after earnings beat - Reuters") == "tilray shares jump 12% after earnings beat"
+
+
+def test_entity_key_is_tickers_and_figures_ignoring_case():
+    assert entity_key("Tilray (TLRY) Shares Jump 12%") == entity_key("tilray $tlry shares jump 12%") == "12% tlry"
+    assert entity_key("SHARES OF TILRY JUMP 12%") == "12%"
+
+
+@pytest.mark.parametrize("copy", [
+    "Tilray shares jump 12% after earnings beat - Reuters",
+    "Tilray Shares Jump 12% After Earnings Beat",
+    "Tilray Stock Jumps 12% Following Earnings Beat",
+    "Tilray shares jump 12% after quarterly earnings beat",
+    "Tilray stock jumps 12% following earnings beat",
+])
+def test_rewordings_are_one_story(dedup, copy):
+    stories = dedup.group([("Reuters", ORIGINAL), ("Yahoo", copy)])
+
+    assert len(stories) == 1
+    assert stories[0].sources == ["Reuters", "Yahoo"]
+    assert stories[0].text == ORIGINAL
+
+
+@pytest.mark.parametrize("other", [
+    "Sundial shares jump 12% after earnings beat",
+    "Sundial Shares Jump 12% After Earnings Beat",
+    "Tilray shares jump 21% after earnings beat",
+    "Tilray shares fall 12% after earnings miss",
+])
+def test_different_stories_stay_apart(dedup, other):
+    assert len(dedup.group([("Reuters", ORIGINAL), ("Yahoo", other)])) == 2
+
+
+def test_stories_persist_between_polls(tmp_path):
+    path = str(tmp_path / "seen.json")
+    first = HeadlineDeduplicator(path)
+    story, = first.group([("Reuters", ORIGINAL)])
+    assert story.new
+    first.remember(story, {"symbols": ["TLRY"]})
+    first.save()
+
+    again, = HeadlineDeduplicator(path).group([("Yahoo", "Tilray Stock Jumps 12% Following Earnings Beat")])
+
+    assert not again.new
+    assert again.data == {"symbols": ["TLRY"]}
+
+
+def test_expired_stories_are_forgotten(tmp_path):
+    path = str(tmp_path / "seen.json")
+    first = HeadlineDeduplicator(path, window=0)
+    first.group([("Reuters", ORIGINAL)])
+    first.save()
+
+    assert HeadlineDeduplicator(path).group([("Reuters", ORIGINAL)])[0].new
+
+
+def test_old_format_state_is_ignored(tmp_path):
+    path = tmp_path / "seen.json"
+    path.write_text(json.dumps({"abc": {"simhash": 1, "entities": "", "hashes": ["abc"],
+                                        "first_seen": 0, "last_seen": 0}}))
+
+    assert HeadlineDeduplicator(str(path)).group([("Reuters", ORIGINAL)])[0].new
+
+
+def test_concurrent_saves_leave_one_valid_file(tmp_path):
+    path = tmp_path / "seen.json"
+    savers = [HeadlineDeduplicator(str(path)) for _ in range(4)]
+    for number, saver in enumerate(savers):
+        saver.group([("Reuters", f"Tilray shares jump {number}% after earnings beat")])
+
+    threads = [threading.Thread(target=saver.save) for saver in savers for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert [entry.name for entry in tmp_path.iterdir()] == ["seen.json"]
+    assert len(json.loads(path.read_text())) == 1
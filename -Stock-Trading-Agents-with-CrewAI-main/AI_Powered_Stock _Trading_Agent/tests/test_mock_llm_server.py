@@ -0,0 +1,51 @@
+import pytest
+
+from mock_llm_server import Script, listed_tools
+
+TASK = "Analyze the stock: TSLA and decide whether to buy, sell or hold."
+
+
+def describe(name, arguments):
+    """A tool as crewai's BaseTool._generate_description() renders it in the agent prompt."""
+    schema = {argument: {"description": None, "type": kind} for argument, kind in arguments.items()}
+    return f"Tool Name: {name}\nTool Arguments: {schema}\nTool Description: {name} tool\n"
+
+
+def agent_prompt(descriptions):
+    return "You ONLY have access to the following tools:\n\n" + "\n".join(descriptions) + "\n" + TASK
+
+
+def test_symbol_arguments_are_filled_by_name():
+    prompt = agent_prompt([
+        describe("MarketPulse", {"stock_name": "str"}),
+        describe("MarketScanner", {"price_threshold": "float", "min_market_cap": "float", "symbols": "str"}),
+        describe("NewsDiscovery", {}),
+    ])
+    tools = listed_tools(prompt, None)
+    script = Script()
+
+    assert script.step(prompt, 0, tools) == {"action": "MarketPulse", "input": {"stock_name": "TSLA"}}
+    assert script.step(prompt, 1, tools) == {"action": "MarketScanner", "input": {"symbols": "TSLA"}}
+    assert script.step(prompt, 2, tools) == {"action": "NewsDiscovery", "input": {}}
+    assert "final" in script.step(prompt, 3, tools)
+
+
+def test_native_tool_parameters_are_filled_by_name():
+    request_tools = [{"type": "function", "function": {
+        "name": "MarketPulse",
+        "parameters": {"type": "object", "properties": {"stock_name": {"type": "string"}}, "required": ["stock_name"]},
+    }}]
+
+    step = Script().step(TASK, 0, listed_tools(TASK, request_tools))
+
+    assert step == {"action": "MarketPulse", "input": {"stock_name": "TSLA"}}
+
+
+def test_real_tool_descriptions():
+    pytest.importorskip("crewai")
+    from tools.stock_research_tool import stock_price
+
+    prompt = agent_prompt([stock_price.description])
+
+    assert Script().step(prompt, 0, listed_tools(prompt, None)) == {"action": "MarketPulse",
+                                                                    "input": {"stock_name": "TSLA"}}
@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+from tools.momentum import MAX_VOLUME_Z, rate_of_change, rsi, scan_momentum, volume_zscore
+
+# Wilder's worked example (StockCharts): RSI from the 15th close on
+WILDER_CLOSES = [44.34, 44.09, 44.15, 43.61, 44.33, 44.83, 45.10, 45.42, 45.84, 46.08, 45.89, 46.03,
+                 45.61, 46.28, 46.28, 46.00, 46.03, 46.41, 46.22]
+WILDER_RSI = [70.53, 66.32, 66.55, 69.41, 66.36]
+
+
+def test_rsi_matches_wilders_example():
+    for days, expected in zip(range(15, len(WILDER_CLOSES) + 1), WILDER_RSI):
+        close = np.array(WILDER_CLOSES[:days])[:, None]
+        assert rsi(close)[0] == pytest.approx(expected, abs=0.1)
+
+
+def test_rsi_is_computed_per_column():
+    close = np.column_stack([WILDER_CLOSES, WILDER_CLOSES[::-1]])
+    both = rsi(close)
+
+    assert both[0] == rsi(close[:, :1])[0]
+    assert both[1] == rsi(close[:, 1:])[0]
+
+
+def test_rsi_edge_cases():
+    rising = np.arange(1.0, 21.0)[:, None]
+    flat = np.ones((20, 1))
+
+    with np.errstate(divide="ignore", invalid="ignore"):  # As in scan_momentum()
+        assert rsi(rising)[0] == 100.0
+        assert rsi(flat)[0] == 50.0
+    assert np.isnan(rsi(np.ones((10, 1)))[0])
+
+
+def test_rsi_skips_missing_days():
+    close = np.array(WILDER_CLOSES + [np.nan, np.nan])[:, None]
+    assert rsi(close)[0] == pytest.approx(rsi(np.array(WILDER_CLOSES)[:, None])[0])
+
+
+def test_volume_zscore():
+    volume = np.column_stack([np.r_[[900.0, 1300.0] * 10, 1500.0], np.r_[[900.0, 1300.0] * 10, 1100.0]])
+
+    z = volume_zscore(volume)
+
+    assert z[0] == pytest.approx(2.0)
+    assert z[1] == pytest.approx(0.0)
+
+
+def test_volume_spike_after_flat_period_ranks_high():
+    volume = np.full((21, 3), 1000.0)
+    volume[-1] = [5000.0, 1000.0, 1050.0]
+
+    z = volume_zscore(volume)
+
+    assert z[0] == MAX_VOLUME_Z
+    assert z[1] == 0.0
+    assert 0 < z[2] < 1  # Within the floored deviation, not a spike
+
+
+def test_rate_of_change():
+    close = np.array([[10.0, 4.0], [11.0, 4.0], [12.0, 3.0]])
+
+    assert rate_of_change(close, 2).tolist() == pytest.approx([20.0, -25.0])
+    assert np.isnan(rate_of_change(close, 3)).all()
+
+
+def test_scan_momentum_ranks_volume_spikes_after_flat_periods():
+    days = 30
+    close = np.full((days, 3), 2.0)
+    close[-5:, 1] = [2.0, 2.1, 2.2, 2.3, 2.4]  # Steady climb on flat volume
+    close[:, 2] = 50.0  # Not a penny stock
+    volume = np.full((days, 3), 1e5)
+    volume[-1, 0] = 1e6  # Spike after a flat month
+    arrays = {"open": close.copy(), "close": close, "volume": volume}
+
+    movers = scan_momentum(["SPIKE", "CLIMB", "BIG"], arrays, max_price=5.0)
+
+    assert movers.index.tolist() == ["SPIKE", "CLIMB"]
+    assert movers.loc["SPIKE", "volume_z"] == MAX_VOLUME_Z
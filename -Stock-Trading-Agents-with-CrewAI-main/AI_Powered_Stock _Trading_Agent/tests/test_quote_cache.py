@@ -0,0 +1,98 @@
+import pytest
+
+from tools import quote_cache as quote_cache_module
+from tools.quote_cache import QuoteCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(quote_cache_module.time, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def cache(clock):
+    return QuoteCache(price_ttl=15, profile_ttl=3600, default_ttl=60)
+
+
+def test_each_field_expires_on_its_own_ttl(cache, clock):
+    cache.put("tlry", {"regularMarketPrice": 1.5, "sector": "Healthcare"})
+
+    clock.now += 10
+    assert cache.get("TLRY", ["regularMarketPrice", "sector"]) == {"regularMarketPrice": 1.5, "sector": "Healthcare"}
+
+    clock.now += 10  # Past the price TTL, well within the profile TTL
+    assert cache.get("TLRY", ["regularMarketPrice"]) is None
+    assert cache.get("TLRY", ["sector"]) == {"sector": "Healthcare"}
+
+    clock.now += 3600
+    assert cache.get("TLRY", ["sector"]) is None
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 2
+
+
+def test_get_or_fetch_refetches_only_when_a_field_is_stale(cache, clock):
+    calls = []
+
+    def fetch():
+        calls.append(clock.now)
+        return {"regularMarketPrice": 1.5 + len(calls), "sector": "Healthcare"}
+
+    assert cache.get_or_fetch("TLRY", ["sector"], fetch) == {"sector": "Healthcare"}
+    # The full fetch result was cached, so the price is served without a second fetch
+    assert cache.get_or_fetch("TLRY", ["regularMarketPrice"], fetch) == {"regularMarketPrice": 2.5}
+
+    clock.now += 20
+    assert cache.get_or_fetch("TLRY", ["sector"], fetch) == {"sector": "Healthcare"}
+    assert cache.get_or_fetch("TLRY", ["regularMarketPrice", "sector"], fetch) == {
+        "regularMarketPrice": 3.5, "sector": "Healthcare"}
+    assert len(calls) == 2
+
+
+def test_fields_the_source_lacks_are_cached_as_none(cache):
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return {"sector": "Healthcare"}
+
+    for _ in range(2):
+        assert cache.get_or_fetch("TLRY", ["dividendYield"], fetch) == {"dividendYield": None}
+    assert len(calls) == 1
+
+
+def test_least_recently_used_symbol_is_evicted(clock):
+    cache = QuoteCache(max_symbols=2)
+    cache.put("AAA", {"sector": "Tech"})
+    cache.put("BBB", {"sector": "Tech"})
+    cache.get("AAA", ["sector"])  # AAA is now the most recently used
+
+    cache.put("CCC", {"sector": "Tech"})
+
+    assert cache.get("BBB", ["sector"]) is None
+    assert cache.get("AAA", ["sector"]) is not None
+    assert cache.stats()["symbols"] == 2
+
+
+def test_sqlite_store_is_shared_across_instances(tmp_path, clock):
+    path = str(tmp_path / "quotes" / "quotes.sqlite")
+    writer = QuoteCache(path=path, price_ttl=15)
+    assert not (tmp_path / "quotes").exists()  # Nothing is created until the first write
+
+    writer.put("TLRY", {"regularMarketPrice": 1.5, "sector": "Healthcare"})
+
+    reader = QuoteCache(path=path, price_ttl=15)
+    assert reader.get("tlry", ["regularMarketPrice", "sector"]) == {"regularMarketPrice": 1.5,
+                                                                    "sector": "Healthcare"}
+
+    clock.now += 20  # Stored timestamps carry over, so the price expires in the new instance too
+    assert QuoteCache(path=path, price_ttl=15).get("TLRY", ["regularMarketPrice"]) is None
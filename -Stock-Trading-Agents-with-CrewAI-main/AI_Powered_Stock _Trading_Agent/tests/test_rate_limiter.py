@@ -0,0 +1,100 @@
+import threading
+import time
+
+import pytest
+
+from tools import rate_limiter
+from tools.rate_limiter import TokenBucket, background_priority, fetch_all, in_background, parse_limits
+
+
+def test_parse_limits():
+    assert parse_limits("yahoo.com=2:5, API.Nasdaq.com=1,bogus") == {
+        "yahoo.com": (2.0, 5.0),
+        "api.nasdaq.com": (1.0, 1.0),
+    }
+
+
+def test_burst_is_served_immediately_then_rate_limited():
+    bucket = TokenBucket(rate=20, capacity=3)
+
+    started = time.monotonic()
+    for _ in range(3):
+        bucket.acquire()
+    assert time.monotonic() - started < 0.05
+
+    bucket.acquire()
+    assert time.monotonic() - started >= 0.04
+
+
+def test_background_caller_yields_to_waiting_interactive_caller():
+    bucket = TokenBucket(rate=10, capacity=1)
+    bucket.acquire()  # Empty the bucket so both callers have to wait
+    order = []
+
+    def background():
+        bucket.acquire(background=True)
+        order.append("background")
+
+    def interactive():
+        bucket.acquire(background=False)
+        order.append("interactive")
+
+    threads = [threading.Thread(target=background)]
+    threads[0].start()
+    time.sleep(0.01)  # The background caller is already waiting when the interactive one arrives
+    threads.append(threading.Thread(target=interactive))
+    threads[1].start()
+    for thread in threads:
+        thread.join(timeout=2)
+
+    assert order == ["interactive", "background"]
+
+
+@pytest.fixture
+def limits(monkeypatch):
+    monkeypatch.setenv("RATE_LIMITS", "yahoo.com=2:5")
+    monkeypatch.setattr(rate_limiter, "_limits", None)
+    monkeypatch.setattr(rate_limiter, "_buckets", {})
+    monkeypatch.setattr(rate_limiter, "_buckets_by_host", {})
+
+
+def test_subdomains_share_the_configured_bucket(limits):
+    bucket = rate_limiter.limiter_for("https://query1.finance.yahoo.com/v8/finance/chart/NIO")
+
+    assert bucket is rate_limiter.limiter_for("feeds.finance.yahoo.com")
+    assert (bucket.rate, bucket.capacity) == (2.0, 5.0)
+    assert rate_limiter.limiter_for("notyahoo.com") is not bucket
+
+
+def test_rate_limits_are_parsed_once(limits, monkeypatch):
+    rate_limiter.limiter_for("yahoo.com")
+    monkeypatch.setattr(rate_limiter, "parse_limits", lambda spec: pytest.fail("RATE_LIMITS parsed again"))
+
+    rate_limiter.limiter_for("query2.finance.yahoo.com")
+
+
+def test_background_fetches_run_on_their_own_pool():
+    def where(_):
+        return threading.current_thread().name, in_background()
+
+    interactive = fetch_all(where, ["a"])["a"]
+    background = fetch_all(where, ["a"], background=True)["a"]
+    with background_priority():
+        inherited = fetch_all(where, ["a"])["a"]
+
+    assert interactive[0].startswith("fetch") and not interactive[1]
+    assert background[0].startswith("background-fetch") and background[1]
+    assert inherited[0].startswith("background-fetch") and inherited[1]
+    assert not in_background()
+
+
+def test_fetch_all_maps_failures_to_exceptions():
+    def fetch(item):
+        if item == "bad":
+            raise LookupError(item)
+        return item.upper()
+
+    results = fetch_all(fetch, ["ok", "bad", "ok"])
+
+    assert results["ok"] == "OK"
+    assert isinstance(results["bad"], LookupError)
@@ -0,0 +1,134 @@
+from contextlib import closing
+
+import numpy as np
+import pandas as pd
+
+from tools import market_data, quote_cache, screener
+from tools.data_providers import MarketDataProvider, set_provider
+from tools.quote_cache import QuoteCache
+from tools.screener import (GROWTH_CRITERIA, SECTOR_CRITERIA, detect_volume_spikes, load_fundamentals_frame,
+                            parse_symbols, screen)
+from tools.symbol_universe import SymbolUniverse
+
+
+def fundamentals(rows):
+    columns = ["price", "market_cap", "revenue_growth", "earnings_growth", "peg_ratio", "sector"]
+    return pd.DataFrame.from_dict(rows, orient="index", columns=columns)
+
+
+FRAME = fundamentals({
+    "ALL3": [3.0, 2e8, 0.30, 0.25, 0.8, "Healthcare"],    # Every signal: 5
+    "GROW": [4.0, 1e8, 0.20, 0.20, None, "Technology"],   # Revenue and earnings: 4
+    "PEG0": [2.0, 1e8, 0.20, None, 0.0, "Healthcare"],    # Revenue only, zero PEG scores nothing: 2
+    "WEAK": [1.0, 1e8, 0.05, 0.05, 3.0, "Healthcare"],    # Nothing: 0
+    "DEAR": [50.0, 1e9, 0.30, 0.30, 0.5, "Healthcare"],   # Over the price threshold
+    "NOPX": [None, 1e9, 0.30, 0.30, 0.5, "Healthcare"],   # No price
+})
+
+
+def test_parse_symbols():
+    assert parse_symbols(" nio, SNDL,NIO,, ") == ["NIO", "SNDL"]
+
+
+def test_screen_scores_filters_and_ranks():
+    result = screen(FRAME, price_threshold=5.0)
+
+    assert result.index.tolist() == ["ALL3", "GROW", "PEG0"]
+    assert result["growth_score"].tolist() == [5, 4, 2]
+
+
+def test_missing_values_never_pass_a_filter():
+    result = screen(FRAME, min_market_cap=5e8)
+
+    assert result.index.tolist() == ["DEAR"]
+
+
+def test_sector_filter_ignores_case():
+    result = screen(FRAME, price_threshold=5.0, sector="healthcare", criteria=SECTOR_CRITERIA)
+
+    # Sector criteria weigh revenue and earnings growth over 15% at 3 each and a PEG under 1.2 at 2
+    assert result.index.tolist() == ["ALL3", "PEG0"]
+    assert result["growth_score"].tolist() == [8, 3]
+
+
+def test_top_n_keeps_the_best():
+    # Every fifth stock has all three signals, the rest only revenue and earnings growth
+    frame = fundamentals({f"S{i}": [1.0, 1e8, 0.2, 0.2, 0.5 if i % 5 == 0 else None, "Tech"] for i in range(30)})
+
+    result = screen(frame, top_n=4)
+
+    assert result["growth_score"].tolist() == [5, 5, 5, 5]
+    assert set(result.index) <= {f"S{i}" for i in range(0, 30, 5)}
+
+
+def test_empty_frame():
+    result = screen(fundamentals({}), criteria=GROWTH_CRITERIA)
+
+    assert result.empty
+    assert "growth_score" in result.columns
+
+
+def bars(volumes, closes):
+    index = pd.date_range("2026-09-01", periods=len(volumes), freq="B")
+    symbols = list(volumes[0])
+    columns = pd.MultiIndex.from_product([["Close", "Volume"], symbols])
+    data = [[day_closes[s] for s in symbols] + [day_volumes[s] for s in symbols]
+            for day_closes, day_volumes in zip(closes, volumes)]
+    return pd.DataFrame(data, index=index, columns=columns)
+
+
+def test_detect_volume_spikes():
+    volumes = [{"SPIK": 100.0, "FLAT": 100.0, "NEW": np.nan}] * 4 + [{"SPIK": 500.0, "FLAT": 110.0, "NEW": 900.0}]
+    closes = [{"SPIK": 1.0, "FLAT": 2.0, "NEW": np.nan}] * 4 + [{"SPIK": 1.5, "FLAT": 2.0, "NEW": 3.0}]
+
+    spikes = detect_volume_spikes(bars(volumes, closes), min_ratio=2.0)
+
+    assert spikes.index.tolist() == ["SPIK"]
+    assert spikes.loc["SPIK", "volume_ratio"] == 5.0
+    assert spikes.loc["SPIK", "price_change"] == 0.5
+
+
+def test_detect_volume_spikes_needs_two_days():
+    assert detect_volume_spikes(bars([{"A": 1.0}], [{"A": 1.0}])).empty
+
+
+class FundamentalsProvider(MarketDataProvider):
+    def __init__(self):
+        self.calls = []
+
+    def quote(self, symbol):
+        raise AssertionError("the screener never needs a live quote")
+
+    def history(self, symbols, period="5d", interval="1d", start=None):
+        raise AssertionError("the screener never needs history")
+
+    def fundamentals(self, symbol):
+        self.calls.append(symbol)
+        return {"regularMarketPrice": 2.0, "marketCap": 3e8, "revenueGrowth": 0.3,
+                "earningsQuarterlyGrowth": 0.2, "pegRatio": 0.9, "sector": "Healthcare"}
+
+
+def test_repeated_screens_stay_local(tmp_path, monkeypatch):
+    clock = [1_000_000.0]
+    monkeypatch.setattr(quote_cache.time, "time", lambda: clock[0])
+    monkeypatch.setattr(market_data, "quote_cache", QuoteCache(price_ttl=15, profile_ttl=3600))
+
+    universe = SymbolUniverse(str(tmp_path / "universe.sqlite"))
+    with closing(universe._connect()) as conn, conn:
+        conn.executemany("INSERT INTO symbols (symbol, listed_at) VALUES (?, ?)", [("TLRY", 1.0), ("SNDL", 1.0)])
+    universe.record_profiles([("Healthcare", None, 1.5, 1e9, 1.0, "TLRY")])  # SNDL is listed but not enriched
+    monkeypatch.setattr(screener, "get_symbol_universe", lambda: universe)
+
+    provider = FundamentalsProvider()
+    set_provider(provider)
+    try:
+        first = load_fundamentals_frame(["tlry", "SNDL"])
+        clock[0] += 600  # Prices have long expired, profiles have not
+        second = load_fundamentals_frame(["TLRY", "SNDL"])
+    finally:
+        set_provider(None)
+
+    assert sorted(provider.calls) == ["SNDL", "TLRY"]
+    assert first.loc["TLRY", "price"] == 1.5  # From the universe, not the fundamentals
+    assert second.loc["SNDL", "price"] == 2.0  # Written back to the universe by the first screen
+    pd.testing.assert_frame_equal(first.sort_index(), second.sort_index())
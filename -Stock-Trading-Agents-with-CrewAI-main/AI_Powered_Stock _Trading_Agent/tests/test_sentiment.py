@@ -0,0 +1,53 @@
+import pytest
+
+from tools.sentiment import inflections, score_text, score_texts
+
+
+@pytest.mark.parametrize("word, expected", [
+    ("jump", ["jump", "jumps", "jumped", "jumping"]),
+    ("surge", ["surge", "surges", "surged", "surging"]),
+    ("drop", ["drop", "drops", "dropped", "dropping"]),
+    ("crash", ["crash", "crashes", "crashed", "crashing"]),
+])
+def test_inflections(word, expected):
+    assert inflections(word) == expected
+
+
+def test_irregular_forms():
+    assert {"rose", "risen"} <= set(inflections("rise"))
+    assert {"fell", "fallen"} <= set(inflections("fall"))
+    assert "won" in inflections("win")
+
+
+@pytest.mark.parametrize("headline, expected", [
+    ("Shares dropped", -1.0),
+    ("Shares dropping", -1.0),
+    ("Shares winning", 1.0),
+    ("Shares won", 1.0),
+    ("Shares rose", 1.0),
+    ("Shares fell", -1.0),
+    ("Stock jumps after earnings beat", 1.0),
+    ("Stock plunges after earnings miss", -1.0),
+])
+def test_headline_polarity(headline, expected):
+    assert score_text(headline) == expected
+
+
+def test_mixed_headline_is_balanced():
+    assert score_text("Revenue jumps but shares drop") == pytest.approx(1 / 3)
+
+
+def test_keywords_match_whole_words_only():
+    # 'up' inside 'update' is activity, not a positive keyword
+    assert score_text("Company posts an update") == 0.1
+    assert score_text("Nothing to see here") == 0.0
+
+
+def test_listed_keyword_wins_over_inflection():
+    # 'news' is an activity word, not a form of 'new'
+    assert score_text("News") == 0.1
+
+
+def test_score_texts_matches_score_text():
+    texts = ["Shares dropped", "Shares winning", "Nothing"]
+    assert score_texts(texts) == [score_text(text) for text in texts]
@@ -0,0 +1,32 @@
+from tools.ticker_extractor import TickerExtractor
+
+KNOWN = frozenset({"TLRY", "SNDL", "BRK-B", "AI"})
+
+
+def test_extracts_listed_tickers_in_order():
+    extractor = TickerExtractor(KNOWN)
+
+    assert extractor.extract("SNDL and TLRY rally; TLRY leads, XYZW lags") == ["SNDL", "TLRY"]
+
+
+def test_stopwords_need_a_cashtag():
+    extractor = TickerExtractor(KNOWN)
+
+    assert extractor.extract("AI stocks rally") == []
+    assert extractor.extract("$AI stocks rally") == ["AI"]
+
+
+def test_share_classes_use_yahoo_format():
+    assert TickerExtractor(KNOWN).extract("BRK.B hits a record") == ["BRK-B"]
+
+
+def test_cashtags_only():
+    assert TickerExtractor(KNOWN).extract("TLRY and $SNDL", cashtags_only=True) == ["SNDL"]
+
+
+def test_without_a_universe_only_cashtags_count():
+    extractor = TickerExtractor()
+
+    assert not extractor.ready
+    assert extractor.extract("BREAKING: HUGE GAINS FOR TLRY as $SNDL jumps") == ["SNDL"]
+    assert TickerExtractor(KNOWN).ready
@@ -0,0 +1,44 @@
+from tools.tool_output import ToolResult, format_number, render
+
+
+def test_prices_keep_their_cents():
+    assert format_number(229.99) == "229.99"
+    assert format_number(225.01) == "225.01"
+    assert format_number(227.52) == "227.52"
+    assert format_number(3412.37) == "3412.37"
+    assert format_number(3412.0) == "3412"
+
+
+def test_small_ratios_keep_significant_digits():
+    assert format_number(0.03456) == "0.03456"
+    assert format_number(-0.5) == "-0.5"
+
+
+def test_only_humanized_columns_are_shortened():
+    result = ToolResult("MarketPulse", "Quotes", ["Symbol", "Price", "Volume"], humanize=["Volume"])
+    result.add("AZO", 3412.37, 12345678)
+
+    output = render(result, fmt="tsv", token_budget=0)
+
+    assert output.splitlines()[2] == "AZO\t3412.37\t12.3M"
+
+
+def test_missing_values_render_as_dash():
+    result = ToolResult("MarketPulse", "Quotes", ["Symbol", "Price"])
+    result.add("NIO", None)
+    result.add("SNDL", float("nan"))
+
+    rows = render(result, fmt="tsv", token_budget=0).splitlines()[2:]
+
+    assert rows == ["NIO\t-", "SNDL\t-"]
+
+
+def test_token_budget_drops_rows_from_the_end():
+    result = ToolResult("MarketPulse", "Quotes", ["Symbol", "Price"])
+    for i in range(200):
+        result.add(f"S{i}", 1.5)
+
+    output = render(result, fmt="tsv", token_budget=100)
+
+    assert "more rows omitted to fit the token budget" in output
+    assert "S0\t1.5" in output and "S199" not in output
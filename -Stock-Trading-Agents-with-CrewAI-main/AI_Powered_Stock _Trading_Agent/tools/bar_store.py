@@ -0,0 +1,237 @@
+import os
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from tools.data_providers import get_provider
+
+# One row per trading day, stored as a flat .npy file per symbol so it can be memory-mapped
+BAR_DTYPE = np.dtype([
+    ("date", "datetime64[D]"),
+    ("open", "f8"),
+    ("high", "f8"),
+    ("low", "f8"),
+    ("close", "f8"),
+    ("volume", "f8"),
+])
+
+# Provider frame field -> bar store column
+FIELDS = {"Open": "open", "High": "high", "Low": "low", "Close": "close", "Volume": "volume"}
+
+
+class BarStore:
+    """
+    Local daily OHLCV history, one memory-mapped .npy file per symbol.
+
+    update() only asks the provider for bars from the last stored day onward
+    (that day is refetched because it may have been stored mid-session), so a
+    daily rescan of a large universe downloads one or two bars per symbol.
+    read() and window() return read-only views of the mapped file without copying.
+
+    Symbols updated less than max_age seconds ago are not fetched again, so when
+    the prefetch daemon keeps the store current, scanners read it without any
+    network call.
+    """
+
+    def __init__(self, directory: str, max_age: float = 0.0):
+        self.directory = directory
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, symbol: str) -> str:
+        return os.path.join(self.directory, f"{symbol.upper()}.npy")
+
+    def read(self, symbol: str) -> np.ndarray:
+        """All stored bars of a symbol, oldest first, as a read-only memory map."""
+        path = self.path(symbol)
+        if not os.path.exists(path):
+            return np.empty(0, dtype=BAR_DTYPE)
+        return np.load(path, mmap_mode="r")
+
+    def window(self, symbol: str, days: int) -> np.ndarray:
+        """The last days bars of a symbol, as a view into the memory map."""
+        return self.read(symbol)[-days:]
+
+    def tail(self, symbol: str, days: int) -> np.ndarray:
+        """
+        A copy of the last days bars, read straight from the file. Every file
+        holds BAR_DTYPE rows, so the .npy header is only measured, not parsed;
+        parsing it costs more than reading a short window.
+        """
+        try:
+            with open(self.path(symbol), "rb") as f:
+                prefix = f.read(12)
+                if prefix[6] == 1:
+                    offset = 10 + int.from_bytes(prefix[8:10], "little")
+                else:
+                    offset = 12 + int.from_bytes(prefix[8:12], "little")
+                count = (os.fstat(f.fileno()).st_size - offset) // BAR_DTYPE.itemsize
+                start = max(0, count - days)
+                f.seek(offset + start * BAR_DTYPE.itemsize)
+                return np.fromfile(f, dtype=BAR_DTYPE, count=count - start)
+        except FileNotFoundError:
+            return np.empty(0, dtype=BAR_DTYPE)
+
+    def last_date(self, symbol: str) -> Optional[np.datetime64]:
+        bars = self.tail(symbol, 1)
+        return bars["date"][-1] if len(bars) else None
+
+    def age(self, symbol: str) -> float:
+        """Seconds since the symbol was last updated; infinite if it has no history."""
+        try:
+            return time.time() - os.path.getmtime(self.path(symbol))
+        except OSError:
+            return float("inf")
+
+    def append(self, symbol: str, bars: np.ndarray) -> int:
+        """
+        Merges new bars into the stored history. Stored days that also appear in
+        bars are replaced. Returns the number of bars added or refreshed.
+        """
+        if not len(bars):
+            return 0
+
+        with self._lock:
+            stored = np.array(self.read(symbol))  # Copy so the old mapping can be released before the replace
+            first_new = bars["date"].min()
+            merged = np.concatenate([stored[stored["date"] < first_new], bars])
+
+            # A unique temp file: other processes may be writing the same symbol
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, prefix=symbol.upper() + ".", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    np.save(f, merged)
+                os.replace(temp_path, self.path(symbol))
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+
+        return len(bars)
+
+    def update(self, symbols: Iterable[str], lookback: str = "1y", max_age: Optional[float] = None) -> int:
+        """
+        Brings the stored history of every symbol up to date.
+        Symbols with the same last stored day are fetched together in one bulk
+        request; symbols without history get lookback worth of bars. Symbols
+        updated within max_age seconds (the store's max_age by default) are skipped.
+        Returns the number of bars written.
+        """
+        max_age = self.max_age if max_age is None else max_age
+        groups: Dict[Optional[str], List[str]] = defaultdict(list)
+        for symbol in symbols:
+            if max_age and self.age(symbol) < max_age:
+                continue
+            last = self.last_date(symbol)
+            groups[str(last) if last is not None else None].append(symbol.upper())
+
+        written = 0
+        provider = get_provider()
+        for start, group in groups.items():
+            if start is None:
+                frame = provider.history(group, period=lookback, interval="1d")
+            else:
+                frame = provider.history(group, interval="1d", start=start)
+
+            for symbol, bars in frame_to_bars(frame).items():
+                written += self.append(symbol, bars)
+
+            # Mark the whole group as checked, including symbols without a new bar
+            for symbol in group:
+                if os.path.exists(self.path(symbol)):
+                    os.utime(self.path(symbol))
+
+        return written
+
+    def frame(self, symbols: Iterable[str], days: int) -> pd.DataFrame:
+        """
+        The last days bars of several symbols as one wide frame with (field, symbol)
+        columns, the same shape provider.history() returns.
+        """
+        series = {}
+        for symbol in symbols:
+            bars = self.window(symbol, days)
+            if not len(bars):
+                continue
+            index = pd.DatetimeIndex(bars["date"])
+            for field, column in FIELDS.items():
+                series[(field, symbol.upper())] = pd.Series(bars[column], index=index)
+
+        if not series:
+            return pd.DataFrame(columns=pd.MultiIndex.from_tuples([], names=["Price", "Ticker"]))
+
+        frame = pd.DataFrame(series).sort_index(axis=1)
+        return frame.iloc[-days:]
+
+    def matrix(self, symbols: Iterable[str], days: int) -> Tuple[np.ndarray, List[str], Dict[str, np.ndarray]]:
+        """
+        The last days trading days of several symbols as plain 2-D arrays, for
+        scans over thousands of symbols where building a DataFrame would dominate.
+
+        Returns (dates, symbols, arrays): arrays maps each bar column (open, high,
+        low, close, volume) to a days x symbols float array aligned on dates, with
+        NaN where a symbol has no bar. Symbols without stored bars are left out.
+        """
+        windows = {}
+        for symbol in symbols:
+            bars = self.tail(symbol, days)
+            if len(bars):
+                windows[symbol.upper()] = bars
+
+        names = list(windows)
+        if not names:
+            return np.empty(0, dtype="datetime64[D]"), [], {column: np.empty((0, 0)) for column in FIELDS.values()}
+
+        dates = np.unique(np.concatenate([bars["date"] for bars in windows.values()]))[-days:]
+        arrays = {column: np.full((len(dates), len(names)), np.nan) for column in FIELDS.values()}
+
+        for j, symbol in enumerate(names):
+            bars = windows[symbol]
+            bars = bars[bars["date"] >= dates[0]]
+            rows = np.searchsorted(dates, bars["date"])
+            for column in FIELDS.values():
+                arrays[column][rows, j] = bars[column]
+
+        return dates, names, arrays
+
+
+def frame_to_bars(frame: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """Splits a wide (field, symbol) provider frame into one BAR_DTYPE array per symbol."""
+    result = {}
+    if frame is None or frame.empty:
+        return result
+
+    dates = frame.index.values.astype("datetime64[D]")
+    for symbol in frame.columns.get_level_values(1).unique():
+        close = frame[("Close", symbol)].to_numpy(dtype=float)
+        has_bar = ~np.isnan(close)
+        if not has_bar.any():
+            continue
+
+        bars = np.empty(int(has_bar.sum()), dtype=BAR_DTYPE)
+        bars["date"] = dates[has_bar]
+        for field, column in FIELDS.items():
+            bars[column] = frame[(field, symbol)].to_numpy(dtype=float)[has_bar]
+        result[symbol] = bars
+
+    return result
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_bar_store() -> BarStore:
+    """Process-wide bar store rooted at BAR_STORE_DIR, skipping symbols updated within BAR_STORE_MAX_AGE seconds."""
+    global _store
+
+    with _store_lock:
+        if _store is None:
+            _store = BarStore(os.getenv('BAR_STORE_DIR', os.path.join('data', 'bars')),
+                              max_age=float(os.getenv('BAR_STORE_MAX_AGE', '0')))
+        return _store
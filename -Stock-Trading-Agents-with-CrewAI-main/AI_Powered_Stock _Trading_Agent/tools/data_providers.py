@@ -0,0 +1,209 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+from tools.rate_limiter import limiter_for
+
+# .info keys that the lightweight quote path (yfinance fast_info) can answer,
+# mapped to the fast_info attribute that holds them
+FAST_FIELDS = {
+    "regularMarketPrice": "last_price",
+    "regularMarketPreviousClose": "previous_close",
+    "marketCap": "market_cap",
+    "dayHigh": "day_high",
+    "dayLow": "day_low",
+    "regularMarketVolume": "last_volume",
+    "currency": "currency",
+}
+
+# Fields computed from the fast quote rather than read from it
+DERIVED_FIELDS = ("regularMarketChange", "regularMarketChangePercent")
+
+# Every field a provider's quote() returns
+QUOTE_FIELDS = tuple(FAST_FIELDS) + DERIVED_FIELDS
+
+
+class MarketDataProvider(ABC):
+    """
+    Interface every market data source implements.
+
+    quote()        - lightweight live quote with the QUOTE_FIELDS keys
+    history()      - daily bars for one or more symbols as a single wide frame
+                     with (field, symbol) columns, like yf.download(group_by="column")
+    fundamentals() - full company profile dictionary with .info-style keys
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def quote(self, symbol: str) -> Dict[str, Any]:
+        ...
+
+    @abstractmethod
+    def history(self, symbols: List[str], period: str = "5d", interval: str = "1d",
+                start: Optional[str] = None) -> pd.DataFrame:
+        ...
+
+    @abstractmethod
+    def fundamentals(self, symbol: str) -> Dict[str, Any]:
+        ...
+
+
+class YFinanceProvider(MarketDataProvider):
+    """Live data from Yahoo Finance through yfinance."""
+
+    name = "yfinance"
+    host = "yahoo.com"
+
+    def __init__(self):
+        import yfinance as yf
+        self.yf = yf
+
+    def quote(self, symbol: str) -> Dict[str, Any]:
+        limiter_for(self.host).acquire()
+        fast_info = self.yf.Ticker(symbol).fast_info
+        data = {}
+
+        for field, attribute in FAST_FIELDS.items():
+            try:
+                data[field] = fast_info[attribute]
+            except Exception:
+                data[field] = None  # Unknown symbols and missing history raise here
+
+        price = data.get("regularMarketPrice")
+        previous = data.get("regularMarketPreviousClose")
+        if price is not None and previous:
+            data["regularMarketChange"] = price - previous
+            data["regularMarketChangePercent"] = (price - previous) / previous * 100
+        else:
+            data["regularMarketChange"] = None
+            data["regularMarketChangePercent"] = None
+
+        return data
+
+    def history(self, symbols: List[str], period: str = "5d", interval: str = "1d",
+                start: Optional[str] = None) -> pd.DataFrame:
+        limiter_for(self.host).acquire()
+        period_args = {"start": start} if start else {"period": period}
+        return self.yf.download(list(symbols), interval=interval, group_by="column",
+                                auto_adjust=False, progress=False, **period_args)
+
+    def fundamentals(self, symbol: str) -> Dict[str, Any]:
+        limiter_for(self.host).acquire()
+        return dict(self.yf.Ticker(symbol).info)
+
+
+class RecordReplayProvider(MarketDataProvider):
+    """
+    Wraps another provider and keeps its responses on disk.
+
+    mode="record" calls the wrapped provider and writes every response to
+    directory. mode="replay" serves responses from directory only and raises
+    LookupError for anything that was never recorded, so runs are fully offline
+    and deterministic. latency adds a fixed delay to every replayed call for
+    benchmarks that should look like a network source.
+    """
+
+    name = "replay"
+
+    def __init__(self, directory: str, mode: str = "replay",
+                 source: Optional[MarketDataProvider] = None, latency: float = 0.0):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown record/replay mode: {mode}")
+        if mode == "record" and source is None:
+            raise ValueError("Record mode needs a source provider")
+
+        self.directory = directory
+        self.mode = mode
+        self.source = source
+        self.latency = latency
+        self._lock = threading.Lock()
+
+    def quote(self, symbol: str) -> Dict[str, Any]:
+        return self._json_call("quote", symbol.upper(), lambda: self.source.quote(symbol))
+
+    def fundamentals(self, symbol: str) -> Dict[str, Any]:
+        return self._json_call("fundamentals", symbol.upper(), lambda: self.source.fundamentals(symbol))
+
+    def history(self, symbols: List[str], period: str = "5d", interval: str = "1d",
+                start: Optional[str] = None) -> pd.DataFrame:
+        key = hashlib.sha1(json.dumps([list(symbols), period, interval, start]).encode()).hexdigest()
+        path = self._path("history", key, ".pkl")
+
+        if self.mode == "record":
+            frame = self.source.history(symbols, period=period, interval=interval, start=start)
+            with self._lock:
+                frame.to_pickle(path)
+            return frame
+
+        self._replay_delay()
+        if not os.path.exists(path):
+            raise LookupError(f"No recorded history for {','.join(symbols)} ({period or start}, {interval})")
+        return pd.read_pickle(path)
+
+    def _json_call(self, kind: str, key: str, fetch):
+        path = self._path(kind, key, ".json")
+
+        if self.mode == "record":
+            data = fetch()
+            with self._lock:
+                with open(path, "w", encoding="utf-8") as f:
+                    json.dump(data, f, default=str, sort_keys=True)
+            return data
+
+        self._replay_delay()
+        if not os.path.exists(path):
+            raise LookupError(f"No recorded {kind} for {key}")
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def _path(self, kind: str, key: str, extension: str) -> str:
+        folder = os.path.join(self.directory, kind)
+        os.makedirs(folder, exist_ok=True)
+        return os.path.join(folder, key + extension)
+
+    def _replay_delay(self):
+        if self.latency:
+            time.sleep(self.latency)
+
+
+_provider = None
+_provider_lock = threading.Lock()
+
+
+def get_provider() -> MarketDataProvider:
+    """
+    Returns the process-wide provider selected by MARKET_DATA_PROVIDER:
+    'yfinance' (live), 'record' (live, saving responses) or 'replay' (offline).
+    """
+    global _provider
+
+    with _provider_lock:
+        if _provider is None:
+            kind = os.getenv('MARKET_DATA_PROVIDER', 'yfinance').lower()
+            directory = os.getenv('MARKET_DATA_REPLAY_DIR', 'market_data_replay')
+            latency = float(os.getenv('MARKET_DATA_REPLAY_LATENCY', '0'))
+
+            if kind == "yfinance":
+                _provider = YFinanceProvider()
+            elif kind == "record":
+                _provider = RecordReplayProvider(directory, mode="record", source=YFinanceProvider())
+            elif kind == "replay":
+                _provider = RecordReplayProvider(directory, mode="replay", latency=latency)
+            else:
+                raise ValueError(f"Unknown MARKET_DATA_PROVIDER: {kind}")
+
+        return _provider
+
+
+def set_provider(provider: Optional[MarketDataProvider]) -> None:
+    """Replaces the process-wide provider; None goes back to the configured one."""
+    global _provider
+    with _provider_lock:
+        _provider = provider
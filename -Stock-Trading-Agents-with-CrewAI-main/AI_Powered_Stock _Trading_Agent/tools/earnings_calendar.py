@@ -0,0 +1,214 @@
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import requests
+
+from tools.rate_limiter import background_priority, fetch_all, limiter_for
+
+# Nasdaq's public earnings calendar: every company reporting on one date in one response
+CALENDAR_URL = "https://api.nasdaq.com/api/calendar/earnings"
+CALENDAR_HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; StockDiscoveryBot/1.0)", "Accept": "application/json"}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS earnings (
+    symbol TEXT NOT NULL,
+    report_date TEXT NOT NULL,
+    name TEXT,
+    time TEXT,
+    eps_forecast REAL,
+    market_cap REAL,
+    PRIMARY KEY (symbol, report_date)
+);
+CREATE TABLE IF NOT EXISTS calendar_days (
+    report_date TEXT PRIMARY KEY,
+    fetched_at REAL
+);
+"""
+
+
+class EarningsCalendar:
+    """
+    Local earnings calendar: who reports on which day.
+
+    refresh() downloads one calendar page per day (not one request per symbol)
+    for the days that are missing or stale and stores them in SQLite. Lookups
+    go through an in-memory index of report dates, sorted again only when a
+    refresh by this process or another one (the prefetch daemon) has stored
+    new days, so 'reporting in the next N days' is two binary searches and a slice.
+    Only one refresh runs at a time: a caller arriving while another refresh is
+    in flight waits for it and then only fetches what is still stale.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._index: Optional[Dict[str, np.ndarray]] = None
+        self._index_fetched_at: Optional[float] = None
+        self._refresher: Optional[threading.Thread] = None
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    # Lookups
+
+    def between(self, start: date, end: date) -> List[Dict[str, Any]]:
+        """Every report from start to end inclusive, in date order."""
+        index = self._load_index()
+        dates = index["date"]
+        low = np.searchsorted(dates, np.datetime64(start, "D"), side="left")
+        high = np.searchsorted(dates, np.datetime64(end, "D"), side="right")
+
+        return [{
+            "symbol": index["symbol"][i],
+            "date": str(dates[i]),
+            "time": index["time"][i],
+            "eps_forecast": index["eps_forecast"][i],
+            "market_cap": index["market_cap"][i],
+        } for i in range(low, high)]
+
+    def upcoming(self, days: int = 30) -> List[Dict[str, Any]]:
+        today = date.today()
+        return self.between(today, today + timedelta(days=days))
+
+    # Refresh
+
+    def refresh(self, days_ahead: int = 30, max_age: float = 12 * 3600) -> int:
+        """Fetches the calendar for every day from today to days_ahead not fetched within max_age. Returns days fetched."""
+        with self._refresh_lock:
+            return self._refresh(days_ahead, max_age)
+
+    def _refresh(self, days_ahead: int, max_age: float) -> int:
+        today = date.today()
+        wanted = [(today + timedelta(days=offset)).isoformat() for offset in range(days_ahead + 1)]
+
+        with closing(self._connect()) as conn:
+            fresh = {row[0] for row in conn.execute(
+                "SELECT report_date FROM calendar_days WHERE fetched_at >= ?", (time.time() - max_age,))}
+        stale = [day for day in wanted if day not in fresh]
+        if not stale:
+            return 0
+
+        pages = fetch_all(fetch_calendar_day, stale)
+        fetched = {day: rows for day, rows in pages.items() if not isinstance(rows, Exception)}
+
+        with self._lock, closing(self._connect()) as conn:
+            with conn:
+                for day, rows in fetched.items():
+                    conn.execute("DELETE FROM earnings WHERE report_date = ?", (day,))
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO earnings (symbol, report_date, name, time, eps_forecast, market_cap) "
+                        "VALUES (?, ?, ?, ?, ?, ?)", rows)
+                    conn.execute("INSERT OR REPLACE INTO calendar_days (report_date, fetched_at) VALUES (?, ?)",
+                                 (day, time.time()))
+                # Reports more than a quarter old no longer matter
+                cutoff = (today - timedelta(days=90)).isoformat()
+                conn.execute("DELETE FROM earnings WHERE report_date < ?", (cutoff,))
+                conn.execute("DELETE FROM calendar_days WHERE report_date < ?", (cutoff,))
+            self._index = None
+
+        return len(fetched)
+
+    def refresh_in_background(self, interval: float = 6 * 3600, days_ahead: int = 30) -> threading.Thread:
+        """Starts a daemon thread that refreshes the calendar every interval seconds."""
+        if self._refresher is not None and self._refresher.is_alive():
+            return self._refresher
+
+        def loop():
+            while True:
+                try:
+                    with background_priority():
+                        self.refresh(days_ahead=days_ahead, max_age=interval)
+                except Exception:
+                    pass  # Network trouble; try again next cycle
+                time.sleep(interval)
+
+        self._refresher = threading.Thread(target=loop, name="earnings-calendar-refresh", daemon=True)
+        self._refresher.start()
+        return self._refresher
+
+    def _load_index(self) -> Dict[str, np.ndarray]:
+        with closing(self._connect()) as conn:
+            fetched_at = conn.execute("SELECT MAX(fetched_at) FROM calendar_days").fetchone()[0]
+            index = self._index
+            if index is None or fetched_at != self._index_fetched_at:
+                rows = conn.execute(
+                    "SELECT report_date, symbol, time, eps_forecast, market_cap FROM earnings "
+                    "ORDER BY report_date, market_cap DESC").fetchall()
+                index = {
+                    "date": np.array([row[0] for row in rows], dtype="datetime64[D]"),
+                    "symbol": [row[1] for row in rows],
+                    "time": [row[2] for row in rows],
+                    "eps_forecast": [row[3] for row in rows],
+                    "market_cap": [row[4] for row in rows],
+                }
+                self._index = index
+                self._index_fetched_at = fetched_at
+        return index
+
+
+def fetch_calendar_day(day: str) -> List[tuple]:
+    """One day of the Nasdaq earnings calendar as (symbol, date, name, time, eps_forecast, market_cap) rows."""
+    limiter_for(CALENDAR_URL).acquire()
+    response = requests.get(CALENDAR_URL, params={"date": day}, headers=CALENDAR_HEADERS, timeout=30)
+    response.raise_for_status()
+
+    rows = ((response.json().get("data") or {}).get("rows")) or []
+    return [(row["symbol"].strip().upper().replace(".", "-"), day, row.get("name"),
+             _report_time(row.get("time")), _money(row.get("epsForecast")), _money(row.get("marketCap")))
+            for row in rows if row.get("symbol")]
+
+
+def _report_time(value: Optional[str]) -> Optional[str]:
+    """'time-pre-market' -> 'pre-market'"""
+    if not value or value == "time-not-supplied":
+        return None
+    return value.replace("time-", "")
+
+
+def _money(value: Optional[str]) -> Optional[float]:
+    """'$1,234.5' -> 1234.5, '($0.12)' -> -0.12"""
+    if not value or value in ("N/A", "--"):
+        return None
+    negative = value.startswith("(")
+    try:
+        number = float(value.strip("()$").replace(",", "").replace("$", ""))
+    except ValueError:
+        return None
+    return -number if negative else number
+
+
+_calendar = None
+_calendar_lock = threading.Lock()
+
+
+def get_earnings_calendar() -> EarningsCalendar:
+    """
+    Process-wide calendar at EARNINGS_CALENDAR_DB. The prefetch daemon keeps it
+    fresh; with EARNINGS_CALENDAR_BACKGROUND 'true' the process starts its own
+    scheduled refresh on first use instead.
+    """
+    global _calendar
+
+    with _calendar_lock:
+        if _calendar is None:
+            _calendar = EarningsCalendar(os.getenv('EARNINGS_CALENDAR_DB', os.path.join('data', 'earnings.sqlite')))
+            if os.getenv('EARNINGS_CALENDAR_BACKGROUND', 'false').lower() == 'true':
+                _calendar.refresh_in_background(
+                    interval=float(os.getenv('EARNINGS_CALENDAR_REFRESH_INTERVAL', '21600')),
+                )
+        return _calendar
@@ -0,0 +1,218 @@
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+import feedparser
+import httpx
+
+from tools.rate_limiter import limiter_for
+
+# Financial news RSS feeds scanned by PennyStockNewsDiscovery and kept warm by the prefetch daemon
+NEWS_SOURCES = {
+    'Yahoo Finance': 'https://feeds.finance.yahoo.com/rss/2.0/headline',
+    'MarketWatch': 'https://feeds.marketwatch.com/marketwatch/topstories/',
+    'Reuters Business': 'http://feeds.reuters.com/reuters/businessNews',
+    'Bloomberg': 'https://feeds.bloomberg.com/markets/news.rss',
+    'CNBC': 'https://www.cnbc.com/id/100003114/device/rss/rss.html'
+}
+
+
+class FeedResult:
+    """
+    Outcome of fetching one feed.
+
+    entries - every entry currently in the feed (cached ones on a 304)
+    status  - HTTP status (200, 304, ...) or None when no request was made or it failed
+    cached  - served from the saved state without a request because it was fresh enough
+    """
+
+    def __init__(self, url: str, status: Optional[int], entries: List[Dict[str, Any]],
+                 error: Optional[str] = None, cached: bool = False):
+        self.url = url
+        self.status = status
+        self.entries = entries
+        self.error = error
+        self.cached = cached
+
+    @property
+    def not_modified(self) -> bool:
+        return self.status == 304
+
+
+class FeedFetcher:
+    """
+    Fetches RSS feeds concurrently over one pooled, keep-alive HTTP client.
+
+    Each feed's ETag and Last-Modified are sent back as conditional headers, so
+    an unchanged feed costs a 304 with no body and no parsing; its entries are
+    served from the state file. Only a changed feed is downloaded and parsed.
+    The client lives on a private event loop thread, so fetch() can be called
+    from synchronous tools and from code already running inside an event loop.
+
+    Feeds fetched less than max_age seconds ago, by this process or by another
+    one sharing the state file (the prefetch daemon), are served from the state
+    without any request.
+    """
+
+    def __init__(self, state_path: str, timeout: float = 10.0, max_entries: int = 50, max_age: float = 0.0):
+        self.state_path = state_path
+        self.timeout = timeout
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self._state_mtime = 0.0
+        self._state = self._load_state()
+        self._state_lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop_lock = threading.Lock()
+
+    def fetch(self, urls: List[str]) -> Dict[str, FeedResult]:
+        """Fetches every feed in parallel and returns {url: FeedResult}."""
+        self._reload_if_changed()
+
+        results = {}
+        if self.max_age:
+            now = time.time()
+            with self._state_lock:
+                for url in urls:
+                    state = self._state.get(url)
+                    if state and now - state.get("fetched_at", 0) < self.max_age:
+                        results[url] = FeedResult(url, None, state.get("entries", []), cached=True)
+
+        stale = [url for url in urls if url not in results]
+        if stale:
+            loop = self._ensure_loop()
+            future = asyncio.run_coroutine_threadsafe(self._fetch_all(stale), loop)
+            results.update(future.result())
+            self._save_state()
+
+        return {url: results[url] for url in urls}
+
+    async def _fetch_all(self, urls: List[str]) -> Dict[str, FeedResult]:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+                headers={"User-Agent": "Mozilla/5.0 (compatible; StockDiscoveryBot/1.0)"},
+            )
+        results = await asyncio.gather(*(self._fetch_one(url) for url in urls))
+        return dict(zip(urls, results))
+
+    async def _fetch_one(self, url: str) -> FeedResult:
+        with self._state_lock:
+            state = dict(self._state.get(url, {}))
+
+        headers = {}
+        if state.get("etag"):
+            headers["If-None-Match"] = state["etag"]
+        if state.get("last_modified"):
+            headers["If-Modified-Since"] = state["last_modified"]
+
+        await asyncio.to_thread(limiter_for(url).acquire)
+        try:
+            response = await self._client.get(url, headers=headers)
+        except httpx.HTTPError as e:
+            return FeedResult(url, None, state.get("entries", []), error=str(e))
+
+        if response.status_code == 304:
+            self._remember(url, state, response, state.get("entries", []))
+            return FeedResult(url, 304, state.get("entries", []))
+
+        if response.status_code != 200:
+            return FeedResult(url, response.status_code, state.get("entries", []),
+                              error=f"HTTP {response.status_code}")
+
+        parsed = await asyncio.to_thread(feedparser.parse, response.content)
+        entries = [entry_to_dict(entry) for entry in parsed.entries[:self.max_entries]]
+
+        self._remember(url, state, response, entries)
+        return FeedResult(url, 200, entries)
+
+    def _remember(self, url: str, state: Dict[str, Any], response: httpx.Response,
+                  entries: List[Dict[str, Any]]) -> None:
+        state.update({
+            "etag": response.headers.get("ETag", state.get("etag")),
+            "last_modified": response.headers.get("Last-Modified", state.get("last_modified")),
+            "entries": entries,
+            "fetched_at": time.time(),
+        })
+        with self._state_lock:
+            self._state[url] = state
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, name="feed-fetcher", daemon=True).start()
+            return self._loop
+
+    def _load_state(self) -> Dict[str, Any]:
+        try:
+            self._state_mtime = os.path.getmtime(self.state_path)
+            with open(self.state_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _reload_if_changed(self) -> None:
+        """Picks up state written by another process since it was last read or written here."""
+        try:
+            changed = os.path.getmtime(self.state_path) > self._state_mtime
+        except OSError:
+            return
+        if changed:
+            state = self._load_state()
+            with self._state_lock:
+                self._state = state
+
+    def _save_state(self) -> None:
+        directory = os.path.dirname(self.state_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._state_lock:
+            payload = json.dumps(self._state)
+        # A unique temp file, so concurrent savers (threads or processes) never share one
+        fd, temp_path = tempfile.mkstemp(dir=directory or ".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(temp_path, self.state_path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        self._state_mtime = os.path.getmtime(self.state_path)
+
+
+def entry_to_dict(entry) -> Dict[str, Any]:
+    """Keeps the parts of a feedparser entry the discovery tools use."""
+    title = entry.get("title", "")
+    link = entry.get("link", "")
+    return {
+        "id": entry.get("id") or link or title,
+        "title": title,
+        "link": link,
+        "published": entry.get("published"),
+    }
+
+
+_fetcher = None
+_fetcher_lock = threading.Lock()
+
+
+def get_feed_fetcher() -> FeedFetcher:
+    """
+    Process-wide feed fetcher keeping its conditional-GET state in FEED_STATE_PATH
+    and serving feeds fetched within FEED_MAX_AGE seconds from it.
+    """
+    global _fetcher
+    with _fetcher_lock:
+        if _fetcher is None:
+            _fetcher = FeedFetcher(os.getenv('FEED_STATE_PATH', os.path.join('data', 'feed_state.json')),
+                                   max_age=float(os.getenv('FEED_MAX_AGE', '0')))
+        return _fetcher
@@ -0,0 +1,216 @@
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from tools.sentiment import score_text
+
+# "... - Reuters", "... | CNBC": the publisher tag syndicated copies differ by
+SOURCE_SUFFIX = re.compile(r"\s+[-|–—]\s+(?:\S+\s+){0,3}\S+\s*$")
+NON_WORD = re.compile(r"[^a-z0-9$%]+")
+# Tickers and figures: $TLRY, TLRY, 12%, $1.2B, Q3
+TICKER = re.compile(r"\$[A-Za-z]{1,5}\b|\b[A-Z]{2,5}\b")
+FIGURE = re.compile(r"\S*\d\S*")
+# Capitalized words: company names in a sentence-case headline, every word in a Title Case one
+CAPITALIZED = re.compile(r"\b[A-Z][\w&'-]*")
+
+
+def normalize(text: str) -> str:
+    """Lowercase words only, without the trailing publisher tag."""
+    text = SOURCE_SUFFIX.sub("", text)
+    return NON_WORD.sub(" ", text.lower()).strip()
+
+
+def content_hash(normalized: str) -> str:
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:16]
+
+
+def entity_key(text: str) -> str:
+    """
+    The tickers and figures in a headline, lowercased. Near-duplicates must agree
+    on these, so 'TLRY up 12%' never merges with 'TLRY up 21%'. An all-caps
+    headline has no recognizable tickers, only figures.
+    """
+    text = SOURCE_SUFFIX.sub("", text)
+    tickers = [ticker.lstrip("$") for ticker in TICKER.findall(text)] if text != text.upper() else []
+    figures = FIGURE.findall(text)
+    return " ".join(sorted({match.lower().strip(".,:;()") for match in tickers + figures}))
+
+
+def stem(word: str) -> str:
+    """shares -> share, jumps -> jump; enough to line up reworded headlines"""
+    return word[:-1] if len(word) > 3 and word.endswith("s") and not word.endswith("ss") else word
+
+
+def word_set(normalized: str) -> Set[str]:
+    return {stem(word) for word in normalized.split()}
+
+
+def names(text: str) -> Set[str]:
+    """Capitalized words and tickers of a headline, compared case-insensitively as stemmed words."""
+    text = SOURCE_SUFFIX.sub("", text)
+    return word_set(normalize(" ".join(CAPITALIZED.findall(text) + TICKER.findall(text))))
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    return len(a & b) / len(a | b) if a or b else 1.0
+
+
+class Story:
+    """
+    One story and every copy of it seen in this poll.
+
+    new  - first time the story has been seen within the window
+    data - whatever was remembered for it when it was first processed
+    """
+
+    def __init__(self, key: str, text: str, source: str, new: bool, data: Optional[Dict[str, Any]]):
+        self.key = key
+        self.text = text
+        self.sources = [source]
+        self.new = new
+        self.data = data
+
+
+class HeadlineDeduplicator:
+    """
+    Groups headlines into stories and remembers them between polls.
+
+    Exact copies match on a hash of the normalized text. Reworded copies are
+    only compared with stories carrying the same tickers and figures, and match
+    when the Jaccard similarity of their word sets is at least min_similarity,
+    one headline contains every name capitalized in the other ('Tilray shares
+    jump' and 'Tilray Stock Jumps' agree, 'Sundial shares jump' does not) and
+    their keyword sentiment does not point in opposite directions. Stories not
+    seen for window seconds are forgotten. The seen-set persists at path, so a
+    story is processed once per window across polls and sources.
+    """
+
+    def __init__(self, path: str, window: float = 86400, min_similarity: float = 0.5):
+        self.path = path
+        self.window = window
+        self.min_similarity = min_similarity
+        self._lock = threading.Lock()
+        self._stories: Dict[str, Dict[str, Any]] = {}
+        self._hashes: Dict[str, str] = {}
+        self._by_entities: Dict[str, List[str]] = {}
+        self._load()
+
+    def group(self, items: Iterable[Tuple[str, str]]) -> List[Story]:
+        """Turns (source, headline) pairs into stories, first copy first."""
+        now = time.time()
+        stories: Dict[str, Story] = {}
+
+        with self._lock:
+            for source, text in items:
+                normalized = normalize(text)
+                if not normalized:
+                    continue
+
+                entities = entity_key(text)
+                key = self._find(text, normalized, entities)
+                if key is None:
+                    key = self._add(text, normalized, entities, now)
+                    new = True
+                else:
+                    new = False
+                self._stories[key]["last_seen"] = now
+
+                if key in stories:
+                    stories[key].sources.append(source)
+                else:
+                    stories[key] = Story(key, text, source, new, self._stories[key].get("data"))
+
+        return list(stories.values())
+
+    def remember(self, story: Story, data: Dict[str, Any]) -> None:
+        """Stores the processing result for a story so later polls can reuse it."""
+        story.data = data
+        with self._lock:
+            if story.key in self._stories:
+                self._stories[story.key]["data"] = data
+
+    def save(self) -> None:
+        cutoff = time.time() - self.window
+        with self._lock:
+            self._stories = {key: story for key, story in self._stories.items() if story["last_seen"] >= cutoff}
+            self._reindex()
+            payload = json.dumps(self._stories)
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # A unique temp file, so concurrent savers (threads or processes) never share one
+        fd, temp_path = tempfile.mkstemp(dir=directory or ".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def _find(self, text: str, normalized: str, entities: str) -> Optional[str]:
+        digest = content_hash(normalized)
+        if digest in self._hashes:
+            return self._hashes[digest]
+
+        words, capitalized, polarity = word_set(normalized), names(text), score_text(text)
+        for key in self._by_entities.get(entities, ()):
+            story = self._stories[key]
+            story_words = set(story["words"])
+            if (jaccard(words, story_words) >= self.min_similarity
+                    and (capitalized <= story_words or set(story["names"]) <= words)
+                    and polarity * story["polarity"] >= 0):
+                # Remember this wording too so the next copy is an exact hit
+                story["hashes"].append(digest)
+                self._hashes[digest] = key
+                return key
+        return None
+
+    def _add(self, text: str, normalized: str, entities: str, now: float) -> str:
+        key = content_hash(normalized)
+        self._stories[key] = {"words": sorted(word_set(normalized)), "names": sorted(names(text)),
+                              "polarity": score_text(text), "entities": entities, "hashes": [key],
+                              "first_seen": now, "last_seen": now}
+        self._index(key)
+        return key
+
+    def _index(self, key: str) -> None:
+        story = self._stories[key]
+        for digest in story["hashes"]:
+            self._hashes[digest] = key
+        self._by_entities.setdefault(story["entities"], []).append(key)
+
+    def _reindex(self) -> None:
+        self._hashes, self._by_entities = {}, {}
+        for key in self._stories:
+            self._index(key)
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                self._stories = json.load(f)
+        except (OSError, ValueError):
+            self._stories = {}
+        # Stories saved in an older format can't be compared; they are seen again as new
+        self._stories = {key: story for key, story in self._stories.items() if "words" in story}
+        self._reindex()
+
+
+_dedup = None
+_dedup_lock = threading.Lock()
+
+
+def get_headline_dedup() -> HeadlineDeduplicator:
+    """Process-wide deduplicator at HEADLINE_DEDUP_PATH with a HEADLINE_DEDUP_WINDOW seconds window."""
+    global _dedup
+    with _dedup_lock:
+        if _dedup is None:
+            _dedup = HeadlineDeduplicator(os.getenv('HEADLINE_DEDUP_PATH', os.path.join('data', 'headline_seen.json')),
+                                          window=float(os.getenv('HEADLINE_DEDUP_WINDOW', '86400')))
+        return _dedup
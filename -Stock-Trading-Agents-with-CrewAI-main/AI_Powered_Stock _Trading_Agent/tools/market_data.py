@@ -0,0 +1,63 @@
+from typing import Any, Dict, Iterable, List
+
+from tools.data_providers import get_provider, QUOTE_FIELDS
+from tools.quote_cache import quote_cache, PRICE_FIELDS
+from tools.run_snapshot import current_snapshot
+
+# What the discovery tools need to decide whether a symbol is a penny stock
+PENNY_FILTER_FIELDS = ("regularMarketPrice", "marketCap")
+
+
+def get_quote(symbol: str, fields: Iterable[str] = PRICE_FIELDS) -> Dict[str, Any]:
+    """
+    Returns the requested .info-style fields for a symbol through the quote cache.
+
+    Price, market cap, volume and day high/low come from the provider's lightweight
+    quote. The full fundamentals scrape only runs when one of the requested fields
+    (sector, growth, recommendation, ...) is not available there.
+
+    Inside a run_snapshot() block the values are pinned for the rest of the run,
+    so each symbol is fetched at most once however many tools ask for it.
+    """
+    fields = tuple(fields)
+    snapshot = current_snapshot()
+    if snapshot is None:
+        return quote_cache.get_or_fetch(symbol, fields, lambda: fetch_quote(symbol, fields))
+
+    return snapshot.get_or_fetch(
+        symbol, fields,
+        lambda missing: quote_cache.get_or_fetch(symbol, missing, lambda: fetch_quote(symbol, missing)),
+    )
+
+
+def fetch_quote(symbol: str, fields: Iterable[str]) -> Dict[str, Any]:
+    """Fetches fields for one symbol, paying for the fundamentals scrape only if needed."""
+    provider = get_provider()
+
+    if all(field in QUOTE_FIELDS for field in fields):
+        return provider.quote(symbol)
+
+    # Slow path: the full fundamentals dictionary, which also carries every quote field
+    return provider.fundamentals(symbol)
+
+
+def last_closes(symbols: List[str]) -> Dict[str, float]:
+    """
+    Latest daily close for every symbol, from a single bulk history request
+    instead of one quote per symbol. Symbols without a recent bar are left out;
+    provider errors propagate to the caller.
+    """
+    if not symbols:
+        return {}
+
+    # 5 days so there is always a bar, even after weekends and holidays
+    closes = get_provider().history(symbols, period="5d", interval="1d")["Close"]
+    prices = {}
+    for symbol in symbols:
+        try:
+            close = closes[symbol].dropna()
+        except KeyError:
+            continue
+        if not close.empty:
+            prices[symbol] = float(close.iloc[-1])
+    return prices
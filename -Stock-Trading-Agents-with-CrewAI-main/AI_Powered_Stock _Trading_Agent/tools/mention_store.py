@@ -0,0 +1,146 @@
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS mentions (
+    symbol TEXT NOT NULL,
+    ts REAL NOT NULL,
+    source TEXT NOT NULL,
+    item_id TEXT NOT NULL,
+    sentiment REAL,
+    UNIQUE (source, item_id, symbol)
+);
+CREATE INDEX IF NOT EXISTS idx_mentions_symbol_ts ON mentions (symbol, ts);
+CREATE INDEX IF NOT EXISTS idx_mentions_ts ON mentions (ts);
+
+CREATE TABLE IF NOT EXISTS buckets (
+    symbol TEXT NOT NULL,
+    bucket INTEGER NOT NULL,
+    mentions INTEGER NOT NULL DEFAULT 0,
+    sentiment_sum REAL NOT NULL DEFAULT 0,
+    PRIMARY KEY (symbol, bucket)
+);
+CREATE INDEX IF NOT EXISTS idx_buckets_bucket ON buckets (bucket);
+"""
+
+
+class MentionStore:
+    """
+    Append-only log of ticker mentions from news and social media.
+
+    Every mention is (symbol, timestamp, source, item id, sentiment); the same
+    item is only ever counted once per symbol. Alongside the raw log, counts
+    and sentiment sums are kept per symbol in bucket_seconds buckets, so a
+    rolling window is a sum over a fixed number of bucket rows however many
+    mentions it holds. Rows older than retention seconds are dropped.
+    """
+
+    def __init__(self, path: str, bucket_seconds: int = 300, retention: float = 7 * 86400):
+        self.path = path
+        self.bucket_seconds = bucket_seconds
+        self.retention = retention
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def record(self, mentions: Iterable[Tuple[str, float, str, str, Optional[float]]]) -> int:
+        """
+        Appends (symbol, ts, source, item_id, sentiment) mentions and updates their
+        buckets. Mentions already recorded are skipped. Returns how many were new.
+        """
+        added = 0
+        with self._lock, closing(self._connect()) as conn:
+            with conn:
+                for symbol, ts, source, item_id, sentiment in mentions:
+                    cursor = conn.execute(
+                        "INSERT OR IGNORE INTO mentions (symbol, ts, source, item_id, sentiment) VALUES (?, ?, ?, ?, ?)",
+                        (symbol, ts, source, item_id, sentiment),
+                    )
+                    if cursor.rowcount == 0:
+                        continue
+                    added += 1
+                    conn.execute(
+                        "INSERT INTO buckets (symbol, bucket, mentions, sentiment_sum) VALUES (?, ?, 1, ?) "
+                        "ON CONFLICT(symbol, bucket) DO UPDATE SET mentions = mentions + 1, "
+                        "sentiment_sum = sentiment_sum + excluded.sentiment_sum",
+                        (symbol, self._bucket(ts), sentiment or 0.0),
+                    )
+
+                cutoff = time.time() - self.retention
+                conn.execute("DELETE FROM mentions WHERE ts < ?", (cutoff,))
+                conn.execute("DELETE FROM buckets WHERE bucket < ?", (self._bucket(cutoff),))
+        return added
+
+    def counts(self, symbol: str, window: float = 3600) -> Dict[str, float]:
+        """Mentions and average sentiment for one symbol over the last window seconds."""
+        with closing(self._connect()) as conn:
+            mentions, sentiment_sum = conn.execute(
+                "SELECT COALESCE(SUM(mentions), 0), COALESCE(SUM(sentiment_sum), 0) FROM buckets "
+                "WHERE symbol = ? AND bucket >= ?",
+                (symbol.upper(), self._bucket(time.time() - window)),
+            ).fetchone()
+        return {"mentions": mentions, "sentiment": sentiment_sum / mentions if mentions else 0.0}
+
+    def velocity(self, window: float = 3600, limit: int = 10, min_mentions: int = 2) -> List[Dict[str, Any]]:
+        """
+        Symbols whose mentions in the last window grew the most against the window
+        before it. Each row has symbol, mentions, previous, velocity (mentions per
+        previous mention, with the previous count floored at 1) and sentiment.
+        """
+        now = time.time()
+        current_start = self._bucket(now - window)
+        previous_start = self._bucket(now - 2 * window)
+
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT symbol, "
+                "SUM(CASE WHEN bucket >= ? THEN mentions ELSE 0 END) AS current, "
+                "SUM(CASE WHEN bucket < ? THEN mentions ELSE 0 END) AS previous, "
+                "SUM(CASE WHEN bucket >= ? THEN sentiment_sum ELSE 0 END) AS sentiment_sum "
+                "FROM buckets WHERE bucket >= ? GROUP BY symbol HAVING current >= ?",
+                (current_start, current_start, current_start, previous_start, min_mentions),
+            ).fetchall()
+
+        results = [{
+            "symbol": symbol,
+            "mentions": current,
+            "previous": previous,
+            "velocity": current / max(previous, 1),
+            "sentiment": sentiment_sum / current,
+        } for symbol, current, previous, sentiment_sum in rows]
+
+        results.sort(key=lambda row: (row["velocity"], row["mentions"]), reverse=True)
+        return results[:limit]
+
+    def _bucket(self, ts: float) -> int:
+        return int(ts // self.bucket_seconds * self.bucket_seconds)
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_mention_store() -> MentionStore:
+    """Process-wide mention store at MENTION_STORE_DB."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = MentionStore(
+                os.getenv('MENTION_STORE_DB', os.path.join('data', 'mentions.sqlite')),
+                bucket_seconds=int(os.getenv('MENTION_BUCKET_SECONDS', '300')),
+                retention=float(os.getenv('MENTION_RETENTION', '604800')),
+            )
+        return _store
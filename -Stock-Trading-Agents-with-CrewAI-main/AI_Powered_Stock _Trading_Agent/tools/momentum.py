@@ -0,0 +1,103 @@
+import warnings
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+# Trading days of history the indicators need: RSI warm-up and the volume baseline
+HISTORY_DAYS = 40
+
+MOMENTUM_COLUMNS = ["price", "roc", "rsi", "volume_z", "gap", "score"]
+
+# Volume z-scores: the baseline's standard deviation is floored at this fraction of its mean
+# (and one share), and the score is capped, so a spike after a flat or empty stretch still ranks
+VOLUME_STD_FLOOR = 0.1
+MAX_VOLUME_Z = 10.0
+
+
+def rate_of_change(close: np.ndarray, period: int) -> np.ndarray:
+    """Percent change of the last close against the close period days earlier, per symbol."""
+    if len(close) <= period:
+        return np.full(close.shape[1], np.nan)
+    return (close[-1] / close[-1 - period] - 1) * 100
+
+
+def rsi(close: np.ndarray, period: int = 14) -> np.ndarray:
+    """
+    Wilder's RSI of the last day for every column of a days x symbols close array.
+    The smoothing steps through the days once, each step over all symbols at once.
+    """
+    change = np.diff(close, axis=0)
+    if len(change) < period:
+        return np.full(close.shape[1], np.nan)
+
+    gain = np.clip(change, 0, None)
+    loss = np.clip(-change, 0, None)
+    avg_gain = np.nanmean(gain[:period], axis=0)
+    avg_loss = np.nanmean(loss[:period], axis=0)
+
+    for day in range(period, len(change)):
+        # Missing days (NaN) leave the running averages where they were
+        avg_gain = np.where(np.isnan(gain[day]), avg_gain, (avg_gain * (period - 1) + gain[day]) / period)
+        avg_loss = np.where(np.isnan(loss[day]), avg_loss, (avg_loss * (period - 1) + loss[day]) / period)
+
+    relative_strength = avg_gain / avg_loss
+    return np.where(avg_loss == 0, np.where(avg_gain > 0, 100.0, 50.0), 100 - 100 / (1 + relative_strength))
+
+
+def volume_zscore(volume: np.ndarray, baseline: int = 20) -> np.ndarray:
+    """
+    How many standard deviations the last day's volume sits above the previous
+    baseline days, between -MAX_VOLUME_Z and MAX_VOLUME_Z. A flat baseline has
+    its deviation floored (VOLUME_STD_FLOOR), so a spike after it scores high instead of NaN.
+    """
+    history = volume[-1 - baseline:-1]
+    mean = np.nanmean(history, axis=0)
+    std = np.maximum(np.nanstd(history, axis=0), np.maximum(VOLUME_STD_FLOOR * mean, 1.0))
+    return np.clip((volume[-1] - mean) / std, -MAX_VOLUME_Z, MAX_VOLUME_Z)
+
+
+def gap_percent(open_: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """Last open against the previous close, in percent."""
+    if len(close) < 2:
+        return np.full(close.shape[1], np.nan)
+    return (open_[-1] / close[-2] - 1) * 100
+
+
+def scan_momentum(symbols: List[str], arrays: Dict[str, np.ndarray], max_price: float = 5.0,
+                  roc_period: int = 5, top_n: int = 10) -> pd.DataFrame:
+    """
+    Momentum indicators for every symbol of a days x symbols bar matrix at once
+    (BarStore.matrix()), returning the top_n movers priced at or under max_price.
+
+    score adds the rate of change to ten times the volume z-score, so a strong
+    move on heavy volume outranks a drift on thin volume. Symbols without a
+    price or enough history for the rate of change drop out.
+    """
+    close = arrays["close"]
+    if close.size == 0:
+        return pd.DataFrame(columns=MOMENTUM_COLUMNS)
+
+    with np.errstate(divide="ignore", invalid="ignore"), warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # All-NaN columns for thin histories
+        price = close[-1]
+        roc = rate_of_change(close, roc_period)
+        strength = rsi(close)
+        volume_z = volume_zscore(arrays["volume"])
+        gap = gap_percent(arrays["open"], close)
+        score = roc + 10 * np.nan_to_num(volume_z)
+
+    # NaN prices and scores compare False and drop out
+    movers = np.flatnonzero((price <= max_price) & (price > 0) & ~np.isnan(score))
+    if len(movers) > top_n:
+        movers = movers[np.argpartition(-score[movers], top_n - 1)[:top_n]]
+    movers = movers[np.argsort(-score[movers], kind="stable")]
+
+    return pd.DataFrame({
+        "price": price[movers],
+        "roc": roc[movers],
+        "rsi": strength[movers],
+        "volume_z": volume_z[movers],
+        "gap": gap[movers],
+        "score": score[movers],
+    }, index=pd.Index(np.asarray(symbols)[movers], name="symbol"), columns=MOMENTUM_COLUMNS)
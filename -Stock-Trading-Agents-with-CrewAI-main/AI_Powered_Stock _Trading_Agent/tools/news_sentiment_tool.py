@@ -1,11 +1,25 @@
 import requests
-import feedparser
-import re
 import time
 from datetime import datetime, timedelta
 from crewai.tools import tool
 from typing import List, Dict, Any
-import yfinance as yf
+
+import pandas as pd
+
+from tools.bar_store import get_bar_store
+from tools.earnings_calendar import get_earnings_calendar
+from tools.feed_fetcher import NEWS_SOURCES, get_feed_fetcher
+from tools.headline_dedup import get_headline_dedup
+from tools.market_data import get_quote, last_closes, PENNY_FILTER_FIELDS
+from tools.mention_store import get_mention_store
+from tools.momentum import HISTORY_DAYS, scan_momentum
+from tools.rate_limiter import fetch_all
+from tools.screener import resolve_universe
+from tools.sentiment import score_text
+from tools.symbol_universe import get_symbol_universe
+from tools.ticker_extractor import get_ticker_extractor
+from tools.twitter_poller import PENNY_STOCK_KEYWORDS, build_query, get_twitter_poller, tweet_time
+from tools.tool_output import ToolResult, human_number, render, shorten
 
 @tool("PennyStockNewsDiscovery")
 def discover_penny_stocks_from_news() -> str:
@@ -15,13 +29,7 @@ def discover_penny_stocks_from_news() -> str:
     """
     
     # Financial news RSS feeds
-    news_sources = {
-        'Yahoo Finance': 'https://feeds.finance.yahoo.com/rss/2.0/headline',
-        'MarketWatch': 'https://feeds.marketwatch.com/marketwatch/topstories/',
-        'Reuters Business': 'http://feeds.reuters.com/reuters/businessNews',
-        'Bloomberg': 'https://feeds.bloomberg.com/markets/news.rss',
-        'CNBC': 'https://www.cnbc.com/id/100003114/device/rss/rss.html'
-    }
+    news_sources = NEWS_SOURCES
     
     # Dynamic penny stock discovery - no predefined lists
     # The system will discover stocks from real-time news feeds
@@ -29,45 +37,52 @@ def discover_penny_stocks_from_news() -> str:
     discovered_stocks = {}
     rss_success = False
     
+    # Validates candidates against the local symbol universe (only cashtags until its first refresh)
+    extractor = get_ticker_extractor()
+    
+    # All feeds are fetched concurrently with conditional GETs; unchanged feeds
+    # answer 304 and their entries come from the fetcher's saved state, as do
+    # feeds fetched within FEED_MAX_AGE (e.g. by the prefetch daemon)
+    feeds = get_feed_fetcher().fetch(list(news_sources.values()))
+    
+    headlines = []
     for source_name, feed_url in news_sources.items():
-        try:
-            feed = feedparser.parse(feed_url)
-            
-            if feed.entries:  # Check if we got any entries
-                rss_success = True
-                
-                for entry in feed.entries[:15]:  # Check more entries for penny stocks
-                    headline = entry.title
-                    
-                    # Extract stock symbols from headlines
-                    stock_symbols = re.findall(r'\$([A-Z]{1,5})|(?<=\s)([A-Z]{1,5})(?=\s|$)', headline)
-                    
-                    for symbol_match in stock_symbols:
-                        symbol = symbol_match[0] if symbol_match[0] else symbol_match[1]
-                        
-                        # Skip common non-stock words
-                        if symbol in ['I', 'THE', 'AND', 'FOR', 'ARE', 'YOU', 'ALL', 'NEW', 'TOP', 'CEO', 'CFO', 'CTO']:
-                            continue
-                        
-                        if symbol not in discovered_stocks:
-                            discovered_stocks[symbol] = {
-                                'mentions': 0,
-                                'headlines': [],
-                                'sentiment_score': 0,
-                                'source': source_name
-                            }
-                        
-                        discovered_stocks[symbol]['mentions'] += 1
-                        discovered_stocks[symbol]['headlines'].append(headline)
-                        
-                        # Analyze sentiment
-                        sentiment = analyze_headline_sentiment(headline)
-                        discovered_stocks[symbol]['sentiment_score'] += sentiment
-                    
-            time.sleep(1)  # Rate limiting
+        feed = feeds[feed_url]
+        if feed.entries:  # Check if we got any entries
+            rss_success = True
+            headlines.extend((source_name, entry['title']) for entry in feed.entries[:15])  # Check more entries for penny stocks
+    
+    # The same wire story runs in several feeds and stays up across polls: group the
+    # copies into one story, count it once and analyze it only the first time it is seen
+    dedup = get_headline_dedup()
+    mentions = []
+    for story in dedup.group(headlines):
+        if story.data is None:
+            # Listed tickers only; stopwords and unknown words never reach the network
+            data = {'symbols': extractor.extract(story.text),
+                    'sentiment': analyze_headline_sentiment(story.text)}
+            if extractor.ready:
+                dedup.remember(story, data)
+            else:
+                story.data = data  # Not kept: the story is extracted again once the universe is loaded
+        
+        for symbol in story.data['symbols']:
+            if symbol not in discovered_stocks:
+                discovered_stocks[symbol] = {
+                    'mentions': 0,
+                    'headlines': [],
+                    'sentiment_score': 0,
+                    'source': story.sources[0]
+                }
             
-        except Exception as e:
-            continue
+            discovered_stocks[symbol]['mentions'] += 1
+            discovered_stocks[symbol]['headlines'].append(story.text)
+            discovered_stocks[symbol]['sentiment_score'] += story.data['sentiment']
+            mentions.append((symbol, time.time(), 'news', story.key, story.data['sentiment']))
+    dedup.save()
+    
+    # Keep the mentions for buzz velocity; stories seen on earlier polls are already recorded
+    get_mention_store().record(mentions)
     
     # No fallback data - only real-time RSS feeds
     # If no stocks found, return informative message about real-time discovery
@@ -76,37 +91,39 @@ def discover_penny_stocks_from_news() -> str:
     penny_stocks = []
     debug_info = []
     
-    for symbol, data in discovered_stocks.items():
-        if data['mentions'] >= 1:  # Include all mentioned stocks
-            avg_sentiment = data['sentiment_score'] / data['mentions']
-            
-            # Process stocks with neutral to positive sentiment (lower threshold for penny stocks)
-            if avg_sentiment > -0.2:  # Allow slightly negative sentiment for penny stocks
-                try:
-                    ticker = yf.Ticker(symbol)
-                    info = ticker.info
-                    current_price = info.get("regularMarketPrice", 0)
-                    market_cap = info.get("marketCap", 0)
-                    
-                    debug_info.append(f"{symbol}: Price=${current_price}, MarketCap=${market_cap}, Sentiment={avg_sentiment:.2f}")
-                    
-                    # Only include penny stocks (under $5) with decent market cap
-                    if current_price and current_price <= 5.0 and market_cap and market_cap >= 500000:  # $500K+ market cap
-                        penny_stocks.append({
-                            'symbol': symbol,
-                            'price': current_price,
-                            'market_cap': market_cap,
-                            'mentions': data['mentions'],
-                            'sentiment': avg_sentiment,
-                            'headlines': data['headlines'][:3],  # Top 3 headlines
-                            'source': data['source']
-                        })
-                    
-                    time.sleep(0.1)  # Rate limiting
-                    
-                except Exception as e:
-                    debug_info.append(f"{symbol}: Error - {str(e)}")
-                    continue
+    # Process stocks with neutral to positive sentiment (lower threshold for penny stocks)
+    candidates = [symbol for symbol, data in discovered_stocks.items()
+                  if data['mentions'] >= 1  # Include all mentioned stocks
+                  and data['sentiment_score'] / data['mentions'] > -0.2]  # Allow slightly negative sentiment for penny stocks
+    
+    # Lightweight quotes (no fundamentals scrape) for every candidate, fetched concurrently
+    quotes = fetch_all(lambda symbol: get_quote(symbol, PENNY_FILTER_FIELDS), candidates)
+    
+    for symbol in candidates:
+        data = discovered_stocks[symbol]
+        avg_sentiment = data['sentiment_score'] / data['mentions']
+        info = quotes[symbol]
+        
+        if isinstance(info, Exception):
+            debug_info.append((symbol, None, None, round(avg_sentiment, 2), f"Error - {str(info)}"))
+            continue
+        
+        current_price = info.get("regularMarketPrice", 0)
+        market_cap = info.get("marketCap", 0)
+        
+        debug_info.append((symbol, current_price, market_cap, round(avg_sentiment, 2), ""))
+        
+        # Only include penny stocks (under $5) with decent market cap
+        if current_price and current_price <= 5.0 and market_cap and market_cap >= 500000:  # $500K+ market cap
+            penny_stocks.append({
+                'symbol': symbol,
+                'price': current_price,
+                'market_cap': market_cap,
+                'mentions': data['mentions'],
+                'sentiment': avg_sentiment,
+                'headlines': data['headlines'][:3],  # Top 3 headlines
+                'source': data['source']
+            })
     
     # Sort by sentiment and mentions
     penny_stocks.sort(key=lambda x: (x['sentiment'], x['mentions']), reverse=True)
@@ -117,36 +134,29 @@ def discover_penny_stocks_from_news() -> str:
         stocks_with_sentiment = len([s for s in discovered_stocks.values() if s['sentiment_score'] / s['mentions'] > -0.2])
         data_source = "Fallback Data" if not rss_success else "RSS Feeds"
         
-        # Show what stocks were found
-        stock_list = []
-        for symbol, data in discovered_stocks.items():
-            try:
-                ticker = yf.Ticker(symbol)
-                info = ticker.info
-                current_price = info.get("regularMarketPrice", "N/A")
-                market_cap = info.get("marketCap", "N/A")
-                stock_list.append(f"{symbol}: ${current_price} (Market Cap: ${market_cap})")
-            except:
-                stock_list.append(f"{symbol}: Data unavailable")
-        
-        stock_details = "\n".join(stock_list[:10])  # Show first 10 stocks
+        # Show what stocks were found, from the quotes already fetched above
+        result = ToolResult("PennyStockNewsDiscovery",
+                            "No penny stocks with positive sentiment found in recent news",
+                            ["Symbol", "Price", "MarketCap", "Sentiment", "Error"],
+                            notes=[f"Total stocks mentioned: {total_stocks_found}",
+                                   f"Stocks with acceptable sentiment: {stocks_with_sentiment}",
+                                   f"Data source: {data_source}",
+                                   f"Checked {len(news_sources)} news sources"])
+        for row in debug_info[:15]:  # Show first 15 debug entries
+            result.add(*row)
         
-        debug_summary = "\n".join(debug_info[:15])  # Show first 15 debug entries
-        
-        return f"No penny stocks with positive sentiment found in recent news.\n\nDebug Info:\n- Total stocks mentioned: {total_stocks_found}\n- Stocks with acceptable sentiment: {stocks_with_sentiment}\n- Data source: {data_source}\n- Checked {len(news_sources)} news sources\n\nDetailed Analysis:\n{debug_summary}"
+        return render(result)
     
-    result = f"💰 Discovered {len(penny_stocks)} penny stocks with growth potential:\n\n"
+    result = ToolResult("PennyStockNewsDiscovery",
+                        f"Discovered {len(penny_stocks)} penny stocks with growth potential",
+                        ["Symbol", "Price", "MarketCap", "Mentions", "Sentiment", "Headlines"])
     
-    for i, stock in enumerate(penny_stocks[:10]):
-        result += f"{i+1}. {stock['symbol']} - ${stock['price']:.2f}\n"
-        result += f"   Market Cap: ${stock['market_cap']:,.0f} | Mentions: {stock['mentions']}\n"
-        result += f"   Sentiment Score: {stock['sentiment']:.2f}\n"
-        result += f"   Recent Headlines:\n"
-        for headline in stock['headlines']:
-            result += f"   • {headline}\n"
-        result += "\n"
+    for stock in penny_stocks[:10]:
+        result.add(stock['symbol'], round(stock['price'], 2), human_number(stock['market_cap']),
+                   stock['mentions'], round(stock['sentiment'], 2),
+                   [shorten(headline) for headline in stock['headlines']])
     
-    return result
+    return render(result)
 
 @tool("SocialMediaStockDiscovery")
 def discover_stocks_from_social_media() -> str:
@@ -155,72 +165,39 @@ def discover_stocks_from_social_media() -> str:
     Identifies penny stocks gaining momentum on platforms like Twitter, Reddit, and StockTwits.
     """
     
-    import os
-    import tweepy
-    import re
-    
-    # Twitter API Configuration
-    bearer_token = os.getenv('TWITTER_BEARER_TOKEN')
-    api_key = os.getenv('TWITTER_API_KEY')
-    api_secret = os.getenv('TWITTER_API_SECRET')
-    access_token = os.getenv('TWITTER_ACCESS_TOKEN')
-    access_token_secret = os.getenv('TWITTER_ACCESS_TOKEN_SECRET')
-    
     discovered_stocks = {}
+    extractor = get_ticker_extractor()
     
-    # Try to use Twitter API if credentials are available
-    if bearer_token and api_key and api_secret:
+    # Try to use Twitter API if a bearer token is available
+    poller = get_twitter_poller()
+    if poller is not None:
         try:
-            # Initialize Twitter API v2
-            client = tweepy.Client(
-                bearer_token=bearer_token,
-                consumer_key=api_key,
-                consumer_secret=api_secret,
-                access_token=access_token,
-                access_token_secret=access_token_secret
-            )
-            
-            # Search for penny stock related tweets - dynamic discovery
-            penny_stock_keywords = [
-                'penny stocks', 'penny stock', 'pennystocks', 'small cap stocks', 
-                'under $5', 'cheap stocks', 'low price stocks'
-            ]
+            # One OR query for every penny stock keyword; only tweets newer than the last
+            # poll are downloaded, the rest of the day's tweets come from the poller's state
+            tweets = poller.poll(build_query(PENNY_STOCK_KEYWORDS))
+            mentions = []
             
-            for keyword in penny_stock_keywords:
-                try:
-                    # Search tweets from the last 7 days
-                    tweets = client.search_recent_tweets(
-                        query=keyword,
-                        max_results=100,
-                        tweet_fields=['created_at', 'public_metrics', 'lang']
-                    )
+            for tweet in tweets:
+                # Cashtags of listed tickers
+                for symbol in extractor.extract(tweet['text'], cashtags_only=True):
+                    if symbol not in discovered_stocks:
+                        discovered_stocks[symbol] = {
+                            'mentions': 0,
+                            'tweets': [],
+                            'sentiment_score': 0,
+                            'platform': 'Twitter'
+                        }
                     
-                    if tweets.data:
-                        for tweet in tweets.data:
-                            # Extract stock symbols from tweet text
-                            stock_symbols = re.findall(r'\$([A-Z]{1,5})', tweet.text)
-                            
-                            for symbol in stock_symbols:
-                                if symbol not in discovered_stocks:
-                                    discovered_stocks[symbol] = {
-                                        'mentions': 0,
-                                        'tweets': [],
-                                        'sentiment_score': 0,
-                                        'platform': 'Twitter'
-                                    }
-                                
-                                discovered_stocks[symbol]['mentions'] += 1
-                                discovered_stocks[symbol]['tweets'].append(tweet.text[:100] + "...")
-                                
-                                # Analyze sentiment
-                                sentiment = analyze_headline_sentiment(tweet.text)
-                                discovered_stocks[symbol]['sentiment_score'] += sentiment
-                    
-                    time.sleep(1)  # Rate limiting
-                    
-                except Exception as e:
-                    continue
+                    discovered_stocks[symbol]['mentions'] += 1
+                    discovered_stocks[symbol]['tweets'].append(tweet['text'][:100] + "...")
                     
+                    # Analyze sentiment
+                    sentiment = analyze_headline_sentiment(tweet['text'])
+                    discovered_stocks[symbol]['sentiment_score'] += sentiment
+                    mentions.append((symbol, tweet_time(tweet), 'twitter', tweet['id'], sentiment))
+            
+            get_mention_store().record(mentions)
+            
         except Exception as e:
             pass  # Fall back to simulated data
     
@@ -230,160 +207,184 @@ def discover_stocks_from_social_media() -> str:
     # Process real Twitter data
     penny_stocks = []
     
-    for symbol, data in discovered_stocks.items():
-        if data['mentions'] >= 2:  # Only stocks mentioned multiple times
-            avg_sentiment = data['sentiment_score'] / data['mentions']
-            
-            try:
-                ticker = yf.Ticker(symbol)
-                info = ticker.info
-                current_price = info.get("regularMarketPrice", 0)
-                market_cap = info.get("marketCap", 0)
-                
-                # Only include penny stocks (under $5) with decent market cap
-                if current_price and current_price <= 5.0 and market_cap and market_cap >= 500000:
-                    penny_stocks.append({
-                        'symbol': symbol,
-                        'price': current_price,
-                        'market_cap': market_cap,
-                        'mentions': data['mentions'],
-                        'sentiment': avg_sentiment,
-                        'tweets': data['tweets'][:3],  # Top 3 tweets
-                        'platform': data['platform']
-                    })
-                
-                time.sleep(0.1)  # Rate limiting
-                
-            except:
-                continue
+    candidates = [symbol for symbol, data in discovered_stocks.items()
+                  if data['mentions'] >= 2]  # Only stocks mentioned multiple times
+    
+    # Lightweight quotes (no fundamentals scrape) for every candidate, fetched concurrently
+    quotes = fetch_all(lambda symbol: get_quote(symbol, PENNY_FILTER_FIELDS), candidates)
+    
+    for symbol in candidates:
+        data = discovered_stocks[symbol]
+        avg_sentiment = data['sentiment_score'] / data['mentions']
+        info = quotes[symbol]
+        
+        if isinstance(info, Exception):
+            continue
+        
+        current_price = info.get("regularMarketPrice", 0)
+        market_cap = info.get("marketCap", 0)
+        
+        # Only include penny stocks (under $5) with decent market cap
+        if current_price and current_price <= 5.0 and market_cap and market_cap >= 500000:
+            penny_stocks.append({
+                'symbol': symbol,
+                'price': current_price,
+                'market_cap': market_cap,
+                'mentions': data['mentions'],
+                'sentiment': avg_sentiment,
+                'tweets': data['tweets'][:3],  # Top 3 tweets
+                'platform': data['platform']
+            })
     
     # Sort by mentions and sentiment
     penny_stocks.sort(key=lambda x: (x['mentions'], x['sentiment']), reverse=True)
     
     if not penny_stocks:
-        result = "📱 Penny Stock Social Media Discovery:\n\n"
-        result += "Real-time social media discovery requires Twitter API integration.\n"
-        result += "The system would dynamically search for penny stock mentions on social media.\n\n"
-        result += "💡 To enable real social media discovery:\n"
-        result += "• Twitter API is configured and ready\n"
-        result += "• Search for penny stock keywords and mentions\n"
-        result += "• Analyze sentiment of social media posts\n"
-        result += "• Filter for stocks under $5 with positive sentiment\n\n"
-        result += "🔍 Use the news sentiment tool to monitor for breaking news that could drive social media activity."
-        
-        return result
+        result = ToolResult("SocialMediaStockDiscovery", "Penny Stock Social Media Discovery: no qualifying stocks", [],
+                            notes=["Real-time social media discovery requires Twitter API integration.",
+                                   "Set TWITTER_BEARER_TOKEN to search penny stock keywords, score tweet sentiment "
+                                   "and filter for stocks under $5.",
+                                   "Use the news sentiment tool to monitor for breaking news that could drive social media activity."])
+        return render(result)
+    
+    result = ToolResult("SocialMediaStockDiscovery",
+                        f"Discovered {len(penny_stocks)} penny stocks trending on social media",
+                        ["Symbol", "Price", "MarketCap", "Mentions", "Sentiment", "Platform", "Tweets"])
+    
+    for stock in penny_stocks[:10]:
+        result.add(stock['symbol'], round(stock['price'], 2), human_number(stock['market_cap']),
+                   stock['mentions'], round(stock['sentiment'], 2), stock['platform'],
+                   [shorten(tweet) for tweet in stock['tweets']])
+    
+    return render(result)
+
+@tool("BuzzVelocity")
+def scan_buzz_velocity(window_minutes: int = 60) -> str:
+    """
+    Ranks the stocks whose news and social media mentions are accelerating.
+    Compares mentions in the last window_minutes (default 60; use 1440 for a day)
+    with the window before it, from mentions recorded by the news and social
+    media discovery tools.
+    """
     
-    result = f"📱 Discovered {len(penny_stocks)} penny stocks trending on social media:\n\n"
+    window_minutes = max(5, int(window_minutes))
+    rows = get_mention_store().velocity(window=window_minutes * 60, limit=15)
     
-    for i, stock in enumerate(penny_stocks[:10]):
-        result += f"{i+1}. {stock['symbol']} - ${stock['price']:.2f}\n"
-        result += f"   Market Cap: ${stock['market_cap']:,.0f} | Mentions: {stock['mentions']}\n"
-        result += f"   Sentiment Score: {stock['sentiment']:.2f} | Platform: {stock['platform']}\n"
-        result += f"   Recent Tweets:\n"
-        for tweet in stock['tweets']:
-            result += f"   • {tweet}\n"
-        result += "\n"
+    result = ToolResult("BuzzVelocity", f"Mention velocity over the last {window_minutes} minutes",
+                        ["Symbol", "Mentions", "Previous", "Velocity", "Sentiment"])
+    for row in rows:
+        result.add(row['symbol'], row['mentions'], row['previous'], round(row['velocity'], 1),
+                   round(row['sentiment'], 2))
     
-    return result
+    if not rows:
+        result.note("No stock has 2+ mentions in this window yet. Run the news or social media "
+                    "discovery tools first so their mentions are recorded.")
+    
+    return render(result)
 
 @tool("EarningsCalendarScanner")
-def scan_earnings_calendar() -> str:
+def scan_earnings_calendar(days_ahead: int = 30) -> str:
     """
     Scans upcoming earnings calendar for penny stocks with potential catalysts.
     Identifies penny stocks with earnings announcements that could drive price movement.
-    """
     
-    import yfinance as yf
-    from datetime import datetime, timedelta
+    Args:
+        days_ahead: How many days ahead to look (default 30)
+    """
     
-    # Get current date and next 30 days
+    # Get current date and the end of the window
+    days_ahead = max(1, min(int(days_ahead), 60))
     today = datetime.now()
-    end_date = today + timedelta(days=30)
-    
-    # Dynamic penny stock discovery - no predefined lists
-    # The system will discover penny stocks from real-time market data
+    end_date = today + timedelta(days=days_ahead)
+    
+    # One calendar page per stale day, then a date-range lookup in the local index
+    calendar = get_earnings_calendar()
+    try:
+        calendar.refresh(days_ahead=days_ahead)
+    except Exception:
+        pass  # Use the calendar already stored
+    reports = calendar.between(today.date(), end_date.date())
+    
+    # Last-known prices from the symbol universe. The rest get their last close from one bulk
+    # history request, and only if the calendar's own market cap could pass the filter below
+    symbols = list(dict.fromkeys(report['symbol'] for report in reports))
+    prices = get_symbol_universe().last_prices(symbols)
+    missing = list(dict.fromkeys(report['symbol'] for report in reports
+                                 if report['symbol'] not in prices and (report['market_cap'] or 0) >= 500000))
+    unpriced = []
+    try:
+        closes = last_closes(missing)
+    except Exception:
+        closes = {}  # Network trouble or nothing recorded for a replay run
+    for symbol in missing:
+        if symbol in closes:
+            prices[symbol] = (closes[symbol], None)
+        else:
+            unpriced.append(symbol)
     
     earnings_data = []
-    
-    # For now, return informative message about real-time discovery
-    # In a full implementation, this would scan market data for penny stocks
-    result = "📅 Penny Stock Earnings Calendar (Next 30 Days):\n\n"
-    result += "Real-time earnings discovery requires market data API integration.\n"
-    result += "The system would dynamically scan all stocks under $5 for upcoming earnings.\n\n"
-    result += "💡 To enable real earnings discovery:\n"
-    result += "• Integrate with financial data APIs (Alpha Vantage, IEX Cloud, etc.)\n"
-    result += "• Scan market data for stocks under $5\n"
-    result += "• Filter for upcoming earnings in next 30 days\n"
-    result += "• Analyze earnings estimates and potential catalysts\n\n"
-    result += "🔍 Use the news sentiment tool to monitor for breaking earnings news."
-    
-    return result
+    for report in reports:
+        price, market_cap = prices.get(report['symbol'], (None, None))
+        market_cap = market_cap or report['market_cap']
+        # Penny stocks (under $5) with a $500K+ market cap
+        if price and price <= 5.0 and market_cap and market_cap >= 500000:
+            earnings_data.append((report, price, market_cap))
+    
+    result = ToolResult("EarningsCalendarScanner",
+                        f"Penny Stock Earnings Calendar ({today:%Y-%m-%d} to {end_date:%Y-%m-%d})",
+                        ["Symbol", "Date", "Time", "Price", "MarketCap", "EPSForecast"],
+                        notes=[f"{len(reports)} companies report in this window, {len(earnings_data)} are penny stocks"])
+    if unpriced:
+        result.note(f"No price available for {len(unpriced)} of them: {shorten(', '.join(unpriced), 200)}")
+    for report, price, market_cap in earnings_data:
+        result.add(report['symbol'], report['date'], report['time'], round(price, 2),
+                   human_number(market_cap), report['eps_forecast'])
+    
+    return render(result)
 
 @tool("MarketMomentumScanner")
-def scan_market_momentum() -> str:
+def scan_market_momentum(symbols: str = "") -> str:
     """
     Scans for penny stocks with unusual price movements, volume spikes, and momentum indicators.
     Identifies penny stocks showing significant price action and volume activity.
-    """
-    
-    import yfinance as yf
     
-    # Dynamic penny stock discovery - no predefined lists
-    # The system will discover penny stocks from real-time market data
-    
-    # For now, return informative message about real-time discovery
-    # In a full implementation, this would scan market data for penny stocks
-    result = "📊 Penny Stock Momentum Scanner:\n\n"
-    result += "Real-time momentum discovery requires market data API integration.\n"
-    result += "The system would dynamically scan all stocks under $5 for momentum indicators.\n\n"
-    result += "💡 To enable real momentum discovery:\n"
-    result += "• Integrate with market data APIs (Alpha Vantage, IEX Cloud, etc.)\n"
-    result += "• Scan all stocks under $5 for price movements\n"
-    result += "• Analyze volume spikes and unusual activity\n"
-    result += "• Calculate momentum scores based on price and volume\n\n"
-    result += "🔍 Use the news sentiment tool to monitor for breaking news that could drive momentum."
-    
-    return result
-
-def analyze_headline_sentiment(headline: str) -> float:
-    """
-    Enhanced sentiment analysis based on keywords for penny stocks.
-    Returns a score between -1 (very negative) and 1 (very positive).
+    Args:
+        symbols: Comma-separated symbols to scan (default: every listed stock under $5)
     """
-    headline_lower = headline.lower()
     
-    # Positive keywords (expanded for penny stocks)
-    positive_words = [
-        'surge', 'jump', 'rise', 'gain', 'up', 'higher', 'beat', 'exceed', 'positive', 'bullish', 'growth', 'profit', 'earnings beat',
-        'approval', 'launch', 'partnership', 'deal', 'acquisition', 'merger', 'expansion', 'new', 'breakthrough', 'innovation',
-        'success', 'win', 'award', 'contract', 'revenue', 'sales', 'demand', 'popular', 'trending', 'hot', 'moon', 'rocket'
-    ]
+    universe = resolve_universe(symbols, max_price=5.0)
     
-    # Negative keywords
-    negative_words = [
-        'drop', 'fall', 'decline', 'down', 'lower', 'miss', 'loss', 'negative', 'bearish', 'crash', 'plunge', 'earnings miss',
-        'rejection', 'failure', 'bankruptcy', 'delisting', 'fraud', 'investigation', 'lawsuit', 'recall', 'disappointment'
-    ]
+    # Bring the local bar store up to date (only the newest bars are downloaded), then
+    # compute every indicator for the whole universe at once from the stored history
+    store = get_bar_store()
+    try:
+        store.update(universe)
+    except Exception:
+        pass  # Scan whatever history is already stored
     
-    # Neutral/context keywords that might indicate activity (good for penny stocks)
-    activity_words = ['announce', 'report', 'release', 'update', 'news', 'trading', 'volume', 'movement', 'activity']
+    dates, names, arrays = store.matrix(universe, days=HISTORY_DAYS)
+    movers = scan_momentum(names, arrays, max_price=5.0, top_n=10)
     
-    positive_count = sum(1 for word in positive_words if word in headline_lower)
-    negative_count = sum(1 for word in negative_words if word in headline_lower)
-    activity_count = sum(1 for word in activity_words if word in headline_lower)
+    if movers.empty:
+        return render(ToolResult("MarketMomentumScanner", "Penny Stock Momentum Scanner: no movers found", [],
+                                 notes=[f"Scanned {len(universe)} symbols, {len(names)} with stored price history."]))
     
-    # If no clear sentiment but has activity, give slight positive bias for penny stocks
-    if positive_count == 0 and negative_count == 0 and activity_count > 0:
-        return 0.1  # Slight positive for activity
+    result = ToolResult("MarketMomentumScanner",
+                        f"Top penny stock movers as of {dates[-1]} ({len(names)} symbols scanned)",
+                        ["Symbol", "Price", "ROC5d%", "RSI14", "VolumeZ", "Gap%"],
+                        notes=["ROC5d% = 5-day price change; VolumeZ = today's volume in standard deviations "
+                               "above the 20-day average (capped at 10); Gap% = open vs previous close"])
     
-    if positive_count == 0 and negative_count == 0:
-        return 0.0  # Neutral
+    for symbol, row in movers.iterrows():
+        result.add(symbol, round(row['price'], 2), round(row['roc'], 1), round(row['rsi'], 0),
+                   round(row['volume_z'], 1) if pd.notna(row['volume_z']) else None,
+                   round(row['gap'], 1) if pd.notna(row['gap']) else None)
     
-    # Calculate sentiment score
-    sentiment = (positive_count - negative_count) / (positive_count + negative_count)
-    
-    # Boost slightly for penny stocks with activity
-    if activity_count > 0:
-        sentiment += 0.1
-    
-    return max(-1.0, min(1.0, sentiment))  # Clamp between -1 and 1 
\ No newline at end of file
+    return render(result)
+
+def analyze_headline_sentiment(headline: str) -> float:
+    """
+    Enhanced sentiment analysis based on keywords for penny stocks.
+    Returns a score between -1 (very negative) and 1 (very positive).
+    """
+    return score_text(headline)
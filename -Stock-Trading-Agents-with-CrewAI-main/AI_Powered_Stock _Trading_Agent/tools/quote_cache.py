@@ -0,0 +1,212 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import closing
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+# Live market fields go stale within seconds
+PRICE_FIELDS = (
+    "regularMarketPrice",
+    "regularMarketChange",
+    "regularMarketChangePercent",
+    "regularMarketPreviousClose",
+    "marketCap",
+    "dayHigh",
+    "dayLow",
+    "regularMarketVolume",
+)
+
+# Company profile and analyst fields barely move during a trading session
+PROFILE_FIELDS = (
+    "currency",
+    "sector",
+    "recommendationKey",
+    "revenueGrowth",
+    "earningsQuarterlyGrowth",
+    "pegRatio",
+    "dividendYield",
+)
+
+
+class QuoteCache:
+    """
+    Thread-safe quote cache keyed by symbol.
+
+    Every field is stored with its own timestamp and expires according to its
+    TTL, so cheap-to-refresh price fields can expire while slow-moving profile
+    fields stay cached. The number of symbols is bounded and the least recently
+    used symbol is evicted first.
+
+    With a path, every stored field is also written to a SQLite table that
+    in-memory misses fall back to, so quotes fetched by another process (the
+    prefetch daemon) are served here while they are within their TTL.
+    """
+
+    def __init__(self, max_symbols: int = 512, price_ttl: float = 15.0,
+                 profile_ttl: float = 6 * 3600.0, default_ttl: float = 60.0,
+                 path: Optional[str] = None):
+        self.max_symbols = max_symbols
+        self.path = path
+        self.default_ttl = default_ttl
+        self.field_ttls = {field: price_ttl for field in PRICE_FIELDS}
+        self.field_ttls.update({field: profile_ttl for field in PROFILE_FIELDS})
+
+        self._entries: "OrderedDict[str, Dict[str, tuple]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        # The SQLite store is created on first use, not when the module is imported
+        self._db_ready = False
+        self._db_lock = threading.Lock()
+
+    def _ensure_db(self) -> None:
+        with self._db_lock:
+            if self._db_ready:
+                return
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with closing(self._connect()) as conn:
+                conn.execute("CREATE TABLE IF NOT EXISTS quotes (symbol TEXT, field TEXT, value TEXT, ts REAL, "
+                             "PRIMARY KEY (symbol, field))")
+            self._db_ready = True
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def ttl_for(self, field: str) -> float:
+        return self.field_ttls.get(field, self.default_ttl)
+
+    def get(self, symbol: str, fields: Iterable[str]) -> Optional[Dict[str, Any]]:
+        """
+        Returns the requested fields for a symbol, or None if any of them is
+        missing or expired. Counts a hit or a miss either way.
+        """
+        symbol = symbol.upper()
+        fields = tuple(fields)
+
+        with self._lock:
+            values = self._fresh(symbol, fields)
+            if values is None and self.path:
+                self._load(symbol)
+                values = self._fresh(symbol, fields)
+
+            if values is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(symbol)
+            self.hits += 1
+            return values
+
+    def _fresh(self, symbol: str, fields: Tuple[str, ...]) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(symbol)
+        if entry is None:
+            return None
+
+        now = time.time()
+        values = {}
+        for field in fields:
+            cached = entry.get(field)
+            if cached is None or now - cached[1] > self.ttl_for(field):
+                return None
+            values[field] = cached[0]
+        return values
+
+    def _load(self, symbol: str) -> None:
+        """Merges the stored fields of a symbol that are newer than the in-memory ones."""
+        self._ensure_db()
+        with closing(self._connect()) as conn:
+            rows = conn.execute("SELECT field, value, ts FROM quotes WHERE symbol = ?", (symbol,)).fetchall()
+        if not rows:
+            return
+
+        entry = self._entries.setdefault(symbol, {})
+        for field, value, ts in rows:
+            if field not in entry or entry[field][1] < ts:
+                entry[field] = (json.loads(value), ts)
+        self._evict()
+
+    def put(self, symbol: str, data: Dict[str, Any]) -> None:
+        """Stores every field of data for a symbol, stamped with the current time."""
+        symbol = symbol.upper()
+        now = time.time()
+
+        with self._lock:
+            entry = self._entries.setdefault(symbol, {})
+            for field, value in data.items():
+                entry[field] = (value, now)
+            self._entries.move_to_end(symbol)
+            self._evict()
+
+        if self.path:
+            rows = [(symbol, field, json.dumps(value, default=_json_value), now) for field, value in data.items()]
+            self._ensure_db()
+            with closing(self._connect()) as conn:
+                with conn:
+                    conn.executemany("INSERT OR REPLACE INTO quotes (symbol, field, value, ts) VALUES (?, ?, ?, ?)",
+                                     rows)
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.max_symbols:
+            self._entries.popitem(last=False)
+
+    def get_or_fetch(self, symbol: str, fields: Iterable[str],
+                     fetch: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Returns the requested fields from the cache, calling fetch() and storing
+        its result when any of them is missing or expired.
+        """
+        fields = tuple(fields)
+        values = self.get(symbol, fields)
+        if values is not None:
+            return values
+
+        data = fetch() or {}
+        # Fields the source does not report (e.g. no dividend) are cached as None,
+        # otherwise they would count as missing and force a refetch on every lookup
+        values = {field: data.get(field) for field in fields}
+        self.put(symbol, {**data, **values})
+        return values
+
+    def invalidate(self, symbol: Optional[str] = None) -> None:
+        """Drops one symbol, or the whole cache when no symbol is given."""
+        with self._lock:
+            if symbol is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(symbol.upper(), None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "symbols": len(self._entries),
+            }
+
+    def summary(self) -> str:
+        stats = self.stats()
+        return (f"Quote cache: {stats['hits']} hits / {stats['misses']} misses "
+                f"({stats['hit_rate']:.0%} hit rate, {stats['symbols']} symbols cached)")
+
+
+def _json_value(value: Any) -> Any:
+    """numpy scalars (fast_info returns some) as plain Python numbers"""
+    return value.item() if hasattr(value, "item") else str(value)
+
+
+# Process-wide cache shared by every tool and agent, and through QUOTE_CACHE_DB with other processes
+quote_cache = QuoteCache(
+    max_symbols=int(os.getenv('QUOTE_CACHE_MAX_SYMBOLS', '512')),
+    price_ttl=float(os.getenv('QUOTE_CACHE_PRICE_TTL', '15')),
+    profile_ttl=float(os.getenv('QUOTE_CACHE_PROFILE_TTL', '21600')),
+    path=os.getenv('QUOTE_CACHE_DB') or None,
+)
@@ -0,0 +1,181 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """
+    Classic token bucket: refills at rate tokens per second up to capacity.
+    acquire() blocks until a token is available, so callers in any number of
+    threads together never exceed the budget.
+
+    Background callers (see background_priority()) only take a token while no
+    interactive caller is waiting for one, so cache warming never delays a
+    tool call that needs the same host.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._waiting = 0  # Interactive callers blocked in acquire()
+
+    def acquire(self, tokens: float = 1.0, background: Optional[bool] = None) -> None:
+        if background is None:
+            background = in_background()
+        if not background:
+            with self._lock:
+                self._waiting += 1
+
+        try:
+            while True:
+                with self._lock:
+                    now = time.monotonic()
+                    self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                    self._updated = now
+
+                    if self._tokens >= tokens and (not background or self._waiting == 0):
+                        self._tokens -= tokens
+                        return
+                    wait = max((tokens - self._tokens) / self.rate, 0.05)
+
+                time.sleep(wait)
+        finally:
+            if not background:
+                with self._lock:
+                    self._waiting -= 1
+
+
+def parse_limits(spec: str) -> Dict[str, Tuple[float, float]]:
+    """Parses 'host=rate:burst,host=rate:burst' into {host: (rate, burst)}."""
+    limits = {}
+    for item in spec.split(","):
+        if "=" not in item:
+            continue
+        host, budget = item.split("=", 1)
+        rate, _, burst = budget.partition(":")
+        limits[host.strip().lower()] = (float(rate), float(burst or rate))
+    return limits
+
+
+_buckets: Dict[str, TokenBucket] = {}
+_buckets_by_host: Dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+_limits: Optional[Dict[str, Tuple[float, float]]] = None
+
+
+def limiter_for(host_or_url: str) -> TokenBucket:
+    """
+    Returns the shared bucket for a host. A configured host also covers its
+    subdomains, so 'yahoo.com' limits query1.finance.yahoo.com and feeds.finance.yahoo.com.
+    RATE_LIMITS is read once, on the first call.
+    """
+    global _limits
+
+    host = (urlparse(host_or_url).hostname or host_or_url).lower()
+    bucket = _buckets_by_host.get(host)
+    if bucket is not None:
+        return bucket
+
+    with _buckets_lock:
+        if _limits is None:
+            _limits = parse_limits(os.getenv('RATE_LIMITS', ''))
+
+        key, budget = host, None
+        for configured, configured_budget in _limits.items():
+            if host == configured or host.endswith("." + configured):
+                key, budget = configured, configured_budget
+                break
+
+        if key not in _buckets:
+            if budget is None:
+                rate, _, burst = os.getenv('RATE_LIMIT_DEFAULT', '5:10').partition(":")
+                budget = (float(rate), float(burst or rate))
+            _buckets[key] = TokenBucket(*budget)
+        _buckets_by_host[host] = _buckets[key]
+        return _buckets[key]
+
+
+_local = threading.local()
+
+
+def in_background() -> bool:
+    """True inside background_priority() or on a background pool worker."""
+    return getattr(_local, "background", False)
+
+
+@contextmanager
+def background_priority() -> Iterator[None]:
+    """Marks the current thread's network calls as background work: they yield tokens to interactive callers."""
+    previous = in_background()
+    _local.background = True
+    try:
+        yield
+    finally:
+        _local.background = previous
+
+
+_pool: Optional[ThreadPoolExecutor] = None
+_background_pool: Optional[ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def fetch_pool() -> ThreadPoolExecutor:
+    """Bounded thread pool shared by every tool for network I/O."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=int(os.getenv('FETCH_POOL_WORKERS', '8')),
+                                       thread_name_prefix="fetch")
+        return _pool
+
+
+def background_pool() -> ThreadPoolExecutor:
+    """
+    Small separate pool for cache warming (universe enrichment, calendar refresh),
+    so a long background batch never queues ahead of a tool call in fetch_pool().
+    """
+    global _background_pool
+    with _pool_lock:
+        if _background_pool is None:
+            _background_pool = ThreadPoolExecutor(max_workers=int(os.getenv('BACKGROUND_POOL_WORKERS', '2')),
+                                                  thread_name_prefix="background-fetch")
+        return _background_pool
+
+
+def fetch_all(fetch: Callable[[Any], Any], items: Iterable[Any],
+              host: Optional[str] = None, background: Optional[bool] = None) -> Dict[Any, Any]:
+    """
+    Runs fetch(item) for every item on the shared pool and returns {item: result}.
+    With host, every call first takes a token from that host's bucket. Items whose
+    fetch raised map to the exception instead of a result.
+
+    Background work (background=True, or a call made inside background_priority())
+    runs on background_pool() and yields rate limit tokens to interactive callers.
+    """
+    if background is None:
+        background = in_background()
+
+    def run(item):
+        with background_priority() if background else nullcontext():
+            if host:
+                limiter_for(host).acquire()
+            return fetch(item)
+
+    items = list(dict.fromkeys(items))
+    pool = background_pool() if background else fetch_pool()
+    futures = {item: pool.submit(run, item) for item in items}
+
+    results = {}
+    for item, future in futures.items():
+        try:
+            results[item] = future.result()
+        except Exception as e:
+            results[item] = e
+    return results
@@ -0,0 +1,95 @@
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+
+class RunSnapshot:
+    """
+    Every field fetched for each symbol during one crew kickoff.
+
+    The first tool to ask for a symbol's fields fetches them; every later
+    request in the same run, from any tool or code path, gets the same values
+    without going back to the cache or the network. Concurrent requests for one
+    symbol wait for the first fetch instead of starting their own.
+    """
+
+    def __init__(self):
+        self._data: Dict[str, Dict[str, Any]] = {}
+        self._symbol_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.fetches = 0
+        self.reuses = 0
+
+    def get_or_fetch(self, symbol: str, fields: Iterable[str],
+                     fetch: Callable[[Tuple[str, ...]], Dict[str, Any]]) -> Dict[str, Any]:
+        """Returns the requested fields, calling fetch(missing_fields) only for fields not seen this run."""
+        symbol = symbol.upper()
+        fields = tuple(fields)
+
+        with self._symbol_lock(symbol):
+            data = self._data.setdefault(symbol, {})
+            missing = tuple(field for field in fields if field not in data)
+
+            if missing:
+                fetched = fetch(missing) or {}
+                data.update(fetched)
+                for field in missing:
+                    data.setdefault(field, None)
+                with self._lock:
+                    self.fetches += 1
+            else:
+                with self._lock:
+                    self.reuses += 1
+
+            return {field: data[field] for field in fields}
+
+    def peek(self, symbol: str, fields: Iterable[str]) -> Optional[Dict[str, Any]]:
+        """The requested fields if all of them were fetched this run, else None. Never fetches."""
+        data = self._data.get(symbol.upper(), {})
+        if all(field in data for field in fields):
+            return {field: data[field] for field in fields}
+        return None
+
+    def put(self, symbol: str, data: Dict[str, Any]) -> None:
+        with self._symbol_lock(symbol.upper()):
+            self._data.setdefault(symbol.upper(), {}).update(data)
+
+    def summary(self) -> str:
+        return (f"Run snapshot: {len(self._data)} symbols, {self.fetches} fetches, "
+                f"{self.reuses} lookups served from the snapshot")
+
+    def _symbol_lock(self, symbol: str) -> threading.Lock:
+        with self._lock:
+            return self._symbol_locks.setdefault(symbol, threading.Lock())
+
+
+# Tools run on CrewAI's worker threads and on the shared fetch pool, so the
+# active snapshot is process-wide rather than a context variable
+_current: Optional[RunSnapshot] = None
+_current_lock = threading.Lock()
+
+
+def current_snapshot() -> Optional[RunSnapshot]:
+    return _current
+
+
+@contextmanager
+def run_snapshot() -> Iterator[RunSnapshot]:
+    """
+    Scopes one run: inside the block every quote lookup goes through a shared
+    snapshot. Nested blocks join the snapshot that is already active.
+    """
+    global _current
+
+    with _current_lock:
+        outer = _current
+        if outer is None:
+            _current = RunSnapshot()
+        snapshot = _current
+
+    try:
+        yield snapshot
+    finally:
+        if outer is None:
+            with _current_lock:
+                _current = None
@@ -0,0 +1,206 @@
+import os
+import time
+import warnings
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from tools.market_data import get_quote
+from tools.rate_limiter import fetch_all
+from tools.symbol_universe import get_symbol_universe
+from tools.tool_output import ToolResult
+
+# .info fields the screener reads, and the frame column each one becomes.
+# Price and market cap come from the symbol universe in one query; only the
+# growth and profile fields are looked up per symbol, on the quote cache's profile TTL
+PRICE_COLUMNS = {
+    "regularMarketPrice": "price",
+    "marketCap": "market_cap",
+}
+PROFILE_COLUMNS = {
+    "revenueGrowth": "revenue_growth",
+    "earningsQuarterlyGrowth": "earnings_growth",
+    "pegRatio": "peg_ratio",
+    "sector": "sector",
+}
+SCREEN_COLUMNS = {**PRICE_COLUMNS, **PROFILE_COLUMNS}
+
+NUMERIC_COLUMNS = ["price", "market_cap", "revenue_growth", "earnings_growth", "peg_ratio"]
+
+# Growth score criteria: revenue growth, earnings growth and PEG ratio thresholds with their weights
+GROWTH_CRITERIA = {"revenue_growth": 0.10, "earnings_growth": 0.10, "peg_ratio": 1.5,
+                   "weights": (2, 2, 1), "min_score": 2}
+SECTOR_CRITERIA = {"revenue_growth": 0.15, "earnings_growth": 0.15, "peg_ratio": 1.2,
+                   "weights": (3, 3, 2), "min_score": 3}
+
+
+def default_universe() -> List[str]:
+    """Symbols to screen when a tool is not given any, from SCAN_UNIVERSE."""
+    return parse_symbols(os.getenv('SCAN_UNIVERSE', ''))
+
+
+def resolve_universe(symbols: str = "", max_price: Optional[float] = None,
+                     min_market_cap: float = 0, sector: Optional[str] = None) -> List[str]:
+    """
+    Picks the symbols a scanner should screen: the explicit list if one was given,
+    otherwise an indexed lookup in the symbol universe (by sector or by last-known
+    price), falling back to SCAN_UNIVERSE while the universe has no profile data yet.
+    """
+    explicit = parse_symbols(symbols)
+    if explicit:
+        return explicit
+
+    universe = get_symbol_universe()
+    if sector:
+        candidates = universe.symbols_in_sector(sector, max_price=max_price)
+    elif max_price is not None:
+        candidates = universe.low_price_symbols(max_price, min_market_cap)
+    else:
+        candidates = []
+
+    return candidates or default_universe()
+
+
+def parse_symbols(symbols: str) -> List[str]:
+    """Turns 'nio, SNDL,NIO' into ['NIO', 'SNDL']."""
+    parsed = [symbol.strip().upper() for symbol in symbols.split(",") if symbol.strip()]
+    return list(dict.fromkeys(parsed))
+
+
+def load_fundamentals_frame(symbols: Iterable[str]) -> pd.DataFrame:
+    """
+    Loads the screening fields for every symbol into one frame indexed by symbol.
+    Symbols whose data cannot be fetched are left out.
+
+    Last-known prices and market caps are read from the symbol universe in bulk,
+    and the growth and profile fields go through the quote cache, where they stay
+    fresh for hours, so repeated screens of the same universe stay local. Symbols
+    the universe has no price for yet get all fields from the same lookup, and
+    the price is written back so the next screen finds it there. Cache misses are
+    fetched concurrently on the shared rate-limited pool.
+    """
+    symbols = [symbol.upper() for symbol in symbols]
+    universe = get_symbol_universe()
+    prices = universe.last_prices(symbols)
+
+    def lookup(symbol):
+        return get_quote(symbol, PROFILE_COLUMNS if symbol in prices else SCREEN_COLUMNS)
+
+    rows = {}
+    profiles = []
+    for symbol, info in fetch_all(lookup, symbols).items():
+        if isinstance(info, Exception):
+            continue
+        if symbol in prices:
+            info = dict(info, regularMarketPrice=prices[symbol][0], marketCap=prices[symbol][1])
+        elif info.get("regularMarketPrice") is not None:
+            profiles.append((info.get("sector"), None, info["regularMarketPrice"], info.get("marketCap"),
+                             time.time(), symbol))
+        rows[symbol] = {column: info.get(field) for field, column in SCREEN_COLUMNS.items()}
+
+    universe.record_profiles(profiles)  # Symbols that are not listed are not stored
+
+    frame = pd.DataFrame.from_dict(rows, orient="index", columns=list(SCREEN_COLUMNS.values()))
+    frame[NUMERIC_COLUMNS] = frame[NUMERIC_COLUMNS].apply(pd.to_numeric, errors="coerce")
+    return frame
+
+
+def screen(frame: pd.DataFrame, price_threshold: Optional[float] = None,
+           min_market_cap: Optional[float] = None, sector: Optional[str] = None,
+           criteria: Dict = GROWTH_CRITERIA, top_n: int = 10) -> pd.DataFrame:
+    """
+    Applies the price, market cap and sector filters and the weighted growth score
+    to the whole frame at once, and returns the top_n rows by growth_score.
+    Missing values never pass a filter or earn score points.
+    """
+    if frame.empty:
+        return frame.assign(growth_score=pd.Series(dtype=int))
+
+    price = frame["price"].to_numpy(dtype=float)
+    market_cap = frame["market_cap"].to_numpy(dtype=float)
+    peg = frame["peg_ratio"].to_numpy(dtype=float)
+
+    # Comparisons with NaN are False, so missing data drops out of the masks
+    mask = price > 0
+    if price_threshold is not None:
+        mask &= price <= price_threshold
+    if min_market_cap is not None:
+        mask &= market_cap >= min_market_cap
+    if sector:
+        mask &= frame["sector"].fillna("").str.lower().to_numpy() == sector.lower()
+
+    signals = np.column_stack([
+        frame["revenue_growth"].to_numpy(dtype=float) > criteria["revenue_growth"],
+        frame["earnings_growth"].to_numpy(dtype=float) > criteria["earnings_growth"],
+        (peg != 0) & (peg < criteria["peg_ratio"]),
+    ])
+    score = signals @ np.asarray(criteria["weights"])
+    mask &= score >= criteria["min_score"]
+
+    # Partial sort: only the top_n candidates get fully ordered
+    candidates = np.flatnonzero(mask)
+    if len(candidates) > top_n:
+        candidates = candidates[np.argpartition(-score[candidates], top_n - 1)[:top_n]]
+    candidates = candidates[np.argsort(-score[candidates], kind="stable")]
+
+    result = frame.iloc[candidates].copy()
+    result["growth_score"] = score[candidates]
+    return result
+
+
+def detect_volume_spikes(bars: pd.DataFrame, min_ratio: float = 2.0, top_n: int = 5) -> pd.DataFrame:
+    """
+    Finds volume spikes across every symbol of a wide OHLCV frame at once.
+
+    bars has (field, symbol) columns and one row per day. The last row is
+    compared with the mean volume of the rows before it; symbols whose ratio
+    exceeds min_ratio are returned, highest ratio first.
+    """
+    columns = ["price", "volume_ratio", "price_change", "current_volume", "avg_volume"]
+    if len(bars) < 2:
+        return pd.DataFrame(columns=columns)
+
+    volume = bars["Volume"].to_numpy(dtype=float)
+    close = bars["Close"].to_numpy(dtype=float)
+    symbols = bars["Volume"].columns
+
+    current_volume = volume[-1]
+    with np.errstate(divide="ignore", invalid="ignore"), warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # Symbols without any history
+        avg_volume = np.nanmean(volume[:-1], axis=0)
+        volume_ratio = np.where(avg_volume > 0, current_volume / avg_volume, np.nan)
+    price_change = close[-1] - close[-2]
+
+    # NaN ratios (no volume today, no history) compare False and drop out
+    spikes = np.flatnonzero(volume_ratio > min_ratio)
+    if len(spikes) > top_n:
+        spikes = spikes[np.argpartition(-volume_ratio[spikes], top_n - 1)[:top_n]]
+    spikes = spikes[np.argsort(-volume_ratio[spikes], kind="stable")]
+
+    return pd.DataFrame({
+        "price": close[-1][spikes],
+        "volume_ratio": volume_ratio[spikes],
+        "price_change": price_change[spikes],
+        "current_volume": current_volume[spikes],
+        "avg_volume": avg_volume[spikes],
+    }, index=symbols[spikes], columns=columns)
+
+
+def screen_result(tool: str, title: str, result: pd.DataFrame, max_score: int) -> ToolResult:
+    """Turns a screen() frame into a ToolResult, one row per stock."""
+    output = ToolResult(tool, title, ["Symbol", "Price", "Sector", "RevenueGrowth", "EarningsGrowth",
+                                      "PEG", f"Score/{max_score}"])
+    for symbol, row in result.iterrows():
+        output.add(symbol, round(row["price"], 2), row["sector"] if isinstance(row["sector"], str) else None,
+                   _percent(row["revenue_growth"]), _percent(row["earnings_growth"]),
+                   _ratio(row["peg_ratio"]), int(row["growth_score"]))
+    return output
+
+
+def _percent(value) -> Optional[str]:
+    return f"{value:.1%}" if pd.notna(value) else None
+
+
+def _ratio(value) -> Optional[float]:
+    return round(float(value), 2) if pd.notna(value) else None
@@ -0,0 +1,112 @@
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List
+
+# Keywords tuned for penny stock headlines and posts
+POSITIVE_WORDS = [
+    'surge', 'jump', 'rise', 'gain', 'up', 'higher', 'beat', 'exceed', 'positive', 'bullish', 'growth', 'profit', 'earnings beat',
+    'approval', 'launch', 'partnership', 'deal', 'acquisition', 'merger', 'expansion', 'new', 'breakthrough', 'innovation',
+    'success', 'win', 'award', 'contract', 'revenue', 'sales', 'demand', 'popular', 'trending', 'hot', 'moon', 'rocket'
+]
+
+NEGATIVE_WORDS = [
+    'drop', 'fall', 'decline', 'down', 'lower', 'miss', 'loss', 'negative', 'bearish', 'crash', 'plunge', 'earnings miss',
+    'rejection', 'failure', 'bankruptcy', 'delisting', 'fraud', 'investigation', 'lawsuit', 'recall', 'disappointment'
+]
+
+# Neutral words that still signal activity (good for penny stocks)
+ACTIVITY_WORDS = ['announce', 'report', 'release', 'update', 'news', 'trading', 'volume', 'movement', 'activity']
+
+POSITIVE, NEGATIVE, ACTIVITY = 0, 1, 2
+
+TOKEN_PATTERN = re.compile(r"[a-z]+")
+
+# Past tenses and participles the suffix rules can't produce
+IRREGULAR_FORMS = {
+    'rise': ['rose', 'risen'],
+    'fall': ['fell', 'fallen'],
+    'win': ['won'],
+    'beat': ['beaten'],
+}
+
+# One-syllable words ending consonant-vowel-consonant double the consonant: drop -> dropped, win -> winning
+DOUBLING_PATTERN = re.compile(r"^[^aeiou]*[aeiou][^aeiouwxy]$")
+
+
+def inflections(word: str) -> List[str]:
+    """
+    surge -> surge, surges, surged, surging; jump -> jump, jumps, jumped, jumping;
+    drop -> drop, drops, dropped, dropping; rise -> ..., rose, risen
+    """
+    if " " in word:
+        return [word]
+    forms = [word, word + ("es" if word.endswith(("s", "x", "z", "ch", "sh")) else "s")]
+    if word.endswith("e"):
+        forms += [word + "d", word[:-1] + "ing"]
+    elif DOUBLING_PATTERN.match(word):
+        forms += [word + word[-1] + "ed", word + word[-1] + "ing"]
+    else:
+        forms += [word + "ed", word + "ing"]
+    return forms + IRREGULAR_FORMS.get(word, [])
+
+
+def build_lexicon() -> Dict[str, int]:
+    """
+    Maps every keyword, its inflected forms and the two-word phrases to a
+    polarity class. A listed keyword always wins over another keyword's
+    inflection ('news' is activity, not a form of 'new').
+    """
+    groups = ((POSITIVE, POSITIVE_WORDS), (NEGATIVE, NEGATIVE_WORDS), (ACTIVITY, ACTIVITY_WORDS))
+    lexicon = {}
+    for polarity, words in groups:
+        for word in words:
+            for form in inflections(word):
+                lexicon.setdefault(form, polarity)
+    for polarity, words in groups:
+        for word in words:
+            lexicon[word] = polarity
+    return lexicon
+
+
+LEXICON = build_lexicon()
+
+
+@lru_cache(maxsize=8192)
+def score_text(text: str) -> float:
+    """
+    Keyword sentiment between -1 (very negative) and 1 (very positive).
+
+    The text is tokenized once and every word and adjacent word pair is looked
+    up in the lexicon, so 'up' no longer matches inside 'update'. Repeated
+    texts (retweets, syndicated headlines) come straight from the cache.
+    """
+    counts = [0, 0, 0]
+    previous = None
+    for token in TOKEN_PATTERN.findall(text.lower()):
+        polarity = LEXICON.get(token)
+        if polarity is not None:
+            counts[polarity] += 1
+        if previous is not None:
+            polarity = LEXICON.get(previous + " " + token)
+            if polarity is not None:
+                counts[polarity] += 1
+        previous = token
+
+    positive_count, negative_count, activity_count = counts
+
+    # If no clear sentiment but has activity, give slight positive bias for penny stocks
+    if positive_count == 0 and negative_count == 0:
+        return 0.1 if activity_count > 0 else 0.0
+
+    sentiment = (positive_count - negative_count) / (positive_count + negative_count)
+
+    # Boost slightly for penny stocks with activity
+    if activity_count > 0:
+        sentiment += 0.1
+
+    return max(-1.0, min(1.0, sentiment))
+
+
+def score_texts(texts: Iterable[str]) -> List[float]:
+    """Scores a batch of texts in one call."""
+    return [score_text(text) for text in texts]
@@ -1,18 +1,33 @@
-import yfinance as yf
 from crewai.tools import tool
 
+from tools.data_providers import get_provider
+from tools.quote_cache import quote_cache, PRICE_FIELDS, PROFILE_FIELDS
+from tools.market_data import get_quote
+from tools.run_snapshot import current_snapshot
+from tools.tool_output import ToolResult, render
+
+# Columns of the batch table, all available from a single bulk price download
+TABLE_FIELDS = tuple(field for field in PRICE_FIELDS if field != "marketCap")
+
 @tool("MarketPulse")
 def stock_price(stock_name: str) -> str:  # This defines a function. You give it a stock name and it will return a text string.
     """
     Returns key stock metrics such as price, daily change, sector, and financial growth indicators.
+    Pass a comma-separated list of symbols (e.g. "NIO,SNDL,TLRY") to get a compact
+    price table for all of them in a single call.
     """
 
-    # stock_name: str : for eg(AAPL, etc.)
-    stock = yf.Ticker(stock_name)  # .Ticker("") gives us access to everything about Apple’s stock — price, history, financials, etc.
-                                   # Loads live info for the company you're looking up.
-    info = stock.info              #This accesses the .info property of the stock object.
-                                   #It gives you a dictionary (a data structure like a list of key-value pairs).
+    if "," in stock_name:
+        symbols = [symbol.strip().upper() for symbol in stock_name.split(",") if symbol.strip()]
+        return batch_stock_price(list(dict.fromkeys(symbols)))  # dict.fromkeys drops duplicates but keeps the order
 
+    # stock_name: str : for eg(AAPL, etc.)
+    # Two tiers, each answered by the quote cache when fresh:
+    # profile fields (sector, growth, recommendation) come from the full .info scrape and are kept for hours,
+    # live price fields expire within seconds. Profile first: the scrape also carries every price field and
+    # the cache stores all of it, so a cold lookup costs one request instead of a scrape plus a quote.
+    profile = get_quote(stock_name, PROFILE_FIELDS)
+    info = {**get_quote(stock_name, PRICE_FIELDS), **profile}
 
     current_price = info.get("regularMarketPrice")
     recommendation = info.get("recommendationKey")
@@ -20,33 +35,96 @@ def stock_price(stock_name: str) -> str:  # This defines a function. You give it
     today_low = info.get("dayLow")
     change = info.get("regularMarketChange")
     change_precent = info.get("regularMarketChangePercent")
-    currency = info.get("currency","USD")
+    volume = info.get("regularMarketVolume")
+    currency = info.get("currency") or "USD"
     revenue_growth = info.get("revenueGrowth")
     dividend_return = info.get("dividendYield")
     growth_rate = info.get("earningsQuarterlyGrowth")
     sector = info.get("sector")
 
     if current_price is None:
-        return f"could not fetch price for {stock_name}. Please check the name or symbol."
-
-    return (
-        f"Stock: {stock_name.upper()}\n"
-        f"Price: {current_price} {currency}\n"
-        f"change:{change} ({round(change_precent, 2)}%)\n"
-        f"High/Low Today: {today_high} / {today_low}\n"
-        f"Sector: {sector}\n"
-        f"Recommendation: {recommendation}\n"
-        f"Quarterly Earnings Growth: {growth_rate}\n"
-        f"Revenue Growth: {revenue_growth}\n"
-        f"Dividend Yield: {dividend_return}\n"
-    )
-
-
-
-
-
-
+        return render(ToolResult("MarketPulse", f"could not fetch price for {stock_name}. Please check the name or symbol.", []))
 
+    result = ToolResult("MarketPulse", f"{stock_name.upper()} market data ({currency})",
+                        ["Stock", "Price", "Change", "Change%", "High", "Low", "Volume", "Sector",
+                         "Recommendation", "QuarterlyEarningsGrowth", "RevenueGrowth", "DividendYield"],
+                        humanize=["Volume"])
+    result.add(stock_name.upper(), current_price, _round(change), _round(change_precent), today_high, today_low,
+               volume, sector, recommendation, growth_rate, revenue_growth, dividend_return)
+    return render(result)
 
 
+def batch_stock_price(symbols: list) -> str:
+    """
+    Returns a compact price table for several symbols.
+    Symbols already quoted in this run or with fresh prices in the quote cache are
+    served from there, the rest are fetched together with a single bulk history request.
+    """
 
+    snapshot = current_snapshot()
+    quotes = {}
+    missing = []
+    for symbol in symbols:
+        cached = snapshot.peek(symbol, TABLE_FIELDS) if snapshot is not None else None
+        if cached is None:
+            cached = quote_cache.get(symbol, TABLE_FIELDS)
+        if cached is not None:
+            quotes[symbol] = cached
+        else:
+            missing.append(symbol)
+
+    unavailable = None
+    if missing:
+        # 5 days so there is always a previous close, even after weekends and holidays
+        fetched = missing
+        try:
+            bars = get_provider().history(missing, period="5d", interval="1d")
+        except Exception as e:  # Network trouble, or nothing recorded for a replay run
+            fetched, unavailable = [], f"{type(e).__name__}: {e}"
+
+        for symbol in fetched:
+            try:
+                close = bars["Close"][symbol].dropna()
+                if close.empty:
+                    continue
+
+                last_day = close.index[-1]
+                price = float(close.iloc[-1])
+                previous = float(close.iloc[-2]) if len(close) > 1 else price
+                quote = {
+                    "regularMarketPrice": price,
+                    "regularMarketChange": price - previous,
+                    "regularMarketChangePercent": (price - previous) / previous * 100 if previous else 0.0,
+                    "regularMarketPreviousClose": previous,
+                    "dayHigh": float(bars["High"][symbol][last_day]),
+                    "dayLow": float(bars["Low"][symbol][last_day]),
+                    "regularMarketVolume": int(bars["Volume"][symbol][last_day]),
+                }
+            except (KeyError, IndexError, ValueError):
+                continue
+
+            quote_cache.put(symbol, quote)
+            if snapshot is not None:
+                snapshot.put(symbol, quote)
+            quotes[symbol] = quote
+
+    result = ToolResult("MarketPulse", f"Quotes for {len(symbols)} symbols",
+                        ["Symbol", "Price", "Change", "Change%", "High", "Low", "Volume"], humanize=["Volume"])
+    if unavailable:
+        result.note(f"Unavailable: {', '.join(missing)} ({unavailable})")
+    for symbol in symbols:
+        quote = quotes.get(symbol)
+        if not quote or quote.get("regularMarketPrice") is None:
+            result.add(symbol, None, None, None, None, None, None)
+            continue
+
+        # Prices go out unrounded: format_number keeps the significant digits of sub-dollar quotes
+        result.add(symbol, quote["regularMarketPrice"], _round(quote["regularMarketChange"]),
+                   _round(quote["regularMarketChangePercent"]), quote["dayHigh"],
+                   quote["dayLow"], quote["regularMarketVolume"])
+
+    return render(result)
+
+
+def _round(value):
+    return round(value, 2) if isinstance(value, (int, float)) else None
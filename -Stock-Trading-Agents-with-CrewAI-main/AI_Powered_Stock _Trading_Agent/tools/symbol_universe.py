@@ -0,0 +1,287 @@
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from typing import Dict, Iterable, List, Optional, Set
+
+import requests
+
+from tools.market_data import get_quote
+from tools.rate_limiter import background_priority, fetch_all, limiter_for
+
+# Nasdaq Trader symbol directory: every security listed on Nasdaq, NYSE, NYSE American, NYSE Arca and Cboe
+LISTING_URLS = {
+    "nasdaq": "https://www.nasdaqtrader.com/dynamic/SymDir/nasdaqlisted.txt",
+    "other": "https://www.nasdaqtrader.com/dynamic/SymDir/otherlisted.txt",
+}
+
+OTHER_EXCHANGES = {"A": "NYSE American", "N": "NYSE", "P": "NYSE Arca", "Z": "Cboe BZX", "V": "IEX"}
+
+PROFILE_FIELDS = ("regularMarketPrice", "marketCap", "sector", "industry")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS symbols (
+    symbol TEXT PRIMARY KEY,
+    name TEXT,
+    exchange TEXT,
+    is_etf INTEGER DEFAULT 0,
+    sector TEXT,
+    industry TEXT,
+    price REAL,
+    market_cap REAL,
+    listed_at REAL,
+    enriched_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_symbols_sector_price ON symbols (sector COLLATE NOCASE, price);
+CREATE INDEX IF NOT EXISTS idx_symbols_price ON symbols (price);
+CREATE INDEX IF NOT EXISTS idx_symbols_enriched ON symbols (enriched_at);
+CREATE INDEX IF NOT EXISTS idx_symbols_listed ON symbols (listed_at);
+"""
+
+
+class SymbolUniverse:
+    """
+    Persistent SQLite table of listed tickers with exchange, sector, industry
+    and last-known price and market cap.
+
+    Listings come from the Nasdaq Trader symbol directory; sector, industry,
+    price and market cap are filled in from the market data provider a batch
+    at a time, oldest first. Scanners and ticker validation query the indexes
+    instead of calling the network.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._known: Optional[Set[str]] = None
+        self._known_listed_at: Optional[float] = None
+        self._refresher: Optional[threading.Thread] = None
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    # Lookups
+
+    def count(self) -> int:
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT COUNT(*) FROM symbols").fetchone()[0]
+
+    def known_symbols(self) -> Set[str]:
+        """
+        Every listed symbol, kept in memory until the listings are refreshed,
+        by this process or another one (the prefetch daemon).
+        """
+        with closing(self._connect()) as conn:
+            listed_at = conn.execute("SELECT MAX(listed_at) FROM symbols").fetchone()[0]
+            if self._known is None or listed_at != self._known_listed_at:
+                self._known = {row[0] for row in conn.execute("SELECT symbol FROM symbols")}
+                self._known_listed_at = listed_at
+        return self._known
+
+    def is_listed(self, symbol: str) -> bool:
+        return symbol.upper() in self.known_symbols()
+
+    def symbols_in_sector(self, sector: str, max_price: Optional[float] = None,
+                          limit: int = 500) -> List[str]:
+        query = "SELECT symbol FROM symbols WHERE sector = ? COLLATE NOCASE AND is_etf = 0"
+        params: list = [sector]
+        if max_price is not None:
+            query += " AND price <= ?"
+            params.append(max_price)
+        query += " ORDER BY market_cap DESC LIMIT ?"
+        params.append(limit)
+
+        with closing(self._connect()) as conn:
+            return [row[0] for row in conn.execute(query, params)]
+
+    def low_price_symbols(self, max_price: float, min_market_cap: float = 0,
+                          limit: int = 2000) -> List[str]:
+        """Stocks whose last-known price is at or under max_price, largest first."""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT symbol FROM symbols WHERE price > 0 AND price <= ? AND market_cap >= ? AND is_etf = 0 "
+                "ORDER BY market_cap DESC LIMIT ?",
+                (max_price, min_market_cap, limit),
+            )
+            return [row[0] for row in rows]
+
+    def last_prices(self, symbols: Iterable[str]) -> Dict[str, tuple]:
+        """{symbol: (price, market_cap)} for the given symbols that have a last-known price."""
+        symbols = [symbol.upper() for symbol in symbols]
+        prices = {}
+        with closing(self._connect()) as conn:
+            for start in range(0, len(symbols), 500):  # Stay under SQLite's bound parameter limit
+                chunk = symbols[start:start + 500]
+                rows = conn.execute(
+                    f"SELECT symbol, price, market_cap FROM symbols WHERE price IS NOT NULL "
+                    f"AND symbol IN ({','.join('?' * len(chunk))})", chunk)
+                prices.update((symbol, (price, market_cap)) for symbol, price, market_cap in rows)
+        return prices
+
+    # Refresh
+
+    def refresh_listings(self) -> int:
+        """Downloads the symbol directory and upserts every listed security. Returns the count."""
+        now = time.time()
+        rows = []
+        for source, url in LISTING_URLS.items():
+            limiter_for(url).acquire()
+            response = requests.get(url, timeout=30)
+            response.raise_for_status()
+            rows.extend(parse_listing(source, response.text, now))
+
+        with self._lock, closing(self._connect()) as conn:
+            with conn:
+                conn.executemany(
+                    "INSERT INTO symbols (symbol, name, exchange, is_etf, listed_at) VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT(symbol) DO UPDATE SET name = excluded.name, exchange = excluded.exchange, "
+                    "is_etf = excluded.is_etf, listed_at = excluded.listed_at",
+                    rows,
+                )
+                # Anything missing from today's directory has been delisted
+                conn.execute("DELETE FROM symbols WHERE listed_at < ?", (now,))
+            self._known = None
+
+        return len(rows)
+
+    def enrich(self, symbols: Optional[Iterable[str]] = None, batch_size: int = 200,
+               max_age: float = 7 * 86400) -> int:
+        """
+        Fills in sector, industry, price and market cap for the given symbols,
+        or for the batch_size symbols with the oldest data. Returns how many were updated.
+        Runs as background work: quotes go through the background pool and give way
+        to tool calls waiting on the same rate limit.
+        """
+        if symbols is None:
+            with closing(self._connect()) as conn:
+                symbols = [row[0] for row in conn.execute(
+                    "SELECT symbol FROM symbols WHERE is_etf = 0 AND (enriched_at IS NULL OR enriched_at < ?) "
+                    "ORDER BY enriched_at IS NOT NULL, enriched_at LIMIT ?",
+                    (time.time() - max_age, batch_size),
+                )]
+
+        updates = []
+        for symbol, info in fetch_all(lambda symbol: get_quote(symbol, PROFILE_FIELDS), symbols,
+                                        background=True).items():
+            if isinstance(info, Exception):
+                continue
+            updates.append((info.get("sector"), info.get("industry"), info.get("regularMarketPrice"),
+                            info.get("marketCap"), time.time(), symbol.upper()))
+
+        self.record_profiles(updates)
+        return len(updates)
+
+    def record_profiles(self, updates: List[tuple]) -> None:
+        """Writes (sector, industry, price, market_cap, enriched_at, symbol) rows."""
+        if not updates:
+            return
+        with self._lock, closing(self._connect()) as conn:
+            with conn:
+                conn.executemany(
+                    "UPDATE symbols SET sector = COALESCE(?, sector), industry = COALESCE(?, industry), "
+                    "price = ?, market_cap = ?, enriched_at = ? WHERE symbol = ?",
+                    updates,
+                )
+
+    def refresh(self, batch_size: int = 200, listings_max_age: float = 86400) -> int:
+        """
+        Reloads the listings once they are older than listings_max_age, then
+        enriches batch_size stale symbols, all at background priority. Returns how many were enriched.
+        """
+        with background_priority():
+            if self.listings_age() > listings_max_age:
+                self.refresh_listings()
+            return self.enrich(batch_size=batch_size)
+
+    def refresh_in_background(self, interval: float = 3600, batch_size: int = 200,
+                              listings_max_age: float = 86400) -> threading.Thread:
+        """Starts a daemon thread that calls refresh() every interval seconds."""
+        if self._refresher is not None and self._refresher.is_alive():
+            return self._refresher
+
+        def loop():
+            while True:
+                try:
+                    self.refresh(batch_size=batch_size, listings_max_age=listings_max_age)
+                except Exception:
+                    pass  # Network trouble; try again next cycle
+                time.sleep(interval)
+
+        self._refresher = threading.Thread(target=loop, name="symbol-universe-refresh", daemon=True)
+        self._refresher.start()
+        return self._refresher
+
+    def listings_age(self) -> float:
+        with closing(self._connect()) as conn:
+            latest = conn.execute("SELECT MAX(listed_at) FROM symbols").fetchone()[0]
+        return time.time() - latest if latest else float("inf")
+
+
+def parse_listing(source: str, text: str, listed_at: float) -> List[tuple]:
+    """Parses a pipe-separated symbol directory file into (symbol, name, exchange, is_etf, listed_at) rows."""
+    lines = text.strip().splitlines()
+    header = lines[0].split("|")
+    rows = []
+
+    for line in lines[1:]:
+        if line.startswith("File Creation Time"):
+            continue
+        record = dict(zip(header, line.split("|")))
+        if record.get("Test Issue") == "Y":
+            continue
+
+        if source == "nasdaq":
+            symbol = record.get("Symbol", "")
+            exchange = "NASDAQ"
+        else:
+            symbol = record.get("ACT Symbol", "")
+            exchange = OTHER_EXCHANGES.get(record.get("Exchange", ""), record.get("Exchange", ""))
+
+        # Preferreds and other odd classes; Yahoo writes share classes as BRK-B
+        if not symbol or "$" in symbol:
+            continue
+        symbol = symbol.replace(".", "-")
+
+        rows.append((symbol, record.get("Security Name", ""), exchange,
+                     1 if record.get("ETF") == "Y" else 0, listed_at))
+
+    return rows
+
+
+_universe = None
+_universe_lock = threading.Lock()
+
+
+def get_symbol_universe() -> SymbolUniverse:
+    """
+    Process-wide symbol universe at SYMBOL_UNIVERSE_DB. Only reads the index:
+    the prefetch daemon keeps it fresh. With SYMBOL_UNIVERSE_BACKGROUND 'true'
+    the process starts its own background refresher on first use instead.
+    An empty index gets its listings loaded once on first use, so ticker
+    extraction works without the daemon; enrichment is left to the refresher.
+    """
+    global _universe
+
+    with _universe_lock:
+        if _universe is None:
+            _universe = SymbolUniverse(os.getenv('SYMBOL_UNIVERSE_DB', os.path.join('data', 'universe.sqlite')))
+            if _universe.count() == 0:
+                try:
+                    _universe.refresh_listings()  # Two directory downloads
+                except Exception:
+                    pass  # Offline; the daemon or the next process fills it in
+            if os.getenv('SYMBOL_UNIVERSE_BACKGROUND', 'false').lower() == 'true':
+                _universe.refresh_in_background(
+                    interval=float(os.getenv('SYMBOL_UNIVERSE_REFRESH_INTERVAL', '3600')),
+                    batch_size=int(os.getenv('SYMBOL_UNIVERSE_ENRICH_BATCH', '200')),
+                )
+        return _universe
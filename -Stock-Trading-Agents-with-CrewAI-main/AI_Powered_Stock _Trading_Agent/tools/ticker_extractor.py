@@ -0,0 +1,92 @@
+import re
+import threading
+from typing import AbstractSet, Iterable, List, Optional
+
+from tools.symbol_universe import get_symbol_universe
+
+# $TSLA, or a bare TSLA standing alone between spaces, brackets or punctuation.
+# Share classes come through as BRK.B / BRK-B.
+TICKER_PATTERN = re.compile(
+    r"\$([A-Z]{1,5}(?:[.-][A-Z])?)\b"
+    r"|(?<![\w$&.-])([A-Z]{1,5}(?:[.-][A-Z])?)(?![\w&'-])"
+)
+
+# Uppercase words that show up in financial headlines and are not worth a lookup.
+# Some are real tickers (AI, IT, ALL, NOW), which is fine: a cashtag still gets through.
+STOPWORDS = frozenset("""
+A I AN AND ARE AS AT BE BUT BY FOR FROM HAS HE HER HIS IF IN IS IT ITS ME MY NO NOT OF OFF ON OR OUR OUT SO
+THE TO UP US WE WHO WHY YOU ALL ANY BIG CAN DAY GET GOT HOW NEW NOW OLD ONE TOP TWO WAY YES YET
+CEO CFO CTO COO CIO CMO EVP SVP VP CHAIR BOARD
+IPO SPAC ETF ETFS ETN REIT EPS PE PEG ROI ROE EBIT EBITDA FCF YOY QOQ YTD MTD TTM ATH ATL
+AI ML AR VR EV EVS IOT API SAAS CPU GPU LLM TV PC IT HR PR RD
+US USA UK EU UAE UN IMF WHO WTO NATO OPEC G7 G20 BRICS
+FED FOMC ECB BOE BOJ PBOC SEC FDA FTC DOJ IRS FCC EPA DOE DOD CFTC FINRA FDIC OCC CBO
+GDP CPI PPI PCE PMI ISM NFP JOLTS
+NYSE NASDAQ AMEX OTC OTCQB OTCQX OTCBB TSX LSE ASX HKEX DOW SPX NDX VIX
+USD EUR GBP JPY CNY CAD AUD CHF HKD INR BTC ETH
+INC CORP CO LTD LLC PLC AG SA NV SE LP LLP GMBH
+AM PM ET EST EDT PT PST PDT GMT UTC
+JAN FEB MAR APR MAY JUN JUL AUG SEP SEPT OCT NOV DEC
+MON TUE WED THU FRI SAT SUN
+Q FY H OK LOL IMO IMHO FOMO YOLO DD TA FA ATM OTM ITM
+BUY SELL HOLD LONG SHORT CALL CALLS PUT PUTS
+NEWS LIVE WATCH UPDATE UPDATED BREAKING ALERT REPORT EXCLUSIVE VIDEO PHOTOS
+""".split())
+
+
+class TickerExtractor:
+    """
+    Pulls ticker symbols out of headlines and posts without touching the network.
+
+    Cashtags ($TSLA) are trusted as tickers; bare uppercase words must also miss
+    the stopword list. Either way a candidate must be in the known symbol set,
+    so only real listed tickers reach the quote lookups. Until there is a known
+    set (ready is False) bare words can't be validated and only cashtags count.
+    """
+
+    def __init__(self, known: Optional[AbstractSet[str]] = None, stopwords: AbstractSet[str] = STOPWORDS):
+        self.known = known if known is not None else frozenset()
+        self.stopwords = stopwords
+
+    @property
+    def ready(self) -> bool:
+        return bool(self.known)
+
+    def extract(self, text: str, cashtags_only: bool = False) -> List[str]:
+        """Distinct symbols mentioned in text, in order of first mention."""
+        symbols = []
+        for cashtag, bare in TICKER_PATTERN.findall(text):
+            if cashtag:
+                symbol = cashtag
+            elif cashtags_only or bare in self.stopwords or not self.known:
+                continue
+            else:
+                symbol = bare
+
+            symbol = symbol.replace(".", "-")  # Yahoo writes share classes as BRK-B
+            if self.known and symbol not in self.known:
+                continue
+            if symbol not in symbols:
+                symbols.append(symbol)
+        return symbols
+
+    def extract_all(self, texts: Iterable[str], cashtags_only: bool = False) -> List[List[str]]:
+        return [self.extract(text, cashtags_only) for text in texts]
+
+
+_extractor = None
+_extractor_lock = threading.Lock()
+
+
+def get_ticker_extractor() -> TickerExtractor:
+    """
+    Extractor validating against the symbol universe's listed tickers. It is
+    rebuilt only when the universe reloads its listings.
+    """
+    global _extractor
+    known = get_symbol_universe().known_symbols()
+
+    with _extractor_lock:
+        if _extractor is None or _extractor.known is not known:
+            _extractor = TickerExtractor(known)
+        return _extractor
@@ -0,0 +1,193 @@
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+# Loaded on the first count: tiktoken's import and encoding download are too slow for startup
+_encoding = None
+_encoding_loaded = False
+_encoding_lock = threading.Lock()
+
+
+class ToolResult:
+    """
+    Typed result of a tool call: a title, named columns, one row per record and
+    free-text notes. Tools fill one in and render() turns it into the string the
+    LLM sees, in the format and token budget configured for the run.
+
+    Numbers are printed in full (to 2 decimals) so prices keep their cents;
+    only the columns named in humanize (counts and sizes such as volume) are
+    shortened to 12.3M style.
+    """
+
+    def __init__(self, tool: str, title: str, columns: List[str], notes: Optional[List[str]] = None,
+                 humanize: Iterable[str] = ()):
+        self.tool = tool
+        self.title = title
+        self.columns = columns
+        self.humanize = frozenset(humanize)
+        self.rows: List[List[Any]] = []
+        self.notes = list(notes or [])
+
+    def add(self, *values: Any) -> None:
+        self.rows.append(list(values))
+
+    def note(self, text: str) -> None:
+        self.notes.append(text)
+
+
+def render(result: ToolResult, fmt: Optional[str] = None, token_budget: Optional[int] = None) -> str:
+    """
+    Renders a ToolResult as 'tsv', 'json' or 'text' (TOOL_OUTPUT_FORMAT by default).
+    Rows are dropped from the end until the output fits token_budget
+    (TOOL_OUTPUT_TOKEN_BUDGET by default, 0 = unlimited). The token count of the
+    final output is recorded for the tool.
+    """
+    fmt = (fmt or os.getenv('TOOL_OUTPUT_FORMAT', 'tsv')).lower()
+    if token_budget is None:
+        token_budget = int(os.getenv('TOOL_OUTPUT_TOKEN_BUDGET', '0'))
+
+    renderer = RENDERERS.get(fmt, render_tsv)
+    rows = result.rows
+    output = renderer(result, rows, [])
+    tokens = count_tokens(output)
+
+    if token_budget and tokens > token_budget:
+        # Binary search for the largest number of rows that still fits
+        low, high = 0, len(rows)
+        while low < high:
+            middle = (low + high + 1) // 2
+            candidate = renderer(result, rows[:middle], [_truncation_note(len(rows) - middle)])
+            if count_tokens(candidate) <= token_budget:
+                low = middle
+            else:
+                high = middle - 1
+        output = renderer(result, rows[:low], [_truncation_note(len(rows) - low)])
+        tokens = count_tokens(output)
+
+    record_tokens(result.tool, tokens)
+    return output
+
+
+def render_tsv(result: ToolResult, rows: List[List[Any]], extra_notes: List[str]) -> str:
+    lines = [f"# {result.title}"]
+    if rows:
+        lines.append("\t".join(result.columns))
+        humanized = [column in result.humanize for column in result.columns]
+        lines.extend("\t".join(_cell(value, human) for value, human in zip(row, humanized)) for row in rows)
+    lines.extend(f"# {note}" for note in result.notes + extra_notes)
+    return "\n".join(lines) + "\n"
+
+
+def render_json(result: ToolResult, rows: List[List[Any]], extra_notes: List[str]) -> str:
+    payload: Dict[str, Any] = {"title": result.title, "columns": result.columns, "rows": rows}
+    notes = result.notes + extra_notes
+    if notes:
+        payload["notes"] = notes
+    return json.dumps(payload, separators=(",", ":"), default=str, ensure_ascii=False) + "\n"
+
+
+def render_text(result: ToolResult, rows: List[List[Any]], extra_notes: List[str]) -> str:
+    lines = [result.title, ""]
+    for i, row in enumerate(rows):
+        fields = ", ".join(f"{column}: {_cell(value, column in result.humanize)}"
+                           for column, value in zip(result.columns[1:], row[1:]))
+        lines.append(f"{i+1}. {_cell(row[0])} - {fields}")
+    if rows:
+        lines.append("")
+    lines.extend(result.notes + extra_notes)
+    return "\n".join(lines).rstrip() + "\n"
+
+
+RENDERERS = {"tsv": render_tsv, "json": render_json, "text": render_text}
+
+
+def _cell(value: Any, human: bool = False) -> str:
+    if value is None or (isinstance(value, float) and value != value):
+        return "-"
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return human_number(value) if human else format_number(value)
+    if isinstance(value, (list, tuple)):
+        return " | ".join(_cell(item, human) for item in value)
+    return str(value).replace("\t", " ").replace("\n", " ")
+
+
+def format_number(value: float) -> str:
+    """227.52 -> '227.52', 3412.0 -> '3412', 0.03456 -> '0.03456'; small ratios keep 4 significant digits"""
+    if float(value).is_integer():
+        return str(int(value))
+    if abs(value) >= 1:
+        return repr(round(float(value), 2))
+    return f"{value:.4g}"
+
+
+def _truncation_note(dropped: int) -> str:
+    return f"{dropped} more rows omitted to fit the token budget"
+
+
+def human_number(value: float) -> str:
+    """12345678 -> '12.3M'"""
+    for divisor, suffix in ((1e12, "T"), (1e9, "B"), (1e6, "M"), (1e3, "K")):
+        if abs(value) >= divisor:
+            return f"{value / divisor:.1f}{suffix}"
+    return f"{value:.0f}"
+
+
+def shorten(text: str, limit: int = 80) -> str:
+    return text if len(text) <= limit else text[:limit - 1] + "…"
+
+
+def count_tokens(text: str) -> int:
+    encoding = _get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text))
+    return max(1, len(text) // 4)
+
+
+def _get_encoding():
+    global _encoding, _encoding_loaded
+    if not _encoding_loaded:
+        with _encoding_lock:
+            if not _encoding_loaded:
+                try:
+                    import tiktoken
+                    _encoding = tiktoken.get_encoding("cl100k_base")
+                except Exception:  # tiktoken is optional, fall back to the ~4 characters per token rule of thumb
+                    _encoding = None
+                _encoding_loaded = True
+    return _encoding
+
+
+_stats: Dict[str, Dict[str, int]] = {}
+_stats_lock = threading.Lock()
+
+
+def record_tokens(tool: str, tokens: int) -> None:
+    """Adds one call to the per-tool token totals and appends it to TOOL_OUTPUT_TOKEN_LOG, if set."""
+    with _stats_lock:
+        stats = _stats.setdefault(tool, {"calls": 0, "tokens": 0, "last": 0})
+        stats["calls"] += 1
+        stats["tokens"] += tokens
+        stats["last"] = tokens
+
+        log_path = os.getenv('TOOL_OUTPUT_TOKEN_LOG', '')
+        if log_path:
+            directory = os.path.dirname(log_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(log_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"time": time.time(), "tool": tool, "tokens": tokens}) + "\n")
+
+
+def token_stats() -> Dict[str, Dict[str, int]]:
+    with _stats_lock:
+        return {tool: dict(stats) for tool, stats in _stats.items()}
+
+
+def token_summary() -> str:
+    stats = token_stats()
+    if not stats:
+        return "Tool output tokens: no tool calls"
+    parts = [f"{tool} {s['tokens']} tokens / {s['calls']} calls" for tool, s in sorted(stats.items())]
+    return "Tool output tokens: " + ", ".join(parts)
@@ -0,0 +1,156 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+import requests
+
+from tools.rate_limiter import limiter_for
+
+# Searched as one OR query rather than one request per keyword
+PENNY_STOCK_KEYWORDS = [
+    'penny stocks', 'penny stock', 'pennystocks', 'small cap stocks',
+    'under $5', 'cheap stocks', 'low price stocks'
+]
+
+
+def build_query(keywords: List[str]) -> str:
+    """'penny stocks', 'pennystocks' -> '("penny stocks" OR pennystocks)'"""
+    terms = [f'"{keyword}"' if " " in keyword or "$" in keyword else keyword for keyword in keywords]
+    return "(" + " OR ".join(terms) + ")"
+
+
+class TwitterPoller:
+    """
+    Incremental search over the Twitter API v2 recent search endpoint.
+
+    All keywords go out as one OR query. Results are read page by page through
+    next_token, and the newest tweet id is kept as a since_id checkpoint, so a
+    repeat poll only downloads tweets posted since the last one. Tweets from
+    the last window seconds are kept in the state file and returned with the
+    new ones. One HTTP session is reused for every request. base_url can point
+    at a local fake endpoint to run offline.
+    """
+
+    def __init__(self, bearer_token: str, state_path: str, base_url: str = "https://api.twitter.com",
+                 max_pages: int = 5, window: float = 86400):
+        self.base_url = base_url.rstrip("/")
+        self.state_path = state_path
+        self.max_pages = max_pages
+        self.window = window
+        self.session = requests.Session()
+        self.session.headers.update({"Authorization": f"Bearer {bearer_token}"})
+        self._lock = threading.Lock()
+        self._state = self._load_state()
+
+    def poll(self, query: str) -> List[Dict[str, Any]]:
+        """Fetches tweets newer than the checkpoint and returns every tweet still inside the window."""
+        with self._lock:
+            state = self._state.setdefault(query, {"since_id": None, "tweets": []})
+            new_tweets = list(self.iter_tweets(query, state.get("since_id")))
+
+            if new_tweets:
+                state["since_id"] = max((tweet["id"] for tweet in new_tweets), key=int)
+
+            cutoff = time.time() - self.window
+            known_ids = {tweet["id"] for tweet in new_tweets}
+            tweets = new_tweets + [tweet for tweet in state["tweets"] if tweet["id"] not in known_ids]
+            state["tweets"] = [tweet for tweet in tweets if tweet.get("fetched_at", 0) >= cutoff]
+
+            self._save_state()
+            return list(state["tweets"])
+
+    def iter_tweets(self, query: str, since_id: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Yields tweets page by page, newest first, stopping at since_id or after max_pages."""
+        params = {
+            "query": query,
+            "max_results": 100,
+            "tweet.fields": "created_at,public_metrics,lang",
+        }
+        if since_id:
+            params["since_id"] = since_id
+
+        for _ in range(self.max_pages):
+            payload = self._search(params)
+            fetched_at = time.time()
+            for tweet in payload.get("data", []):
+                tweet["fetched_at"] = fetched_at
+                yield tweet
+
+            next_token = payload.get("meta", {}).get("next_token")
+            if not next_token:
+                break
+            params["next_token"] = next_token
+
+    def _search(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        url = self.base_url + "/2/tweets/search/recent"
+        limiter_for(url).acquire()
+        response = self.session.get(url, params=params, timeout=15)
+
+        if response.status_code == 400 and "since_id" in params:
+            # The checkpoint fell out of the 7-day search window; start over without it
+            params.pop("since_id")
+            limiter_for(url).acquire()
+            response = self.session.get(url, params=params, timeout=15)
+
+        response.raise_for_status()
+        return response.json()
+
+    def _load_state(self) -> Dict[str, Any]:
+        try:
+            with open(self.state_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_state(self) -> None:
+        directory = os.path.dirname(self.state_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # A unique temp file, so concurrent savers (threads or processes) never share one
+        fd, temp_path = tempfile.mkstemp(dir=directory or ".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self._state, f)
+            os.replace(temp_path, self.state_path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+
+def tweet_time(tweet: Dict[str, Any]) -> float:
+    """Posting time of a tweet as a Unix timestamp, falling back to when it was fetched."""
+    created_at = tweet.get("created_at")
+    if created_at:
+        try:
+            return datetime.fromisoformat(created_at.replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            pass
+    return tweet.get("fetched_at", time.time())
+
+
+_poller = None
+_poller_lock = threading.Lock()
+
+
+def get_twitter_poller() -> Optional[TwitterPoller]:
+    """Process-wide poller, or None when TWITTER_BEARER_TOKEN is not set."""
+    global _poller
+
+    bearer_token = os.getenv('TWITTER_BEARER_TOKEN')
+    if not bearer_token:
+        return None
+
+    with _poller_lock:
+        if _poller is None:
+            _poller = TwitterPoller(
+                bearer_token,
+                os.getenv('TWITTER_STATE_PATH', os.path.join('data', 'twitter_state.json')),
+                base_url=os.getenv('TWITTER_API_BASE_URL', 'https://api.twitter.com'),
+                max_pages=int(os.getenv('TWITTER_MAX_PAGES', '5')),
+                window=float(os.getenv('TWITTER_TWEET_WINDOW', '86400')),
+            )
+        return _poller
@@ -0,0 +1,158 @@
+"""
+Batch mode for the analyst -> trader crew: every symbol of a watchlist is
+analysed at the same time instead of one kickoff after another.
+
+    python watchlist_main.py                      # DEFAULT_WATCHLIST
+    python watchlist_main.py NIO,SNDL,TLRY --workers 3 --timeout 120
+
+Each symbol runs on its own copy of the stock crew (crew.copy()), so tasks
+and agent state are never shared between kickoffs, on a pool of at most
+--workers threads. Results are printed as they complete, followed by a
+per-symbol and total wall time report. The whole batch shares one run
+snapshot, the quote cache and the LLM client pool.
+"""
+import argparse
+import os
+import re
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional
+
+from dotenv import load_dotenv
+import config  # Import config to set NVIDIA API environment variables
+
+from agents.llm_cache import get_llm_cache
+from registry import crews
+from tools.quote_cache import quote_cache
+from tools.run_snapshot import run_snapshot
+from tools.tool_output import token_summary
+
+load_dotenv()
+
+DECISION_PATTERN = re.compile(r"Decision:\s*\**\s*(Buy|Sell|Hold)", re.I)
+
+
+def analyse(symbol: str, verbose: bool = False) -> Any:
+    crew = crews['stock'].copy()
+    if not verbose:
+        # Concurrent step-by-step logs interleave into noise; results are printed as they complete
+        crew.verbose = False
+        for agent in crew.agents:
+            agent.verbose = False
+    return crew.kickoff(inputs={"stock": symbol})
+
+
+def run_watchlist(symbols: List[str], max_workers: int = 4, timeout: Optional[float] = 300,
+                  verbose: bool = False) -> Dict[str, Dict[str, Any]]:
+    """
+    Runs the stock crew for every symbol on up to max_workers threads and
+    returns {symbol: {status, seconds, result, decision}} in completion order.
+    status is 'ok', 'error' or 'timeout'. A symbol is timed out once it has
+    been running for timeout seconds; its thread cannot be interrupted, so it
+    finishes in the background (the process waits for it before exiting) and
+    its result is discarded.
+    """
+    started: Dict[str, float] = {}
+    finished: Dict[str, float] = {}
+    times_lock = threading.Lock()
+
+    def job(symbol: str) -> Any:
+        with times_lock:
+            started[symbol] = time.time()
+        try:
+            return analyse(symbol, verbose=verbose)
+        finally:
+            with times_lock:
+                finished[symbol] = time.time()
+
+    results: Dict[str, Dict[str, Any]] = {}
+
+    def record(symbol: str, status: str, result: Any = None) -> None:
+        with times_lock:
+            end = finished.get(symbol, time.time())
+            seconds = end - started.get(symbol, end)
+        decision = DECISION_PATTERN.search(str(result)) if status == "ok" else None
+        results[symbol] = {
+            "status": status,
+            "seconds": seconds,
+            "result": result,
+            "decision": decision.group(1).title() if decision else None,
+        }
+        label = decision.group(1).title() if decision else status.upper()
+        print(f"\n{'=' * 60}\n{symbol}: {label} ({seconds:.1f}s)\n{'=' * 60}")
+        if status == "ok":
+            print(result)
+        elif result is not None:
+            print(f"❌ {result}")
+
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="watchlist")
+    with run_snapshot():  # Every symbol's tools share one fetch per symbol
+        pending = {executor.submit(job, symbol): symbol for symbol in symbols}
+        try:
+            while pending:
+                # Wake up for the next completion or the earliest deadline, whichever comes first
+                wait_for = 1.0
+                if timeout is not None:
+                    with times_lock:
+                        deadlines = [started[symbol] + timeout for symbol in pending.values() if symbol in started]
+                    if deadlines:
+                        wait_for = min(wait_for, max(0.05, min(deadlines) - time.time()))
+                done, _ = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+                for future in done:
+                    symbol = pending.pop(future)
+                    error = future.exception()
+                    if error is not None:
+                        record(symbol, "error", f"{type(error).__name__}: {error}")
+                    else:
+                        record(symbol, "ok", future.result())
+
+                if timeout is not None:
+                    now = time.time()
+                    with times_lock:
+                        expired = [future for future, symbol in pending.items()
+                                   if symbol in started and now - started[symbol] >= timeout]
+                    for future in expired:
+                        record(pending.pop(future), "timeout", f"no result after {timeout:g}s")
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    return results
+
+
+def report(results: Dict[str, Dict[str, Any]], wall: float) -> str:
+    lines = ["", "Watchlist batch", "-" * 44, f"{'Symbol':<8}{'Status':<10}{'Decision':<10}{'Seconds':>8}"]
+    for symbol, row in sorted(results.items(), key=lambda item: item[1]["seconds"], reverse=True):
+        lines.append(f"{symbol:<8}{row['status']:<10}{row['decision'] or '-':<10}{row['seconds']:>8.1f}")
+
+    serial = sum(row["seconds"] for row in results.values())
+    slowest = max((row["seconds"] for row in results.values()), default=0.0)
+    lines.append("-" * 44)
+    lines.append(f"Total wall time {wall:.1f}s, slowest symbol {slowest:.1f}s, "
+                 f"{serial:.1f}s of crew time ({serial / wall if wall else 0:.1f}x)")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the analyst -> trader crew over a watchlist concurrently")
+    parser.add_argument("symbols", nargs="?", default=config.DEFAULT_WATCHLIST, help="comma-separated symbols")
+    parser.add_argument("--workers", type=int, default=int(os.getenv('WATCHLIST_BATCH_WORKERS', '8')),
+                        help="symbols analysed at the same time")
+    parser.add_argument("--timeout", type=float, default=float(os.getenv('WATCHLIST_BATCH_TIMEOUT', '300')),
+                        help="seconds before a symbol is given up on (0 = no limit)")
+    parser.add_argument("--verbose", action="store_true", help="show every agent step (interleaved)")
+    args = parser.parse_args()
+
+    symbols = list(dict.fromkeys(symbol.strip().upper() for symbol in args.symbols.split(",") if symbol.strip()))
+    print(f"🚀 Analysing {len(symbols)} symbols, {min(args.workers, len(symbols))} at a time: {', '.join(symbols)}")
+
+    started = time.time()
+    results = run_watchlist(symbols, max_workers=args.workers, timeout=args.timeout or None, verbose=args.verbose)
+    print(report(results, time.time() - started))
+    print(quote_cache.summary())
+    print(token_summary())
+    print(get_llm_cache().summary())
+
+
+if __name__ == "__main__":
+    main()